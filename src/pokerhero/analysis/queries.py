@@ -3,7 +3,9 @@
 Each function executes a SQL query against an open SQLite connection and
 returns the result as a pandas DataFrame. These are the only functions
 that touch the database; stat calculations live in stats.py and operate
-purely on the returned DataFrames.
+purely on the returned DataFrames. The CSV export is the exception:
+``get_export_cursor`` hands back a raw cursor so rows can be written out
+without being materialised in a DataFrame first.
 """
 
 import sqlite3
@@ -394,7 +396,25 @@ def get_hero_opportunity_actions(
     return pd.read_sql_query(sql, conn, params=params)
 
 
-def get_export_data(conn: sqlite3.Connection, player_id: int) -> pd.DataFrame:
+_EXPORT_SQL = """
+    SELECT
+        s.id            AS session_id,
+        s.start_time    AS date,
+        s.small_blind || '/' || s.big_blind AS stakes,
+        h.id            AS hand_id,
+        hp.position,
+        hp.hole_cards,
+        hp.net_result
+    FROM players p
+    JOIN hand_players hp ON hp.player_id = p.id
+    JOIN hands h         ON h.id = hp.hand_id
+    JOIN sessions s      ON s.id = h.session_id
+    WHERE p.username = ?
+    ORDER BY h.timestamp ASC
+"""
+
+
+def get_export_data(conn: sqlite3.Connection, hero_username: str) -> pd.DataFrame:
     """Return sessions and per-hand results joined for CSV export.
 
     Columns: session_id, date, stakes, hand_id, position, hole_cards,
@@ -402,27 +422,37 @@ def get_export_data(conn: sqlite3.Connection, player_id: int) -> pd.DataFrame:
 
     Args:
         conn: Open SQLite connection.
-        player_id: Internal integer id of the hero player row.
+        hero_username: Hero's screen name; resolved to the player row inside
+            the query, so no separate id lookup is needed.
 
     Returns:
         DataFrame with one row per hand, ordered by timestamp ascending.
+        Empty when the username is unknown.
     """
-    sql = """
-        SELECT
-            s.id            AS session_id,
-            s.start_time    AS date,
-            s.small_blind || '/' || s.big_blind AS stakes,
-            h.id            AS hand_id,
-            hp.position,
-            hp.hole_cards,
-            hp.net_result
-        FROM hand_players hp
-        JOIN hands h    ON h.id = hp.hand_id
-        JOIN sessions s ON s.id = h.session_id
-        WHERE hp.player_id = ?
-        ORDER BY h.timestamp ASC
+    return pd.read_sql_query(_EXPORT_SQL, conn, params=(hero_username,))
+
+
+def get_export_cursor(
+    conn: sqlite3.Connection, hero_username: str
+) -> tuple[sqlite3.Cursor, list[str]]:
+    """Run the CSV export query and return its cursor plus column names.
+
+    Same rows and columns as ``get_export_data``, but the cursor yields plain
+    tuples lazily so the caller can stream them into ``csv.writer`` without
+    building a DataFrame.
+
+    Args:
+        conn: Open SQLite connection.
+        hero_username: Hero's screen name.
+
+    Returns:
+        ``(cursor, header)`` — the executed cursor and its column names.
     """
-    return pd.read_sql_query(sql, conn, params=(int(player_id),))
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(_EXPORT_SQL, (hero_username,))
+    header = [col[0] for col in cursor.description]
+    return cursor, header
 
 
 def get_session_kpis(
@@ -599,6 +599,23 @@ def _board_at_street(
     return ""
 
 
+def _boards_by_street(
+    board_flop: str | None,
+    board_turn: str | None,
+    board_river: str | None,
+) -> dict[str, str]:
+    """Return the board visible at each street, keyed by street name.
+
+    The board of a hand is fixed, so callers iterating over many actions of
+    the same hand build this map once and look streets up instead of calling
+    ``_board_at_street`` per action.
+    """
+    return {
+        street: _board_at_street(board_flop, board_turn, board_river, street)
+        for street in ("PREFLOP", "FLOP", "TURN", "RIVER")
+    }
+
+
 def _build_villain_street_history(
     conn: sqlite3.Connection,
     hand_id: int,
@@ -776,18 +793,44 @@ def calculate_session_evs(
 
         now = datetime.now(UTC).isoformat()
         rows: list[dict[str, object]] = []
+        # Rows arrive ordered by hand_id, so per-hand data is rebuilt only
+        # when the hand changes.
+        current_hand_id: int | None = None
+        board_by_street: dict[str, str] = {}
+        # player_id → (hole_cards, sequence of their fold or None)
+        villain_hole_cards: dict[int, tuple[str, int | None]] = {}
 
         for _, ar in hero_actions.iterrows():
             action_id = int(ar["action_id"])
             hand_id = int(ar["hand_id"])
             street = str(ar["street"])
             hero_cards = str(ar["hero_cards"])
-            board = _board_at_street(
-                ar.get("board_flop"),
-                ar.get("board_turn"),
-                ar.get("board_river"),
-                street,
-            )
+            if hand_id != current_hand_id:
+                current_hand_id = hand_id
+                board_by_street = _boards_by_street(
+                    ar.get("board_flop"),
+                    ar.get("board_turn"),
+                    ar.get("board_river"),
+                )
+                villain_hole_cards = {
+                    int(r[0]): (str(r[1]), None if r[2] is None else int(r[2]))
+                    for r in conn.execute(
+                        """
+                        SELECT hp.player_id, hp.hole_cards,
+                               (SELECT MIN(a.sequence) FROM actions a
+                                WHERE a.hand_id = hp.hand_id
+                                  AND a.player_id = hp.player_id
+                                  AND a.action_type = 'FOLD')
+                        FROM hand_players hp
+                        WHERE hp.hand_id = ?
+                          AND hp.player_id != ?
+                          AND hp.hole_cards IS NOT NULL
+                          AND hp.hole_cards != ''
+                        """,
+                        (hand_id, hero_id),
+                    ).fetchall()
+                }
+            board = board_by_street.get(street, "")
             amount_to_call = float(ar["amount_to_call"])
             amount = float(ar["amount"])
             pot_before = float(ar["pot_before"])
@@ -797,35 +840,17 @@ def calculate_session_evs(
             wager = amount_to_call if action_type in ("CALL", "FOLD") else amount
             pot_to_win = pot_before + wager
 
-            villain_id = identify_primary_villain(
-                conn, hand_id, hero_id, int(ar["sequence"]), street
-            )
+            seq = int(ar["sequence"])
+            villain_id = identify_primary_villain(conn, hand_id, hero_id, seq, street)
             if villain_id is None:
                 continue
 
-            # Gather all active non-hero villains with known hole cards
-            all_villain_cards_rows = conn.execute(
-                """
-                SELECT hp.player_id, hp.hole_cards
-                FROM hand_players hp
-                WHERE hp.hand_id = :hid
-                  AND hp.player_id != :hero
-                  AND hp.hole_cards IS NOT NULL
-                  AND hp.hole_cards != ''
-                  AND hp.player_id NOT IN (
-                      SELECT a.player_id FROM actions a
-                      WHERE a.hand_id = :hid
-                        AND a.action_type = 'FOLD'
-                        AND a.sequence < :seq
-                  )
-                """,
-                {
-                    "hid": hand_id,
-                    "hero": hero_id,
-                    "seq": int(ar["sequence"]),
-                },
-            ).fetchall()
-            known_villain_cards = {int(r[0]): str(r[1]) for r in all_villain_cards_rows}
+            # All non-hero villains with known hole cards still active here
+            known_villain_cards = {
+                pid: cards
+                for pid, (cards, fold_seq) in villain_hole_cards.items()
+                if fold_seq is None or fold_seq >= seq
+            }
 
             # ── Track 2: All-In Exact EV (variance tracking) ─────────────────
             # Only for all-in actions where villain cards are known.
@@ -842,7 +867,7 @@ def calculate_session_evs(
                     WHERE hand_id = ? AND player_id != ? AND street = ?
                       AND action_type = 'CALL' AND sequence > ?
                     """,
-                    (hand_id, hero_id, street, int(ar["sequence"])),
+                    (hand_id, hero_id, street, seq),
                 ).fetchone()
                 allin_pot_to_win = (
                     pot_to_win + float(villain_calls_row[0])
@@ -961,7 +986,7 @@ def calculate_session_evs(
                     {
                         "hid": hand_id,
                         "hero": hero_id,
-                        "seq": int(ar["sequence"]),
+                        "seq": seq,
                     },
                 ).fetchone()[0]
                 range_ev_type = "range_multiway_approx" if active_count > 1 else "range"
@@ -21,6 +21,8 @@ to ``utg`` and ``mp`` at lookup time.
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Iterable
 from sqlite3 import Connection
 from typing import Literal
 
@@ -134,25 +136,37 @@ def canonical_position(position: str) -> str:
     return _POSITION_ALIAS.get(position.lower(), position.lower())
 
 
+_CREATE_TARGET_SETTINGS_SQL = """
+    CREATE TABLE IF NOT EXISTS target_settings (
+        stat       TEXT NOT NULL,
+        position   TEXT NOT NULL,
+        green_min  REAL NOT NULL,
+        green_max  REAL NOT NULL,
+        yellow_min REAL NOT NULL,
+        yellow_max REAL NOT NULL,
+        PRIMARY KEY (stat, position)
+    )
+"""
+
+_SELECT_TARGET_SETTINGS_SQL = (
+    "SELECT stat, position, green_min, green_max, yellow_min, yellow_max "
+    "FROM target_settings"
+)
+
+_UPSERT_TARGET_SETTINGS_SQL = (
+    "INSERT OR REPLACE INTO target_settings "
+    "(stat, position, green_min, green_max, yellow_min, yellow_max) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
 def ensure_target_settings_table(conn: Connection) -> None:
     """Create the ``target_settings`` table if it does not exist and seed defaults.
 
     Safe to call on every connection — uses ``CREATE TABLE IF NOT EXISTS`` and
     ``INSERT OR IGNORE`` so existing customisations are never overwritten.
     """
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS target_settings (
-            stat       TEXT NOT NULL,
-            position   TEXT NOT NULL,
-            green_min  REAL NOT NULL,
-            green_max  REAL NOT NULL,
-            yellow_min REAL NOT NULL,
-            yellow_max REAL NOT NULL,
-            PRIMARY KEY (stat, position)
-        )
-        """
-    )
+    conn.execute(_CREATE_TARGET_SETTINGS_SQL)
     seed_target_defaults(conn)
 
 
@@ -188,8 +202,9 @@ def read_target_settings(conn: Connection) -> dict[tuple[str, str], TargetBounds
     """Load all target bounds from ``target_settings``, falling back to defaults.
 
     Rows present in the DB override the corresponding ``TARGET_DEFAULTS``
-    entry.  Rows absent from the DB use the default value.  The table is
-    created automatically if it does not exist yet.
+    entry.  Rows absent from the DB use the default value.  All rows come
+    from a single ``SELECT``; the table is only created (and seeded) when it
+    does not exist yet, so a normal read never writes.
 
     Args:
         conn: Open SQLite connection (may be an in-memory database).
@@ -197,21 +212,42 @@ def read_target_settings(conn: Connection) -> dict[tuple[str, str], TargetBounds
     Returns:
         Mapping of ``(stat, position)`` → :class:`TargetBounds`.
     """
-    ensure_target_settings_table(conn)
+    try:
+        cursor = conn.execute(_SELECT_TARGET_SETTINGS_SQL)
+    except sqlite3.OperationalError as exc:
+        if "no such table" not in str(exc):
+            raise
+        ensure_target_settings_table(conn)
+        cursor = conn.execute(_SELECT_TARGET_SETTINGS_SQL)
 
     result: dict[tuple[str, str], TargetBounds] = dict(TARGET_DEFAULTS)
+    result.update(
+        {
+            (stat, pos): TargetBounds(
+                green_min=gmin,
+                green_max=gmax,
+                yellow_min=ymin,
+                yellow_max=ymax,
+            )
+            for stat, pos, gmin, gmax, ymin, ymax in cursor
+        }
+    )
+    return result
 
-    rows = conn.execute(
-        "SELECT stat, position, green_min, green_max, yellow_min, yellow_max "
-        "FROM target_settings"
-    ).fetchall()
 
-    for stat, pos, gmin, gmax, ymin, ymax in rows:
-        result[(stat, pos)] = TargetBounds(
-            green_min=gmin,
-            green_max=gmax,
-            yellow_min=ymin,
-            yellow_max=ymax,
-        )
+def write_target_settings(
+    conn: Connection,
+    rows: Iterable[tuple[str, str, float, float, float, float]],
+) -> None:
+    """Upsert ``(stat, position, green_min, green_max, yellow_min, yellow_max)`` rows.
 
-    return result
+    All rows are written with one ``executemany`` in the caller's
+    transaction; the caller commits.
+
+    Args:
+        conn: Open SQLite connection.
+        rows: Bound rows to store, replacing any existing row for the same
+            ``(stat, position)``.
+    """
+    conn.execute(_CREATE_TARGET_SETTINGS_SQL)
+    conn.executemany(_UPSERT_TARGET_SETTINGS_SQL, rows)
@@ -1,5 +1,6 @@
 import logging
 import sqlite3
+from collections.abc import Iterable
 from decimal import Decimal
 from pathlib import Path
 
@@ -15,12 +16,40 @@ _SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 logger = logging.getLogger(__name__)
 
 
-def get_connection(db_path: str | Path) -> sqlite3.Connection:
+# Per-connection tuning for file databases. synchronous=NORMAL is safe in WAL
+# mode (a crash can lose the last commits but never corrupts the file) and
+# turns each commit into a WAL append instead of a journal + database fsync.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
+def get_connection(
+    db_path: str | Path, check_same_thread: bool = True
+) -> sqlite3.Connection:
     """Return a sqlite3 connection with foreign keys enabled
-    and row_factory set to sqlite3.Row."""
-    conn = sqlite3.connect(db_path)
+    and row_factory set to sqlite3.Row.
+
+    File databases are switched to WAL journal mode and every connection gets
+    the ``_CONNECTION_PRAGMAS`` tuning; ``:memory:`` databases are left as
+    they are. WAL is requested on every connect (a no-op when the file is
+    already in WAL mode) so a database deleted and recreated at the same
+    path does not fall back to rollback journaling.
+
+    Pass ``check_same_thread=False`` for a connection that is cached and
+    shared across Dash callback threads; the caller must then serialise
+    access to it.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    if str(db_path) != ":memory:":
+        conn.execute("PRAGMA journal_mode = WAL")
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
     return conn
 
 
@@ -104,6 +133,32 @@ def upsert_player(conn: sqlite3.Connection, username: str) -> int:
     return int(row[0])
 
 
+def get_player_id(conn: sqlite3.Connection, username: str) -> int | None:
+    """Return the id of *username*'s player row, or None if there is none.
+
+    A plain SELECT, so unlike :func:`upsert_player` it never needs the write
+    lock and works while another connection holds ``BEGIN IMMEDIATE``.
+    """
+    row = conn.execute(
+        "SELECT id FROM players WHERE username = ?", (username,)
+    ).fetchone()
+    return None if row is None else int(row[0])
+
+
+def player_exists(conn: sqlite3.Connection, username: str) -> bool:
+    """Return True when a player row exists for *username*.
+
+    Cheaper than fetching the id when only existence matters: SQLite stops
+    at the first match and nothing is materialised in Python.
+    """
+    return (
+        conn.execute(
+            "SELECT 1 FROM players WHERE username = ? LIMIT 1", (username,)
+        ).fetchone()
+        is not None
+    )
+
+
 def insert_session(
     conn: sqlite3.Connection,
     session: SessionData,
@@ -154,6 +209,36 @@ def get_setting(conn: sqlite3.Connection, key: str, default: str = "") -> str:
     return row[0] if row is not None else default
 
 
+def get_settings(conn: sqlite3.Connection, keys: Iterable[str]) -> dict[str, str]:
+    """Return the stored values for several settings keys in one query.
+
+    Args:
+        conn: An open SQLite connection.
+        keys: The settings keys to look up.
+
+    Returns:
+        Dict mapping each key that exists in the settings table to its
+        stored value. Missing keys are absent; callers apply their own
+        defaults.
+    """
+    key_list = list(keys)
+    if not key_list:
+        return {}
+    placeholders = ", ".join("?" * len(key_list))
+    rows = conn.execute(
+        f"SELECT key, value FROM settings WHERE key IN ({placeholders})", key_list
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+# One SQL text for every settings upsert: sqlite3 caches prepared statements
+# per connection keyed by the exact string, so repeated saves skip re-parsing.
+_UPSERT_SETTING_SQL = (
+    "INSERT INTO settings (key, value) VALUES (?, ?)"
+    " ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+)
+
+
 def set_setting(conn: sqlite3.Connection, key: str, value: str) -> None:
     """Persist a key/value pair in the settings table (upsert).
 
@@ -162,11 +247,17 @@ def set_setting(conn: sqlite3.Connection, key: str, value: str) -> None:
         key: The settings key.
         value: The value to store.
     """
-    conn.execute(
-        "INSERT INTO settings (key, value) VALUES (?, ?)"
-        " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        (key, value),
-    )
+    conn.execute(_UPSERT_SETTING_SQL, (key, value))
+
+
+def set_settings(conn: sqlite3.Connection, items: Iterable[tuple[str, str]]) -> None:
+    """Persist several key/value pairs with one prepared upsert statement.
+
+    Args:
+        conn: An open SQLite connection.
+        items: ``(key, value)`` pairs to store.
+    """
+    conn.executemany(_UPSERT_SETTING_SQL, items)
 
 
 #: Default values for the 8 range-EV analysis settings.
@@ -192,8 +283,9 @@ def get_range_settings(conn: sqlite3.Connection) -> dict[str, float]:
     Returns:
         Dict mapping each range setting key to its configured float value.
     """
+    stored = get_settings(conn, RANGE_SETTING_DEFAULTS)
     return {
-        key: float(get_setting(conn, key, default=str(default)))
+        key: float(stored.get(key, default))
         for key, default in RANGE_SETTING_DEFAULTS.items()
     }
 
@@ -0,0 +1,77 @@
+"""Process-wide SQLite connection pool for Dash callbacks.
+
+Dash runs callbacks on worker threads and fires them in bursts (a page load
+can trigger dozens at once), so opening a fresh connection per callback spends
+most of its time in ``sqlite3.connect`` and PRAGMA setup. ``acquire`` hands
+out an idle connection for the given database file instead, opening one only
+when none is free, and returns it to the pool afterwards.
+
+A connection is checked out by exactly one callback at a time, which is what
+makes ``check_same_thread=False`` safe here.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import sqlite3
+import threading
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+from pokerhero.database.db import get_connection
+
+# Idle connections kept per database file; extras are closed on release.
+_MAX_IDLE = 8
+
+_POOLS: dict[str, deque[sqlite3.Connection]] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def acquire(db_path: str | Path) -> Iterator[sqlite3.Connection]:
+    """Check out a pooled connection to *db_path* for the ``with`` block.
+
+    Any transaction still open when the block exits (normally or via an
+    exception) is rolled back, so the next borrower always starts clean;
+    callers commit their own writes.
+
+    Args:
+        db_path: Path to a SQLite database file. ``:memory:`` is rejected
+            because every in-memory connection is a separate database.
+
+    Raises:
+        ValueError: If *db_path* is ``:memory:``.
+    """
+    key = str(db_path)
+    if key == ":memory:":
+        raise ValueError("in-memory databases cannot be pooled")
+    with _POOLS_LOCK:
+        idle = _POOLS.setdefault(key, deque())
+        conn = idle.pop() if idle else None
+    if conn is None:
+        conn = get_connection(db_path, check_same_thread=False)
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        with _POOLS_LOCK:
+            idle = _POOLS.setdefault(key, deque())
+            pooled = len(idle) < _MAX_IDLE
+            if pooled:
+                idle.append(conn)
+        if not pooled:
+            conn.close()
+
+
+@atexit.register
+def close_all() -> None:
+    """Close every idle pooled connection."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for idle in pools:
+        while idle:
+            idle.pop().close()
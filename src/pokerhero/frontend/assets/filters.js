@@ -0,0 +1,62 @@
+// Client-side filter callbacks for the Sessions page.
+//
+// applyHandFilters mirrors _filter_hands_data in pages/sessions.py. It runs
+// in the browser against hand-data-store (built by _build_hand_filter_store),
+// whose entries pair the filter fields with the pre-rendered hand-table row,
+// so changing a hand filter never makes a server round trip. Keep the two
+// implementations in sync: TestHandFilterStore runs both over the same inputs
+// (via node) and fails if they disagree.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    filters: {
+        applyHandFilters: function (
+            pnlMin, pnlMax, positions, flags, favFilter, evFilter, data
+        ) {
+            if (!data || data.length === 0) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            const isSet = (v) => v !== null && v !== undefined && v !== "";
+            const isOne = (v) => Number(v) === 1;
+            const flagCol = {
+                bad_call: "has_bad_call",
+                good_call: "has_good_call",
+                bad_fold: "has_bad_fold",
+            };
+            flags = flags || [];
+            const sawFlopOnly = flags.includes("saw_flop");
+            const showdownOnly = flags.includes("showdown");
+            const favoritesOnly = (favFilter || []).includes("favorites");
+            const evCols = (evFilter || [])
+                .map((key) => flagCol[key])
+                .filter((col) => col !== undefined && col in data[0]);
+
+            return data
+                .filter(function (r) {
+                    const pnl = r.net_result;
+                    if (isSet(pnlMin) && !(isSet(pnl) && Number(pnl) >= Number(pnlMin))) {
+                        return false;
+                    }
+                    if (isSet(pnlMax) && !(isSet(pnl) && Number(pnl) <= Number(pnlMax))) {
+                        return false;
+                    }
+                    if (positions && positions.length > 0
+                            && !positions.includes(r.position)) {
+                        return false;
+                    }
+                    if (sawFlopOnly && !isOne(r.saw_flop)) {
+                        return false;
+                    }
+                    if (showdownOnly && !isOne(r.went_to_showdown)) {
+                        return false;
+                    }
+                    if (favoritesOnly && "is_favorite" in r && !isOne(r.is_favorite)) {
+                        return false;
+                    }
+                    if (evCols.length > 0 && !evCols.some((col) => isOne(r[col]))) {
+                        return false;
+                    }
+                    return true;
+                })
+                .map((r) => r.row);
+        },
+    },
+});
@@ -11,7 +11,12 @@ from pokerhero.analysis.targets import (
     read_target_settings,
     traffic_light,
 )
-from pokerhero.database.db import get_connection, get_setting, upsert_player
+from pokerhero.database.db import (
+    get_connection,
+    get_player_id,
+    get_setting,
+    upsert_player,
+)
 
 dash.register_page(__name__, path="/dashboard", name="Overall Stats")  # type: ignore[no-untyped-call]
 
@@ -135,12 +140,23 @@ def _get_db_path() -> str:
 
 
 def _get_hero_player_id(db_path: str) -> int | None:
+    """Return the hero's player id, inserting the row only if it is missing.
+
+    The SELECT comes first because the upsert needs the write lock even when
+    it inserts nothing, and an upload holds that lock for a whole file.
+    """
     if db_path == ":memory:":
         return None
     conn = get_connection(db_path)
     try:
         username = get_setting(conn, "hero_username", default="")
-        return upsert_player(conn, username) if username else None
+        if not username:
+            return None
+        player_id = get_player_id(conn, username)
+        if player_id is None:
+            player_id = upsert_player(conn, username)
+            conn.commit()
+        return player_id
     finally:
         conn.close()
 
@@ -2,19 +2,40 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import contextlib
+import functools
 import math
+import os
+import re
 import sqlite3
-from collections.abc import Hashable
+import threading
+from collections.abc import Hashable, Iterator
 from typing import Any, NotRequired, TypedDict
 from urllib.parse import parse_qs, urlparse
 
 import dash
 import pandas as pd
-from dash import Input, Output, State, callback, dash_table, dcc, html
+from dash import (
+    ClientsideFunction,
+    Input,
+    Output,
+    State,
+    callback,
+    dash_table,
+    dcc,
+    html,
+)
 from dash.development.base_component import Component
 
-from pokerhero.database.db import get_connection, get_setting, upsert_player
+from pokerhero.database import pool
+from pokerhero.database.db import (
+    get_player_id,
+    get_setting,
+    get_settings,
+    init_db,
+    upsert_player,
+)
 
 dash.register_page(__name__, path="/sessions", name="Review Sessions")  # type: ignore[no-untyped-call]
 
@@ -52,6 +73,12 @@ _TD = {
     "fontSize": "13px",
     "cursor": "pointer",
 }
+# EV cell styles indexed by the sign of the EV (-1, 0, +1); 0 also covers
+# actions without a cached EV.
+_EV_TD_STYLES: dict[int, dict[str, str]] = {
+    sign: {**_TD, "fontSize": "12px", "color": color}
+    for sign, color in ((-1, "red"), (0, "#bbb"), (1, "green"))
+}
 _STREET_COLOURS = {
     "PREFLOP": "#6c757d",
     "FLOP": "#0074D9",
@@ -87,6 +114,10 @@ def _action_row_style(is_hero: bool) -> dict[str, str]:
     return {}
 
 
+# Indexed by is_hero: (villain row style, hero row style).
+_ROW_STYLES = (_action_row_style(False), _action_row_style(True))
+
+
 def _render_card(card: str) -> html.Span:
     """Render a single PokerStars card code as a styled card element.
 
@@ -670,15 +701,151 @@ def _get_db_path() -> str:
     return result
 
 
+@contextlib.contextmanager
+def _open_conn(db_path: str) -> Iterator[sqlite3.Connection]:
+    """Yield a DB connection appropriate for db_path.
+
+    File databases borrow a pooled connection for the duration of the
+    callback; ``:memory:`` gets a freshly initialised database that is closed
+    afterwards.
+    """
+    if db_path != ":memory:":
+        with pool.acquire(db_path) as conn:
+            yield conn
+        return
+    conn = init_db(":memory:")
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
 def _get_hero_player_id(db_path: str) -> int | None:
     if db_path == ":memory:":
         return None
-    conn = get_connection(db_path)
-    try:
+    player_id = _get_hero_player_id_cached(db_path, _db_version(db_path))
+    if player_id is None:
+        player_id = _create_hero_player(db_path)
+    return player_id
+
+
+@functools.lru_cache(maxsize=8)
+def _get_hero_player_id_cached(db_path: str, version: tuple[int, ...]) -> int | None:
+    """Look up the hero's player id, cached per database version.
+
+    Read-only: returns None when no hero username is set or the hero has no
+    player row yet. See ``_db_version`` — any write to the database (e.g. a
+    new hero username) changes *version* and forces a fresh lookup.
+    """
+    with _open_conn(db_path) as conn:
         username = get_setting(conn, "hero_username", default="")
-        return upsert_player(conn, username) if username else None
-    finally:
-        conn.close()
+        return get_player_id(conn, username) if username else None
+
+
+def _create_hero_player(db_path: str) -> int | None:
+    """Insert the hero's player row if a username is set; return its id.
+
+    Only reached when the cached lookup found no row (before the first
+    upload, or after Clear Database), so the write lock is not taken on the
+    usual read path.
+    """
+    with _open_conn(db_path) as conn:
+        username = get_setting(conn, "hero_username", default="")
+        if not username:
+            return None
+        player_id = upsert_player(conn, username)
+        conn.commit()
+        return player_id
+
+
+# Connections that only ever read ``PRAGMA data_version``, keyed by
+# (db_path, pid) since a SQLite handle must not cross a fork. A connection's
+# data_version changes whenever *another* connection commits, so a probe that
+# never writes sees every commit, from this process or any other.
+_VERSION_PROBES: dict[tuple[str, int], sqlite3.Connection] = {}
+_VERSION_PROBES_LOCK = threading.Lock()
+
+
+def _data_version(db_path: str) -> int:
+    """Return ``PRAGMA data_version`` from the probe connection for *db_path*.
+
+    Returns 0 when the file cannot be read as a database; the probe is then
+    dropped so the next call retries.
+    """
+    key = (db_path, os.getpid())
+    with _VERSION_PROBES_LOCK:
+        probe = _VERSION_PROBES.get(key)
+        if probe is None:
+            probe = sqlite3.connect(db_path, check_same_thread=False)
+            _VERSION_PROBES[key] = probe
+        try:
+            return int(probe.execute("PRAGMA data_version").fetchone()[0])
+        except sqlite3.Error:
+            del _VERSION_PROBES[key]
+            probe.close()
+            return 0
+
+
+@atexit.register
+def _close_version_probes() -> None:
+    with _VERSION_PROBES_LOCK:
+        for probe in _VERSION_PROBES.values():
+            probe.close()
+        _VERSION_PROBES.clear()
+
+
+def _db_version(db_path: str) -> tuple[int, ...]:
+    """Return a token that changes whenever the database file is written.
+
+    Combines the modification time and size of the database file and of its
+    WAL sidecar (when present) with ``PRAGMA data_version``. The file stats
+    alone can miss a commit that lands within the filesystem's timestamp
+    granularity without changing any size (a WAL frame rewritten in place);
+    data_version is bumped by every commit. Used as a cache key component
+    for the query caches below.
+    """
+    version: list[int] = []
+    for path in (db_path, f"{db_path}-wal"):
+        try:
+            st = os.stat(path)
+        except OSError:
+            version += [0, 0]
+        else:
+            version += [st.st_mtime_ns, st.st_size]
+    # Only probe a non-empty file: connecting to a missing one creates it.
+    version.append(_data_version(db_path) if version[1] else 0)
+    return tuple(version)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_sessions_cached(
+    db_path: str, version: tuple[int, ...], player_id: int
+) -> pd.DataFrame:
+    """Return ``get_sessions`` for *player_id*, cached per database version.
+
+    *version* is the ``_db_version`` token; it is only part of the cache key
+    so that any write to the database invalidates earlier results. Callers
+    must not mutate the returned DataFrame — copy it first.
+    """
+    from pokerhero.analysis.queries import get_sessions
+
+    with _open_conn(db_path) as conn:
+        return get_sessions(conn, player_id)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_hands_cached(
+    db_path: str, version: tuple[int, ...], session_id: int, player_id: int
+) -> pd.DataFrame:
+    """Return ``get_hands`` for one session, cached per database version.
+
+    See ``_get_sessions_cached`` for the meaning of *version*. Callers must
+    not mutate the returned DataFrame — copy it first.
+    """
+    from pokerhero.analysis.queries import get_hands
+
+    with _open_conn(db_path) as conn:
+        return get_hands(conn, session_id, player_id)
 
 
 def _ev_status_label(conn: sqlite3.Connection, session_id: int) -> str:
@@ -1024,6 +1191,36 @@ def _navigate_from_hand_table(
     return _compute_state_from_cell(None, cell, None, data, current_state)
 
 
+# Dash serialises pattern-matching ids as compact JSON with sorted keys, e.g.
+# '{"level":"report","session_id":3,"type":"breadcrumb-btn"}.n_clicks'.
+# Pulling the two fields out with regexes avoids a json.loads per click.
+_BREADCRUMB_TYPE = '"type":"breadcrumb-btn"'
+_BREADCRUMB_LEVEL_RE = re.compile(r'"level":\s*"(\w+)"')
+_BREADCRUMB_SESSION_RE = re.compile(r'"session_id":\s*(\d+)')
+
+
+def _parse_breadcrumb_prop_id(prop_id: str) -> _DrillDownState | None:
+    """Map a breadcrumb button's ``prop_id`` to the drill-down state it targets.
+
+    Returns None when *prop_id* is not a breadcrumb button or names an
+    unknown level.
+    """
+    if _BREADCRUMB_TYPE not in prop_id.replace(" ", ""):
+        return None
+    level_match = _BREADCRUMB_LEVEL_RE.search(prop_id)
+    if level_match is None:
+        return None
+    level = level_match.group(1)
+    if level == "sessions":
+        return _DrillDownState(level="sessions")
+    if level in ("report", "hands"):
+        session_match = _BREADCRUMB_SESSION_RE.search(prop_id)
+        if session_match is None:
+            return None
+        return _DrillDownState(level=level, session_id=int(session_match.group(1)))
+    return None
+
+
 @callback(
     Output("drill-down-state", "data"),
     Input(
@@ -1043,25 +1240,10 @@ def _update_state(
     trigger = ctx.triggered[0]
     if not trigger.get("value"):
         raise dash.exceptions.PreventUpdate
-    tid = trigger["prop_id"].split(".")[0]
-    try:
-        parsed = json.loads(tid)
-    except (json.JSONDecodeError, ValueError):
+    new_state = _parse_breadcrumb_prop_id(trigger["prop_id"])
+    if new_state is None:
         raise dash.exceptions.PreventUpdate
-    if parsed.get("type") == "breadcrumb-btn":
-        if parsed["level"] == "sessions":
-            return _DrillDownState(level="sessions")
-        if parsed["level"] == "report":
-            return _DrillDownState(
-                level="report",
-                session_id=int(parsed["session_id"]),
-            )
-        if parsed["level"] == "hands":
-            return _DrillDownState(
-                level="hands",
-                session_id=int(parsed["session_id"]),
-            )
-    raise dash.exceptions.PreventUpdate
+    return new_state
 
 
 # ---------------------------------------------------------------------------
@@ -1334,6 +1516,9 @@ def _filter_hands_data(
 ) -> pd.DataFrame:
     """Filter a hands DataFrame based on user-selected criteria.
 
+    Mirrored in the browser by ``applyHandFilters`` (``assets/filters.js``);
+    ``TestHandFilterStore`` checks that the two agree.
+
     Args:
         df: DataFrame from get_hands (columns: net_result, position,
             saw_flop, went_to_showdown, has_bad_call, has_good_call,
@@ -1384,58 +1569,85 @@ def _filter_hands_data(
 # ---------------------------------------------------------------------------
 # Table builder helpers
 # ---------------------------------------------------------------------------
+_TABLE_CELL_STYLE = {"textAlign": "left", "padding": "8px 12px", "fontSize": "14px"}
+_TABLE_HEADER_STYLE = {
+    "backgroundColor": "#0074D9",
+    "color": "white",
+    "fontWeight": "bold",
+    "padding": "8px 12px",
+    "fontSize": "13px",
+    "textAlign": "left",
+}
+_TABLE_DATA_CONDITIONAL = [
+    {
+        "if": {"filter_query": "{_pnl_raw} >= 0", "column_id": "_pnl_raw"},
+        "color": "#2ecc71",
+        "fontWeight": "600",
+    },
+    {
+        "if": {"filter_query": "{_pnl_raw} < 0", "column_id": "_pnl_raw"},
+        "color": "#e74c3c",
+        "fontWeight": "600",
+    },
+    {"if": {"row_index": "odd"}, "backgroundColor": "var(--bg-2, #f9f9f9)"},
+]
+_SESSION_TABLE_COLUMNS = [
+    {"name": "Date", "id": "date"},
+    {"name": "Stakes", "id": "stakes"},
+    {"name": "Hands", "id": "hands"},
+    {"name": "Net P&L", "id": "_pnl_raw", "type": "numeric"},
+    {"name": "EV Status", "id": "ev_status"},
+]
+_HAND_TABLE_COLUMNS = [
+    {"name": "Hand #", "id": "hand_num"},
+    {"name": "Hole Cards", "id": "hole_cards"},
+    {"name": "Pot", "id": "pot"},
+    {"name": "Net Result", "id": "_pnl_raw", "type": "numeric"},
+]
+_STREET_TABLE_STYLE = {
+    "width": "100%",
+    "borderCollapse": "collapse",
+    "marginBottom": "12px",
+}
+
+
 def _build_session_table(df: pd.DataFrame) -> Any:  # dash_table has no mypy stubs
     """Render a filtered sessions DataFrame as a sortable DataTable."""
-    _col_style = {"textAlign": "left", "padding": "8px 12px", "fontSize": "14px"}
-    rows = []
-    for _, row in df.iterrows():
-        pnl = float(row["net_profit"])
-        rows.append(
-            {
-                "id": int(row["id"]),
-                "date": str(row["start_time"])[:10] if row["start_time"] else "—",
-                "stakes": (
-                    f"{_fmt_blind(row['small_blind'])}/{_fmt_blind(row['big_blind'])}"
-                ),
-                "hands": int(row["hands_played"]),
-                "_pnl_raw": pnl,
-                "ev_status": str(row.get("ev_status", "📊 Calculate")),
-            }
+    ev_statuses = (
+        df["ev_status"].tolist()
+        if "ev_status" in df.columns
+        else ["📊 Calculate"] * len(df)
+    )
+    # Missing or empty start times render as an em-dash.
+    dates = (
+        df["start_time"].astype("string").str.slice(0, 10).fillna("").replace("", "—")
+    )
+    cols = ["id", "small_blind", "big_blind", "hands_played", "net_profit"]
+    rows = [
+        {
+            "id": int(sid),
+            "date": date,
+            "stakes": f"{_fmt_blind(sb)}/{_fmt_blind(bb)}",
+            "hands": int(hands),
+            "_pnl_raw": float(pnl),
+            "ev_status": str(ev_status),
+        }
+        for (sid, sb, bb, hands, pnl), date, ev_status in zip(
+            df[cols].itertuples(index=False, name=None),
+            dates.tolist(),
+            ev_statuses,
+            strict=True,
         )
+    ]
     return dash_table.DataTable(  # type: ignore[attr-defined]
         id="session-table",
-        columns=[
-            {"name": "Date", "id": "date"},
-            {"name": "Stakes", "id": "stakes"},
-            {"name": "Hands", "id": "hands"},
-            {"name": "Net P&L", "id": "_pnl_raw", "type": "numeric"},
-            {"name": "EV Status", "id": "ev_status"},
-        ],
+        columns=_SESSION_TABLE_COLUMNS,
         data=rows,
         sort_action="native",
         style_table={"width": "100%", "overflowX": "auto"},
-        style_header={
-            "backgroundColor": "#0074D9",
-            "color": "white",
-            "fontWeight": "bold",
-            "padding": "8px 12px",
-            "fontSize": "13px",
-            "textAlign": "left",
-        },
-        style_cell=_col_style,
-        style_data_conditional=[
-            {
-                "if": {"filter_query": "{_pnl_raw} >= 0", "column_id": "_pnl_raw"},
-                "color": "#2ecc71",
-                "fontWeight": "600",
-            },
-            {
-                "if": {"filter_query": "{_pnl_raw} < 0", "column_id": "_pnl_raw"},
-                "color": "#e74c3c",
-                "fontWeight": "600",
-            },
-            {"if": {"row_index": "odd"}, "backgroundColor": "var(--bg-2, #f9f9f9)"},
-        ],
+        style_header=_TABLE_HEADER_STYLE,
+        style_cell=_TABLE_CELL_STYLE,
+        style_data_conditional=_TABLE_DATA_CONDITIONAL,
         style_as_list_view=True,
         row_selectable=False,
         cell_selectable=True,
@@ -1445,52 +1657,29 @@ def _build_session_table(df: pd.DataFrame) -> Any:  # dash_table has no mypy stu
 
 def _build_hand_table(df: pd.DataFrame) -> Any:  # dash_table has no mypy stubs
     """Render a filtered hands DataFrame as a sortable DataTable."""
-    _col_style = {"textAlign": "left", "padding": "8px 12px", "fontSize": "14px"}
-    rows = []
-    for _, row in df.iterrows():
-        pnl = float(row["net_result"]) if row["net_result"] is not None else 0.0
-        rows.append(
-            {
-                "id": int(row["id"]),
-                "hand_num": str(row["source_hand_id"]),
-                "hole_cards": _format_cards_text(row["hole_cards"]),
-                "pot": f"{float(row['total_pot']):,.6g}",
-                "_pnl_raw": pnl,
-            }
+    pot_labels = [format(float(p), ",.6g") for p in df["total_pot"].tolist()]
+    cols = ["id", "source_hand_id", "hole_cards", "net_result"]
+    rows = [
+        {
+            "id": int(hid),
+            "hand_num": str(source_id),
+            "hole_cards": _format_cards_text(hole_cards),
+            "pot": pot,
+            "_pnl_raw": float(pnl) if pnl is not None else 0.0,
+        }
+        for (hid, source_id, hole_cards, pnl), pot in zip(
+            df[cols].itertuples(index=False, name=None), pot_labels, strict=True
         )
+    ]
     return dash_table.DataTable(  # type: ignore[attr-defined]
         id="hand-table",
-        columns=[
-            {"name": "Hand #", "id": "hand_num"},
-            {"name": "Hole Cards", "id": "hole_cards"},
-            {"name": "Pot", "id": "pot"},
-            {"name": "Net Result", "id": "_pnl_raw", "type": "numeric"},
-        ],
+        columns=_HAND_TABLE_COLUMNS,
         data=rows,
         sort_action="native",
         style_table={"width": "100%", "overflowX": "auto"},
-        style_header={
-            "backgroundColor": "#0074D9",
-            "color": "white",
-            "fontWeight": "bold",
-            "padding": "8px 12px",
-            "fontSize": "13px",
-            "textAlign": "left",
-        },
-        style_cell=_col_style,
-        style_data_conditional=[
-            {
-                "if": {"filter_query": "{_pnl_raw} >= 0", "column_id": "_pnl_raw"},
-                "color": "#2ecc71",
-                "fontWeight": "600",
-            },
-            {
-                "if": {"filter_query": "{_pnl_raw} < 0", "column_id": "_pnl_raw"},
-                "color": "#e74c3c",
-                "fontWeight": "600",
-            },
-            {"if": {"row_index": "odd"}, "backgroundColor": "var(--bg-2, #f9f9f9)"},
-        ],
+        style_header=_TABLE_HEADER_STYLE,
+        style_cell=_TABLE_CELL_STYLE,
+        style_data_conditional=_TABLE_DATA_CONDITIONAL,
         style_as_list_view=True,
         row_selectable=False,
         cell_selectable=True,
@@ -1498,6 +1687,58 @@ def _build_hand_table(df: pd.DataFrame) -> Any:  # dash_table has no mypy stubs
     )
 
 
+# Columns read by _filter_sessions_data and _build_session_table; the only
+# ones kept in session-data-store.
+_SESSION_STORE_COLUMNS = (
+    "id",
+    "start_time",
+    "small_blind",
+    "big_blind",
+    "hands_played",
+    "net_profit",
+    "is_favorite",
+    "currency",
+    "ev_status",
+)
+
+_HAND_FILTER_COLUMNS = (
+    "net_result",
+    "position",
+    "saw_flop",
+    "went_to_showdown",
+    "is_favorite",
+    "has_bad_call",
+    "has_good_call",
+    "has_bad_fold",
+)
+
+
+def _build_hand_filter_store(
+    df: pd.DataFrame, table_rows: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Build the ``hand-data-store`` payload for client-side filtering.
+
+    Each entry holds the columns read by ``_filter_hands_data`` plus the
+    already-rendered hand-table row under ``"row"``. The browser-side
+    ``filters.applyHandFilters`` callback (``assets/filters.js``) filters
+    these entries and emits the matching rows, so no Python runs per filter
+    change.
+
+    Args:
+        df: DataFrame from get_hands.
+        table_rows: ``_build_hand_table(df).data`` — one row per df row.
+
+    Returns:
+        List of dicts, one per hand, in df order. NaN values become None.
+    """
+    cols = [c for c in _HAND_FILTER_COLUMNS if c in df.columns]
+    records = df[cols].astype(object).where(df[cols].notna(), None).to_dict("records")
+    return [
+        {**record, "row": row}  # type: ignore[dict-item]
+        for record, row in zip(records, table_rows, strict=True)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Level renderers
 # ---------------------------------------------------------------------------
@@ -1522,14 +1763,9 @@ def _read_analysis_settings(db_path: str) -> dict[str, int]:
     """
     if db_path == ":memory:":
         return dict(_DEFAULTS)
-    conn = get_connection(db_path)
-    try:
-        return {
-            key: int(get_setting(conn, key, default=str(default)))
-            for key, default in _DEFAULTS.items()
-        }
-    finally:
-        conn.close()
+    with _open_conn(db_path) as conn:
+        stored = get_settings(conn, _DEFAULTS)
+    return {key: int(stored.get(key, default)) for key, default in _DEFAULTS.items()}
 
 
 def _render_sessions(db_path: str) -> html.Div | str:
@@ -1542,17 +1778,12 @@ def _render_sessions(db_path: str) -> html.Div | str:
             style={"color": "orange"},
         )
 
-    from pokerhero.analysis.queries import get_sessions
-
-    conn = get_connection(db_path)
-    try:
-        df = get_sessions(conn, player_id)
+    df = _get_sessions_cached(db_path, _db_version(db_path), player_id).copy()
+    with _open_conn(db_path) as conn:
         if not df.empty:
             sids = [int(s) for s in df["id"].tolist()]
             labels = _batch_ev_status_labels(conn, sids)
             df["ev_status"] = [labels.get(int(r["id"]), "") for _, r in df.iterrows()]
-    finally:
-        conn.close()
 
     if df.empty:
         return html.Div("No sessions found. Upload a hand history file to get started.")
@@ -1658,21 +1889,23 @@ def _render_sessions(db_path: str) -> html.Div | str:
         [
             filter_bar,
             _build_session_table(df),
-            dcc.Store(id="session-data-store", data=df.to_dict("records")),
+            dcc.Store(
+                id="session-data-store",
+                data=df[[c for c in _SESSION_STORE_COLUMNS if c in df.columns]].to_dict(
+                    "records"
+                ),
+            ),
         ]
     )
 
 
 def _get_session_label(db_path: str, session_id: int) -> str:
     """Return a human-readable session label, e.g. '2026-01-29  100/200'."""
-    conn = get_connection(db_path)
-    try:
+    with _open_conn(db_path) as conn:
         row = conn.execute(
             "SELECT start_time, small_blind, big_blind FROM sessions WHERE id = ?",
             (session_id,),
         ).fetchone()
-    finally:
-        conn.close()
     if not row:
         return f"Session #{session_id}"
     date = str(row[0])[:10] if row[0] else "—"
@@ -2155,16 +2388,13 @@ def _render_session_report(db_path: str, session_id: int) -> tuple[html.Div | st
         get_session_kpis,
     )
 
-    conn = get_connection(db_path)
-    try:
+    with _open_conn(db_path) as conn:
         kpis_df = get_session_kpis(conn, session_id, player_id)
         actions_df = get_session_hero_actions(conn, session_id, player_id)
         ev_df = get_session_allin_evs(conn, session_id, int(player_id))
         ev_count, _ = get_session_ev_status(conn, session_id)
         pos_table = _build_session_position_table(kpis_df, conn)
-        s = _read_analysis_settings(db_path)
-    finally:
-        conn.close()
+    s = _read_analysis_settings(db_path)
 
     lucky_threshold = s["lucky_equity_threshold"] / 100.0
     unlucky_threshold = s["unlucky_equity_threshold"] / 100.0
@@ -2220,17 +2450,14 @@ def _render_hands(
     if player_id is None:
         return "", ""
 
-    from pokerhero.analysis.queries import get_hands, get_session_player_stats
+    from pokerhero.analysis.queries import get_session_player_stats
 
-    conn = get_connection(db_path)
-    try:
-        df = get_hands(conn, session_id, player_id)
+    df = _get_hands_cached(db_path, _db_version(db_path), session_id, player_id).copy()
+    with _open_conn(db_path) as conn:
         fav_row = conn.execute(
             "SELECT is_favorite FROM sessions WHERE id = ?", (session_id,)
         ).fetchone()
         opp_df = get_session_player_stats(conn, session_id, player_id)
-    finally:
-        conn.close()
 
     is_fav: bool = bool(fav_row and fav_row[0])
     session_label = _get_session_label(db_path, session_id)
@@ -2374,6 +2601,7 @@ def _render_hands(
         },
     )
 
+    hand_table = _build_hand_table(df)
     return (
         html.Div(
             [
@@ -2399,8 +2627,11 @@ def _render_hands(
                 ),
                 profiles_panel,
                 filter_bar,
-                _build_hand_table(df),
-                dcc.Store(id="hand-data-store", data=df.to_dict("records")),
+                hand_table,
+                dcc.Store(
+                    id="hand-data-store",
+                    data=_build_hand_filter_store(df, hand_table.data),
+                ),
                 dcc.Store(id="session-fav-id-store", data=session_id),
             ]
         ),
@@ -2459,8 +2690,7 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
     hero_id = _get_hero_player_id(db_path)
     min_hands = _read_analysis_settings(db_path)["min_hands_classification"]
 
-    conn = get_connection(db_path)
-    try:
+    with _open_conn(db_path) as conn:
         df = get_actions(conn, hand_id)
         hand_row = conn.execute(
             "SELECT source_hand_id, board_flop, board_turn, board_river,"
@@ -2525,8 +2755,6 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
                     "vpip_count": int(opp_row["vpip_count"]),
                     "pfr_count": int(opp_row["pfr_count"]),
                 }
-    finally:
-        conn.close()
 
     if df.empty or hand_row is None:
         return html.Div("No actions found for this hand."), ""
@@ -2620,20 +2848,36 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
                         "gap": "8px",
                     },
                 ),
-                html.Table(
-                    rows,
-                    style={
-                        "width": "100%",
-                        "borderCollapse": "collapse",
-                        "marginBottom": "12px",
-                    },
-                ),
+                html.Table(rows, style=_STREET_TABLE_STYLE),
             ]
         )
 
-    for row_idx, action in df.iterrows():
+    # street/action_type are low-cardinality NOT NULL labels: convert them to
+    # categoricals once so street changes are detected on integer codes.
+    # position stays object dtype — it is NULL for players missing from
+    # hand_players (LEFT JOIN) and the loop relies on None being falsy.
+    df = df.astype({"street": "category", "action_type": "category"})
+    street_codes = df["street"].cat.codes.tolist()
+    current_code = -1
+
+    # Pre-format the numeric labels once for the whole hand instead of
+    # running the format machinery per cell inside the loop.
+    amount_labels = [
+        "  " + format(a, ",.6g") if a > 0 else ""
+        for a in df["amount"].astype(float).tolist()
+    ]
+    pot_labels = [
+        "Pot: " + format(p, ",.6g") for p in df["pot_before"].astype(float).tolist()
+    ]
+    # is_hero/is_all_in are NOT NULL 0/1 columns: take them as plain bool
+    # lists once rather than coercing a pandas scalar on every row.
+    hero_mask = df["is_hero"].to_numpy(dtype=bool).tolist()
+    allin_mask = df["is_all_in"].to_numpy(dtype=bool).tolist()
+
+    for i, (_, action) in enumerate(df.iterrows()):
         street = str(action["street"])
-        if street != current_street:
+        if street_codes[i] != current_code:
+            current_code = street_codes[i]
             if current_street is not None:
                 sections.append(_flush(current_street, street_rows))
             current_street = street
@@ -2642,13 +2886,14 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
         username = str(action["username"])
         position = str(action["position"]) if action["position"] else ""
         actor_str = f"{username} ({position})" if position else username
-        if action["is_hero"]:
+        is_hero = hero_mask[i]
+        if is_hero:
             actor_str = f"🦸 {actor_str}"
 
         # Show archetype badge on the villain's very first action in this hand.
         actor_badge: list[Component] = []
         if (
-            not action["is_hero"]
+            not is_hero
             and opp_stats_map
             and username in opp_stats_map
             and username not in seen_villains
@@ -2681,14 +2926,11 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
             seen_villains.add(username)
 
         action_type = str(action["action_type"])
-        amount = float(action["amount"])
         pot_before = float(action["pot_before"])
         amount_to_call = float(action["amount_to_call"])
 
-        label = action_type
-        if amount > 0:
-            label += f"  {amount:,.6g}"
-        if action["is_all_in"]:
+        label = action_type + amount_labels[i]
+        if allin_mask[i]:
             label += "  🚨 ALL-IN"
 
         raw_spr = action["spr"]
@@ -2706,18 +2948,18 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
         extra = _format_math_cell(
             spr=spr_val,
             mdf=mdf_val,
-            is_hero=bool(action["is_hero"]),
+            is_hero=is_hero,
             amount_to_call=amount_to_call,
             pot_before=pot_before,
         )
 
         # EV cell from action_ev_cache (loaded once before the loop)
-        ev_cache_row = ev_cache.get(int(action["id"])) if action["is_hero"] else None
+        ev_cache_row = ev_cache.get(int(action["id"])) if is_hero else None
         ev_cell_content = _build_ev_cell(ev_cache_row, action_type)
-        ev_color = "#bbb"
+        ev_sign = 0
         if ev_cache_row is not None:
             _ev_val = float(ev_cache_row["ev"])  # type: ignore[arg-type]
-            ev_color = "green" if _ev_val > 0 else ("red" if _ev_val < 0 else "#bbb")
+            ev_sign = (_ev_val > 0) - (_ev_val < 0)
 
         street_rows.append(
             html.Tr(
@@ -2728,7 +2970,7 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
                     ),
                     html.Td(label, style=_TD),
                     html.Td(
-                        f"Pot: {pot_before:,.6g}",
+                        pot_labels[i],
                         style={
                             **_TD,
                             "color": "var(--text-4, #888)",
@@ -2743,16 +2985,9 @@ def _render_actions(db_path: str, hand_id: int) -> tuple[html.Div | str, str]:
                             "fontSize": "12px",
                         },
                     ),
-                    html.Td(
-                        ev_cell_content,
-                        style={
-                            **_TD,
-                            "fontSize": "12px",
-                            "color": ev_color,
-                        },
-                    ),
+                    html.Td(ev_cell_content, style=_EV_TD_STYLES[ev_sign]),
                 ],
-                style=_action_row_style(bool(action["is_hero"])),
+                style=_ROW_STYLES[is_hero],
             )
         )
 
@@ -2855,7 +3090,11 @@ def _apply_session_filters(
 ) -> list[dict[str, Any]]:
     if not data:
         raise dash.exceptions.PreventUpdate
-    df = pd.DataFrame(data)
+    # Column-wise construction of just the columns the filter and table read
+    # avoids pandas' slower record-by-record DataFrame constructor.
+    df = pd.DataFrame(
+        {c: [r[c] for r in data] for c in _SESSION_STORE_COLUMNS if c in data[0]}
+    )
     currency_type = None if (currency is None or currency == "all") else currency
     filtered = _filter_sessions_data(
         df,
@@ -2871,7 +3110,10 @@ def _apply_session_filters(
     return list(_build_session_table(filtered).data)
 
 
-@callback(
+# Hand filters run in the browser (assets/filters.js) against the
+# pre-rendered rows in hand-data-store; see _build_hand_filter_store.
+dash.clientside_callback(
+    ClientsideFunction(namespace="filters", function_name="applyHandFilters"),
     Output("hand-table", "data"),
     Input("hand-filter-pnl-min", "value"),
     Input("hand-filter-pnl-max", "value"),
@@ -2882,30 +3124,6 @@ def _apply_session_filters(
     State("hand-data-store", "data"),
     prevent_initial_call=True,
 )
-def _apply_hand_filters(
-    pnl_min: float | None,
-    pnl_max: float | None,
-    positions: list[str] | None,
-    flags: list[str] | None,
-    fav_filter: list[str] | None,
-    ev_filter: list[str] | None,
-    data: list[dict[str, Any]] | None,
-) -> list[dict[str, Any]]:
-    if not data:
-        raise dash.exceptions.PreventUpdate
-    df = pd.DataFrame(data)
-    flags = flags or []
-    filtered = _filter_hands_data(
-        df,
-        pnl_min,
-        pnl_max,
-        positions or None,
-        "saw_flop" in flags,
-        "showdown" in flags,
-        favorites_only="favorites" in (fav_filter or []),
-        ev_filter=ev_filter or None,
-    )
-    return list(_build_hand_table(filtered).data)
 
 
 @callback(
@@ -2953,15 +3171,12 @@ def _toggle_session_fav(
     from pokerhero.database.db import toggle_session_favorite
 
     db_path = _get_db_path()
-    conn = get_connection(db_path)
-    try:
+    with _open_conn(db_path) as conn:
         toggle_session_favorite(conn, int(session_id))
         conn.commit()
         row = conn.execute(
             "SELECT is_favorite FROM sessions WHERE id = ?", (int(session_id),)
         ).fetchone()
-    finally:
-        conn.close()
     is_fav = bool(row and row[0])
     style: dict[str, str] = {
         "display": "flex",
@@ -2998,15 +3213,12 @@ def _toggle_hand_fav(
     from pokerhero.database.db import toggle_hand_favorite
 
     db_path = _get_db_path()
-    conn = get_connection(db_path)
-    try:
+    with _open_conn(db_path) as conn:
         toggle_hand_favorite(conn, int(hand_id))
         conn.commit()
         row = conn.execute(
             "SELECT is_favorite FROM hands WHERE id = ?", (int(hand_id),)
         ).fetchone()
-    finally:
-        conn.close()
     is_fav = bool(row and row[0])
     style: dict[str, str] = {
         "display": "flex",
@@ -3088,10 +3300,7 @@ def _bg_calculate_session_evs(
     from pokerhero.analysis.stats import calculate_session_evs
     from pokerhero.database.db import get_range_settings
 
-    conn = get_connection(db_path)
-    try:
+    with _open_conn(db_path) as conn:
         settings = get_range_settings(conn)
-    finally:
-        conn.close()
     calculate_session_evs(db_path, session_id, hero_id, settings)
     return {"session_id": session_id, "done": True}, "✅ Done"
@@ -2,399 +2,355 @@
 
 from __future__ import annotations
 
-import io
+import contextlib
+import csv
+import functools
+import logging
+import os
 import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
 import dash
 from dash import Input, Output, State, callback, dcc, html
 
-from pokerhero.analysis.queries import get_export_data
+from pokerhero.analysis.queries import get_export_cursor
+from pokerhero.database import pool
 from pokerhero.database.db import (
     clear_all_data,
     get_connection,
     get_hand_ranking,
     get_setting,
+    get_settings,
     init_db,
+    player_exists,
     save_hand_ranking,
     set_setting,
+    set_settings,
 )
 
 dash.register_page(__name__, path="/settings", name="Settings")  # type: ignore[no-untyped-call]
-
-_SECTION_STYLE = {
-    "marginBottom": "32px",
-    "padding": "20px",
-    "border": "1px solid var(--border, #e0e0e0)",
-    "borderRadius": "8px",
-    "background": "var(--bg-2, #fafafa)",
-}
-
-_BUTTON_STYLE = {
-    "padding": "10px 20px",
-    "fontSize": "14px",
-    "cursor": "pointer",
-    "borderRadius": "6px",
-    "border": "none",
-}
-
-layout = html.Div(
-    style={
-        "fontFamily": "sans-serif",
-        "maxWidth": "700px",
-        "margin": "40px auto",
-        "padding": "0 20px",
-    },
-    children=[
-        html.H2("⚙️ Settings"),
-        dcc.Link(
-            "← Back to Home", href="/", style={"fontSize": "13px", "color": "#0074D9"}
-        ),
-        html.Hr(),
-        # ── Hero Username ───────────────────────────────────────────────────
-        html.Div(
-            style=_SECTION_STYLE,
-            children=[
-                html.H3("🎯 Hero Username", style={"marginTop": 0}),
-                html.P(
-                    "Your PokerStars screen name. Used to identify your actions in "
-                    "every hand history file you upload.",
-                    style={"color": "var(--text-3, #555)", "fontSize": "14px"},
-                ),
-                dcc.Input(
-                    id="settings-username",
-                    type="text",
-                    placeholder="e.g. jsalinas96",
-                    debounce=True,
-                    style={"width": "300px", "padding": "8px", "fontSize": "14px"},
-                ),
-                html.Span(
-                    id="settings-username-saved",
-                    style={
-                        "marginLeft": "10px",
-                        "color": "var(--text-4, #888)",
-                        "fontSize": "12px",
-                    },
-                ),
-            ],
-        ),
-        # ── Analysis Settings ────────────────────────────────────────────────
-        html.Div(
-            style=_SECTION_STYLE,
-            children=[
-                html.H3("📊 Analysis Settings", style={"marginTop": 0}),
-                html.P(
-                    "Tune the equity and classification parameters used when "
-                    "analysing your session reports.",
-                    style={"color": "var(--text-3, #555)", "fontSize": "14px"},
-                ),
-                html.Div(
-                    style={"display": "grid", "gap": "16px"},
-                    children=[
-                        html.Div(
-                            [
-                                html.Label(
-                                    "Equity sample count",
-                                    style={
-                                        "fontWeight": "600",
-                                        "fontSize": "14px",
-                                        "display": "block",
-                                        "marginBottom": "4px",
-                                    },
-                                ),
-                                html.P(
-                                    "Monte Carlo samples used to estimate equity "
-                                    "(higher = more accurate but slower).",
-                                    style={
-                                        "fontSize": "12px",
-                                        "color": "var(--text-3, #777)",
-                                        "margin": "0 0 6px 0",
-                                    },
-                                ),
-                                dcc.Input(
-                                    id="settings-sample-count",
-                                    type="number",
-                                    min=500,
-                                    max=10000,
-                                    step=500,
-                                    value=2000,
-                                    style={
-                                        "width": "130px",
-                                        "padding": "6px",
-                                        "fontSize": "14px",
-                                    },
-                                ),
-                                html.Span(
-                                    id="settings-sample-count-saved",
-                                    style={
-                                        "marginLeft": "10px",
-                                        "color": "var(--text-4, #888)",
-                                        "fontSize": "12px",
-                                    },
-                                ),
-                            ]
-                        ),
-                        html.Div(
-                            [
-                                html.Label(
-                                    "Lucky equity threshold (%)",
-                                    style={
-                                        "fontWeight": "600",
-                                        "fontSize": "14px",
-                                        "display": "block",
-                                        "marginBottom": "4px",
-                                    },
-                                ),
-                                html.P(
-                                    "Hero wins with equity below this %"
-                                    " → flagged as Lucky.",
-                                    style={
-                                        "fontSize": "12px",
-                                        "color": "var(--text-3, #777)",
-                                        "margin": "0 0 6px 0",
-                                    },
-                                ),
-                                dcc.Input(
-                                    id="settings-lucky-threshold",
-                                    type="number",
-                                    min=10,
-                                    max=49,
-                                    step=1,
-                                    value=40,
-                                    style={
-                                        "width": "130px",
-                                        "padding": "6px",
-                                        "fontSize": "14px",
-                                    },
-                                ),
-                                html.Span(
-                                    id="settings-lucky-threshold-saved",
-                                    style={
-                                        "marginLeft": "10px",
-                                        "color": "var(--text-4, #888)",
-                                        "fontSize": "12px",
-                                    },
-                                ),
-                            ]
-                        ),
-                        html.Div(
-                            [
-                                html.Label(
-                                    "Unlucky equity threshold (%)",
-                                    style={
-                                        "fontWeight": "600",
-                                        "fontSize": "14px",
-                                        "display": "block",
-                                        "marginBottom": "4px",
-                                    },
-                                ),
-                                html.P(
-                                    "Hero loses with equity above this %"
-                                    " → flagged as Unlucky.",
-                                    style={
-                                        "fontSize": "12px",
-                                        "color": "var(--text-3, #777)",
-                                        "margin": "0 0 6px 0",
-                                    },
-                                ),
-                                dcc.Input(
-                                    id="settings-unlucky-threshold",
-                                    type="number",
-                                    min=51,
-                                    max=90,
-                                    step=1,
-                                    value=60,
-                                    style={
-                                        "width": "130px",
-                                        "padding": "6px",
-                                        "fontSize": "14px",
-                                    },
-                                ),
-                                html.Span(
-                                    id="settings-unlucky-threshold-saved",
-                                    style={
-                                        "marginLeft": "10px",
-                                        "color": "var(--text-4, #888)",
-                                        "fontSize": "12px",
-                                    },
-                                ),
-                            ]
-                        ),
-                        html.Div(
-                            [
-                                html.Label(
-                                    "Min hands for archetype badge",
-                                    style={
-                                        "fontWeight": "600",
-                                        "fontSize": "14px",
-                                        "display": "block",
-                                        "marginBottom": "4px",
-                                    },
-                                ),
-                                html.P(
-                                    "Minimum hands observed before TAG/LAG/Nit/Fish "
-                                    "badge is shown for an opponent.",
-                                    style={
-                                        "fontSize": "12px",
-                                        "color": "var(--text-3, #777)",
-                                        "margin": "0 0 6px 0",
-                                    },
-                                ),
-                                dcc.Input(
-                                    id="settings-min-hands",
-                                    type="number",
-                                    min=5,
-                                    max=200,
-                                    step=1,
-                                    value=15,
-                                    style={
-                                        "width": "130px",
-                                        "padding": "6px",
-                                        "fontSize": "14px",
-                                    },
-                                ),
-                                html.Span(
-                                    id="settings-min-hands-saved",
-                                    style={
-                                        "marginLeft": "10px",
-                                        "color": "var(--text-4, #888)",
-                                        "fontSize": "12px",
-                                    },
-                                ),
-                            ]
-                        ),
-                    ],
-                ),
-            ],
-        ),
-        # ── Target Stats ────────────────────────────────────────────────────
-        html.Div(
-            style=_SECTION_STYLE,
-            children=[
-                html.H3("🎯 Target Stats", style={"marginTop": 0}),
-                html.P(
-                    "Configure per-position traffic-light targets for VPIP, PFR, "
-                    "and 3-Bet.",
-                    style={"color": "var(--text-3, #555)", "fontSize": "14px"},
-                ),
-                dcc.Link(
-                    "Configure Target Ranges →",
-                    href="/settings/targets",
-                    style={"fontSize": "14px", "color": "#0074D9"},
-                ),
-            ],
-        ),
-        # ── Advanced Settings ────────────────────────────────────────────────
-        html.Details(
-            style={**_SECTION_STYLE, "marginBottom": "32px"},
-            children=[
-                html.Summary(
-                    "🔬 Advanced Settings",
-                    style={
-                        "fontWeight": "600",
-                        "fontSize": "16px",
-                        "cursor": "pointer",
-                        "userSelect": "none",
-                    },
-                ),
-                html.P(
-                    "For advanced users only. Modify the pre-flop hand ranking "
-                    "used when estimating villain ranges. Provide 169 unique "
-                    "hand strings (e.g. AA, AKs, AKo) separated by commas or "
-                    "newlines, strongest first.",
-                    style={
-                        "color": "var(--text-3, #555)",
-                        "fontSize": "14px",
-                        "marginTop": "12px",
-                    },
-                ),
-                html.Label(
-                    "Pre-flop Hand Ranking",
-                    style={
-                        "fontWeight": "600",
-                        "fontSize": "14px",
-                        "display": "block",
-                        "marginBottom": "6px",
-                    },
-                ),
-                dcc.Textarea(
-                    id="settings-hand-ranking",
-                    style={
-                        "width": "100%",
-                        "height": "120px",
-                        "fontFamily": "monospace",
-                        "fontSize": "12px",
-                        "padding": "8px",
-                        "boxSizing": "border-box",
-                    },
-                    placeholder="AA, KK, QQ, JJ, AKs, ...",
-                ),
-                html.Div(
-                    style={
-                        "display": "flex",
-                        "alignItems": "center",
-                        "gap": "12px",
-                        "marginTop": "8px",
-                    },
-                    children=[
-                        html.Button(
-                            "💾 Save Hand Ranking",
-                            id="settings-hand-ranking-save",
-                            style={
-                                **_BUTTON_STYLE,
-                                "background": "#2ecc40",
-                                "color": "#fff",
-                            },
-                        ),
-                        html.Span(
-                            id="settings-hand-ranking-msg",
-                            style={"fontSize": "13px"},
-                        ),
-                    ],
-                ),
-            ],
-        ),
-        # ── Data Management ─────────────────────────────────────────────────
-        html.Div(
-            style=_SECTION_STYLE,
-            children=[
-                html.H3("🗄️ Data Management", style={"marginTop": 0}),
-                html.P(
-                    "Export your data as CSV or wipe the database. "
-                    "Settings (username) are preserved after a clear.",
-                    style={"color": "var(--text-3, #555)", "fontSize": "14px"},
-                ),
-                html.Div(
-                    style={"display": "flex", "gap": "12px", "flexWrap": "wrap"},
-                    children=[
-                        html.Button(
-                            "📥 Export CSV",
-                            id="export-csv-btn",
-                            style={
-                                **_BUTTON_STYLE,
-                                "background": "#0074D9",
-                                "color": "#fff",
-                            },
-                        ),
-                        html.Button(
-                            "🗑️ Clear Database",
-                            id="clear-db-btn",
-                            style={
-                                **_BUTTON_STYLE,
-                                "background": "#ff4136",
-                                "color": "#fff",
-                            },
-                        ),
-                    ],
-                ),
-                html.Div(
-                    id="settings-action-msg",
-                    style={"marginTop": "12px", "fontSize": "14px"},
-                ),
-                dcc.Download(id="settings-download"),
-            ],
-        ),
-    ],
-)
+logger = logging.getLogger(__name__)
+
+
+def _setting_id(name: str) -> dict[str, str]:
+    """Pattern-matching id of the analysis setting input called *name*."""
+    return {"type": "analysis-setting", "name": name}
+
+
+def _setting_saved_id(name: str) -> dict[str, str]:
+    """Pattern-matching id of the saved-marker span next to input *name*."""
+    return {"type": "analysis-setting-saved", "name": name}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_layout() -> html.Div:
+    """Build the settings page tree once, on first request.
+
+    Nothing in the tree depends on the request — stored values are filled in
+    by the ``_load_*`` callbacks — so the same instance is reused for every
+    page visit instead of being rebuilt, and nothing is built at import time.
+    """
+    return html.Div(
+        style={
+            "fontFamily": "sans-serif",
+            "maxWidth": "700px",
+            "margin": "40px auto",
+            "padding": "0 20px",
+        },
+        children=[
+            html.H2("⚙️ Settings"),
+            dcc.Link(
+                "← Back to Home",
+                href="/",
+                style={"fontSize": "13px", "color": "#0074D9"},
+            ),
+            html.Hr(),
+            # ── Hero Username ───────────────────────────────────────────────────
+            html.Div(
+                className="settings-section",
+                children=[
+                    html.H3("🎯 Hero Username", style={"marginTop": 0}),
+                    html.P(
+                        "Your PokerStars screen name. Used to identify your actions in "
+                        "every hand history file you upload.",
+                        style={"color": "var(--text-3, #555)", "fontSize": "14px"},
+                    ),
+                    dcc.Input(
+                        id="settings-username",
+                        type="text",
+                        placeholder="e.g. jsalinas96",
+                        debounce=True,
+                        style={"width": "300px", "padding": "8px", "fontSize": "14px"},
+                    ),
+                    html.Span(
+                        id="settings-username-saved",
+                        className="settings-saved",
+                    ),
+                ],
+            ),
+            # ── Analysis Settings ────────────────────────────────────────────────
+            html.Div(
+                className="settings-section",
+                children=[
+                    html.H3("📊 Analysis Settings", style={"marginTop": 0}),
+                    html.P(
+                        "Tune the equity and classification parameters used when "
+                        "analysing your session reports.",
+                        style={"color": "var(--text-3, #555)", "fontSize": "14px"},
+                    ),
+                    html.Div(
+                        style={"display": "grid", "gap": "16px"},
+                        children=[
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Equity sample count",
+                                        className="settings-label",
+                                    ),
+                                    html.P(
+                                        "Monte Carlo samples used to estimate equity "
+                                        "(higher = more accurate but slower).",
+                                        className="settings-hint",
+                                    ),
+                                    dcc.Input(
+                                        id=_setting_id("settings-sample-count"),
+                                        type="number",
+                                        debounce=True,
+                                        min=500,
+                                        max=10000,
+                                        step=500,
+                                        value=2000,
+                                        className="settings-number-input",
+                                    ),
+                                    html.Span(
+                                        id=_setting_saved_id("settings-sample-count"),
+                                        className="settings-saved",
+                                    ),
+                                ]
+                            ),
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Lucky equity threshold (%)",
+                                        className="settings-label",
+                                    ),
+                                    html.P(
+                                        "Hero wins with equity below this %"
+                                        " → flagged as Lucky.",
+                                        className="settings-hint",
+                                    ),
+                                    dcc.Input(
+                                        id=_setting_id("settings-lucky-threshold"),
+                                        type="number",
+                                        debounce=True,
+                                        min=10,
+                                        max=49,
+                                        step=1,
+                                        value=40,
+                                        className="settings-number-input",
+                                    ),
+                                    html.Span(
+                                        id=_setting_saved_id(
+                                            "settings-lucky-threshold"
+                                        ),
+                                        className="settings-saved",
+                                    ),
+                                ]
+                            ),
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Unlucky equity threshold (%)",
+                                        className="settings-label",
+                                    ),
+                                    html.P(
+                                        "Hero loses with equity above this %"
+                                        " → flagged as Unlucky.",
+                                        className="settings-hint",
+                                    ),
+                                    dcc.Input(
+                                        id=_setting_id("settings-unlucky-threshold"),
+                                        type="number",
+                                        debounce=True,
+                                        min=51,
+                                        max=90,
+                                        step=1,
+                                        value=60,
+                                        className="settings-number-input",
+                                    ),
+                                    html.Span(
+                                        id=_setting_saved_id(
+                                            "settings-unlucky-threshold"
+                                        ),
+                                        className="settings-saved",
+                                    ),
+                                ]
+                            ),
+                            html.Div(
+                                [
+                                    html.Label(
+                                        "Min hands for archetype badge",
+                                        className="settings-label",
+                                    ),
+                                    html.P(
+                                        "Minimum hands observed before TAG/LAG/Nit/"
+                                        "Fish badge is shown for an opponent.",
+                                        className="settings-hint",
+                                    ),
+                                    dcc.Input(
+                                        id=_setting_id("settings-min-hands"),
+                                        type="number",
+                                        debounce=True,
+                                        min=5,
+                                        max=200,
+                                        step=1,
+                                        value=15,
+                                        className="settings-number-input",
+                                    ),
+                                    html.Span(
+                                        id=_setting_saved_id("settings-min-hands"),
+                                        className="settings-saved",
+                                    ),
+                                ]
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+            # ── Target Stats ────────────────────────────────────────────────────
+            html.Div(
+                className="settings-section",
+                children=[
+                    html.H3("🎯 Target Stats", style={"marginTop": 0}),
+                    html.P(
+                        "Configure per-position traffic-light targets for VPIP, PFR, "
+                        "and 3-Bet.",
+                        style={"color": "var(--text-3, #555)", "fontSize": "14px"},
+                    ),
+                    dcc.Link(
+                        "Configure Target Ranges →",
+                        href="/settings/targets",
+                        style={"fontSize": "14px", "color": "#0074D9"},
+                    ),
+                ],
+            ),
+            # ── Advanced Settings ────────────────────────────────────────────────
+            html.Details(
+                className="settings-section",
+                children=[
+                    html.Summary(
+                        "🔬 Advanced Settings",
+                        style={
+                            "fontWeight": "600",
+                            "fontSize": "16px",
+                            "cursor": "pointer",
+                            "userSelect": "none",
+                        },
+                    ),
+                    html.P(
+                        "For advanced users only. Modify the pre-flop hand ranking "
+                        "used when estimating villain ranges. Provide 169 unique "
+                        "hand strings (e.g. AA, AKs, AKo) separated by commas or "
+                        "newlines, strongest first.",
+                        style={
+                            "color": "var(--text-3, #555)",
+                            "fontSize": "14px",
+                            "marginTop": "12px",
+                        },
+                    ),
+                    html.Label(
+                        "Pre-flop Hand Ranking",
+                        style={
+                            "fontWeight": "600",
+                            "fontSize": "14px",
+                            "display": "block",
+                            "marginBottom": "6px",
+                        },
+                    ),
+                    dcc.Textarea(
+                        id="settings-hand-ranking",
+                        style={
+                            "width": "100%",
+                            "height": "120px",
+                            "fontFamily": "monospace",
+                            "fontSize": "12px",
+                            "padding": "8px",
+                            "boxSizing": "border-box",
+                        },
+                        placeholder="AA, KK, QQ, JJ, AKs, ...",
+                    ),
+                    html.Div(
+                        style={
+                            "display": "flex",
+                            "alignItems": "center",
+                            "gap": "12px",
+                            "marginTop": "8px",
+                        },
+                        children=[
+                            html.Button(
+                                "💾 Save Hand Ranking",
+                                id="settings-hand-ranking-save",
+                                className="settings-button",
+                                style={"background": "#2ecc40"},
+                            ),
+                            html.Span(
+                                id="settings-hand-ranking-msg",
+                                style={"fontSize": "13px"},
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+            # ── Data Management ─────────────────────────────────────────────────
+            html.Div(
+                className="settings-section",
+                children=[
+                    html.H3("🗄️ Data Management", style={"marginTop": 0}),
+                    html.P(
+                        "Export your data as CSV or wipe the database. "
+                        "Settings (username) are preserved after a clear.",
+                        style={"color": "var(--text-3, #555)", "fontSize": "14px"},
+                    ),
+                    html.Div(
+                        style={"display": "flex", "gap": "12px", "flexWrap": "wrap"},
+                        children=[
+                            html.Button(
+                                "📥 Export CSV",
+                                id="export-csv-btn",
+                                className="settings-button",
+                                style={"background": "#0074D9"},
+                            ),
+                            html.Button(
+                                "🗑️ Clear Database",
+                                id="clear-db-btn",
+                                className="settings-button",
+                                style={"background": "#ff4136"},
+                            ),
+                        ],
+                    ),
+                    html.Div(
+                        id="settings-action-msg",
+                        style={"marginTop": "12px", "fontSize": "14px"},
+                    ),
+                    dcc.Download(id="settings-download"),
+                    dcc.Store(id="settings-export-token"),
+                    dcc.Interval(
+                        id="settings-export-poll", interval=500, disabled=True
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
+def layout(**_query: str) -> html.Div:
+    """Dash page layout; returns the memoised tree from ``_build_layout``."""
+    return _build_layout()
 
 
 def _get_db_path() -> str:
@@ -420,11 +376,8 @@ def _load_username(pathname: str) -> str:
     db_path = _get_db_path()
     if db_path == ":memory:":
         return ""
-    conn = get_connection(db_path)
-    try:
+    with pool.acquire(db_path) as conn:
         return get_setting(conn, "hero_username", default="")
-    finally:
-        conn.close()
 
 
 @callback(
@@ -439,28 +392,55 @@ def _save_username(value: str | None) -> str:
     db_path = _get_db_path()
     if db_path == ":memory:":
         return ""
-    conn = get_connection(db_path)
-    try:
-        set_setting(conn, "hero_username", value.strip())
-        conn.commit()
-    finally:
-        conn.close()
+    username = value.strip()
+    with pool.acquire(db_path) as conn:
+        # Dash re-fires on navigation; skip the write (and its fsync) when the
+        # stored value is already current.
+        if get_setting(conn, "hero_username", default="") != username:
+            set_setting(conn, "hero_username", username)
+            conn.commit()
     return "✓ saved"
 
 
-_ANALYSIS_SETTING_KEYS = {
-    "settings-sample-count": ("equity_sample_count", "2000"),
-    "settings-lucky-threshold": ("lucky_equity_threshold", "40"),
-    "settings-unlucky-threshold": ("unlucky_equity_threshold", "60"),
-    "settings-min-hands": ("min_hands_classification", "15"),
+# Analysis settings edited on this page, keyed by input name:
+# (settings key, default, min, max, out-of-range message).
+_ANALYSIS_SETTINGS: dict[str, tuple[str, int, int, int, str]] = {
+    "settings-sample-count": (
+        "equity_sample_count",
+        2000,
+        500,
+        10000,
+        "⚠️ Value must be between 500 and 10,000",
+    ),
+    "settings-lucky-threshold": (
+        "lucky_equity_threshold",
+        40,
+        10,
+        49,
+        "⚠️ Value must be between 10 and 49",
+    ),
+    "settings-unlucky-threshold": (
+        "unlucky_equity_threshold",
+        60,
+        51,
+        90,
+        "⚠️ Value must be between 51 and 90",
+    ),
+    "settings-min-hands": (
+        "min_hands_classification",
+        15,
+        5,
+        200,
+        "⚠️ Value must be between 5 and 200",
+    ),
 }
 
 
 @callback(
-    Output("settings-sample-count", "value"),
-    Output("settings-lucky-threshold", "value"),
-    Output("settings-unlucky-threshold", "value"),
-    Output("settings-min-hands", "value"),
+    Output(_setting_id("settings-sample-count"), "value"),
+    Output(_setting_id("settings-lucky-threshold"), "value"),
+    Output(_setting_id("settings-unlucky-threshold"), "value"),
+    Output(_setting_id("settings-min-hands"), "value"),
     Input("_pages_location", "pathname"),
     prevent_initial_call=False,
 )
@@ -469,111 +449,71 @@ def _load_analysis_settings(pathname: str) -> tuple[int, int, int, int]:
     if pathname != "/settings":
         raise dash.exceptions.PreventUpdate
     db_path = _get_db_path()
-    defaults = (2000, 40, 60, 15)
+    specs = list(_ANALYSIS_SETTINGS.values())
     if db_path == ":memory:":
-        return defaults
-    conn = get_connection(db_path)
-    try:
-        return (
-            int(get_setting(conn, "equity_sample_count", default="2000")),
-            int(get_setting(conn, "lucky_equity_threshold", default="40")),
-            int(get_setting(conn, "unlucky_equity_threshold", default="60")),
-            int(get_setting(conn, "min_hands_classification", default="15")),
-        )
-    finally:
-        conn.close()
-
-
-@callback(
-    Output("settings-sample-count-saved", "children"),
-    Input("settings-sample-count", "value"),
-    prevent_initial_call=True,
-)
-def _save_sample_count(value: int | None) -> str:
-    """Persist equity_sample_count to settings table on change."""
-    if value is None:
-        return ""
-    if not (500 <= value <= 10000):
-        return "⚠️ Value must be between 500 and 10,000"
+        stored: dict[str, str] = {}
+    else:
+        with pool.acquire(db_path) as conn:
+            stored = get_settings(conn, [key for key, *_ in specs])
+    sample, lucky, unlucky, min_hands = (
+        int(stored.get(key, default)) for key, default, *_ in specs
+    )
+    return sample, lucky, unlucky, min_hands
+
+
+def _save_analysis_values(changes: dict[str, int | None]) -> dict[str, str]:
+    """Validate and persist changed analysis settings in one transaction.
+
+    Args:
+        changes: Input name (a key of ``_ANALYSIS_SETTINGS``) → new value.
+
+    Returns:
+        Input name → saved-marker text: ``""`` for an empty value, the
+        range warning for an out-of-range value, ``"✓ saved"`` otherwise.
+    """
+    messages: dict[str, str] = {}
+    rows: list[tuple[str, str]] = []
+    for name, value in changes.items():
+        key, _, lo, hi, range_msg = _ANALYSIS_SETTINGS[name]
+        if value is None:
+            messages[name] = ""
+        elif not (lo <= value <= hi):
+            messages[name] = range_msg
+        else:
+            messages[name] = "✓ saved"
+            rows.append((key, str(int(value))))
     db_path = _get_db_path()
     if db_path == ":memory:":
-        return ""
-    conn = get_connection(db_path)
-    try:
-        set_setting(conn, "equity_sample_count", str(int(value)))
-        conn.commit()
-    finally:
-        conn.close()
-    return "✓ saved"
+        return {n: "" if m == "✓ saved" else m for n, m in messages.items()}
+    if rows:
+        with pool.acquire(db_path) as conn, conn:
+            stored = get_settings(conn, [key for key, _ in rows])
+            changed = [(key, val) for key, val in rows if stored.get(key) != val]
+            if changed:
+                set_settings(conn, changed)
+    return messages
 
 
 @callback(
-    Output("settings-lucky-threshold-saved", "children"),
-    Input("settings-lucky-threshold", "value"),
+    Output({"type": "analysis-setting-saved", "name": dash.ALL}, "children"),
+    Input({"type": "analysis-setting", "name": dash.ALL}, "value"),
     prevent_initial_call=True,
 )
-def _save_lucky_threshold(value: int | None) -> str:
-    """Persist lucky_equity_threshold to settings table on change."""
-    if value is None:
-        return ""
-    if not (10 <= value <= 49):
-        return "⚠️ Value must be between 10 and 49"
-    db_path = _get_db_path()
-    if db_path == ":memory:":
-        return ""
-    conn = get_connection(db_path)
-    try:
-        set_setting(conn, "lucky_equity_threshold", str(int(value)))
-        conn.commit()
-    finally:
-        conn.close()
-    return "✓ saved"
-
-
-@callback(
-    Output("settings-unlucky-threshold-saved", "children"),
-    Input("settings-unlucky-threshold", "value"),
-    prevent_initial_call=True,
-)
-def _save_unlucky_threshold(value: int | None) -> str:
-    """Persist unlucky_equity_threshold to settings table on change."""
-    if value is None:
-        return ""
-    if not (51 <= value <= 90):
-        return "⚠️ Value must be between 51 and 90"
-    db_path = _get_db_path()
-    if db_path == ":memory:":
-        return ""
-    conn = get_connection(db_path)
-    try:
-        set_setting(conn, "unlucky_equity_threshold", str(int(value)))
-        conn.commit()
-    finally:
-        conn.close()
-    return "✓ saved"
-
-
-@callback(
-    Output("settings-min-hands-saved", "children"),
-    Input("settings-min-hands", "value"),
-    prevent_initial_call=True,
-)
-def _save_min_hands(value: int | None) -> str:
-    """Persist min_hands_classification to settings table on change."""
-    if value is None:
-        return ""
-    if not (5 <= value <= 200):
-        return "⚠️ Value must be between 5 and 200"
-    db_path = _get_db_path()
-    if db_path == ":memory:":
-        return ""
-    conn = get_connection(db_path)
-    try:
-        set_setting(conn, "min_hands_classification", str(int(value)))
-        conn.commit()
-    finally:
-        conn.close()
-    return "✓ saved"
+def _save_analysis_settings(values: list[int | None]) -> list[Any]:
+    """Persist whichever analysis settings changed, in a single transaction.
+
+    One pattern-matching callback replaces a callback per input, so several
+    inputs changing together cost one write transaction instead of four.
+    Saved markers of untouched inputs are left as they are.
+    """
+    names = [item["id"]["name"] for item in dash.ctx.inputs_list[0]]
+    triggered = {
+        t["name"] for t in dash.ctx.triggered_prop_ids.values() if isinstance(t, dict)
+    }
+    messages = _save_analysis_values(
+        {n: v for n, v in zip(names, values) if n in triggered}
+    )
+    return [messages.get(n, dash.no_update) for n in names]
 
 
 @callback(
@@ -590,11 +530,8 @@ def _load_hand_ranking(pathname: str) -> str:
         from pokerhero.analysis.ranges import HAND_RANKING
 
         return ", ".join(HAND_RANKING)
-    conn = get_connection(db_path)
-    try:
+    with pool.acquire(db_path) as conn:
         ranking = get_hand_ranking(conn)
-    finally:
-        conn.close()
     return ", ".join(ranking)
 
 
@@ -617,18 +554,97 @@ def _save_hand_ranking_cb(n_clicks: int | None, value: str | None) -> str:
     db_path = _get_db_path()
     if db_path == ":memory:":
         return "✓ (not persisted in demo mode)"
-    conn = get_connection(db_path)
-    try:
+    with pool.acquire(db_path) as conn:
         save_hand_ranking(conn, raw)
         conn.commit()
+    return "✓ saved"
+
+
+# CSV exports run on a small worker pool so a large export never blocks the
+# Dash callback thread. Each job is keyed by a random token that the browser
+# keeps in ``settings-export-token`` and polls via ``settings-export-poll``.
+# The registry is shared by every callback thread, so it is only touched
+# under ``_EXPORT_JOBS_LOCK``. Jobs nobody collects (the tab was closed) are
+# dropped, and their temp CSVs deleted, after ``_EXPORT_JOB_TTL_S``.
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="csv-export")
+_EXPORT_JOBS: dict[str, tuple[Future[int], str, float]] = {}
+# Tokens already delivered, so an overlapping poll tick is a no-op rather
+# than an "unknown export" error; expired with the same TTL.
+_EXPORT_DELIVERED: dict[str, float] = {}
+_EXPORT_JOBS_LOCK = threading.Lock()
+_EXPORT_JOB_TTL_S = 15 * 60
+_EXPORT_FILENAME = "pokerhero_export.csv"
+
+
+def _remove_export_file(out_path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.remove(out_path)
+
+
+def _drop_export_file(out_path: str, _future: Future[int]) -> None:
+    _remove_export_file(out_path)
+
+
+def _expire_export_jobs(now: float) -> None:
+    """Drop jobs and delivered tokens older than the TTL; caller holds the lock.
+
+    A still-running job's CSV is removed when its worker finishes.
+    """
+    cutoff = now - _EXPORT_JOB_TTL_S
+    for token in [t for t, job in _EXPORT_JOBS.items() if job[2] < cutoff]:
+        future, out_path, _ = _EXPORT_JOBS.pop(token)
+        future.add_done_callback(functools.partial(_drop_export_file, out_path))
+    for token in [t for t, at in _EXPORT_DELIVERED.items() if at < cutoff]:
+        del _EXPORT_DELIVERED[token]
+
+
+def _build_csv(db_path: str, hero: str, out_path: str) -> int:
+    """Write the hero's export CSV to *out_path*; return the number of hands.
+
+    Runs on an export worker thread with its own connection, so a long
+    export does not keep a pooled connection checked out.
+    """
+    conn = get_connection(db_path)
+    try:
+        cursor, header = get_export_cursor(conn, hero)
+        with open(out_path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh, lineterminator="\n")
+            writer.writerow(header)
+            n_rows = 0
+            for row in cursor:
+                writer.writerow(row)
+                n_rows += 1
     finally:
         conn.close()
-    return "✓ saved"
+    return n_rows
+
+
+def _start_export(db_path: str, hero: str) -> str:
+    """Queue a background CSV export and return its job token."""
+    token = uuid.uuid4().hex
+    out_path = os.path.join(tempfile.gettempdir(), f"pokerhero_export_{token}.csv")
+    future = _EXPORT_EXECUTOR.submit(_build_csv, db_path, hero, out_path)
+    now = time.monotonic()
+    with _EXPORT_JOBS_LOCK:
+        _expire_export_jobs(now)
+        _EXPORT_JOBS[token] = (future, out_path, now)
+    return token
+
+
+def _hero_exists(db_path: str, username: str) -> bool:
+    """Return True when *username* has a player row.
+
+    The export query joins on the username itself, so the gate only needs
+    to know that the player exists, not their id.
+    """
+    with pool.acquire(db_path) as conn:
+        return player_exists(conn, username)
 
 
 @callback(
-    Output("settings-download", "data"),
     Output("settings-action-msg", "children"),
+    Output("settings-export-token", "data"),
+    Output("settings-export-poll", "disabled"),
     Input("export-csv-btn", "n_clicks"),
     Input("clear-db-btn", "n_clicks"),
     State("settings-username", "value"),
@@ -638,61 +654,128 @@ def _handle_actions(
     export_clicks: int | None,
     clear_clicks: int | None,
     username: str | None,
-) -> tuple[dict[str, object] | None, str | html.Span]:
-    """Handle Export CSV and Clear Database button clicks."""
-    ctx = dash.callback_context
-    if not ctx.triggered:
+) -> tuple[str | html.Span, Any, Any]:
+    """Handle Export CSV and Clear Database button clicks.
+
+    Export only queues the CSV build and starts the poller; the file itself
+    is delivered by ``_poll_export`` once the worker has finished.
+    """
+    triggered_id = dash.ctx.triggered_id
+    if triggered_id is None:
         raise dash.exceptions.PreventUpdate
 
-    triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
     db_path = _get_db_path()
+    unchanged = (dash.no_update, dash.no_update)
 
     if triggered_id == "export-csv-btn":
         hero = (username or "").strip()
         if not hero:
-            return None, html.Span(
-                "⚠️ Set your hero username before exporting.", style={"color": "orange"}
+            return (
+                html.Span(
+                    "⚠️ Set your hero username before exporting.",
+                    style={"color": "orange"},
+                ),
+                *unchanged,
             )
         if db_path == ":memory:":
-            return None, html.Span(
-                "No data to export.", style={"color": "var(--text-4, #888)"}
+            return (
+                html.Span("No data to export.", style={"color": "var(--text-4, #888)"}),
+                *unchanged,
             )
-        conn = get_connection(db_path)
-        try:
-            player_row = conn.execute(
-                "SELECT id FROM players WHERE username = ?", (hero,)
-            ).fetchone()
-            if player_row is None:
-                return None, html.Span(
-                    f"⚠️ No data found for '{hero}'.", style={"color": "orange"}
-                )
-            df = get_export_data(conn, int(player_row[0]))
-        finally:
-            conn.close()
-        if df.empty:
-            return None, html.Span(
-                "No hands to export yet.", style={"color": "var(--text-4, #888)"}
+        if not _hero_exists(db_path, hero):
+            return (
+                html.Span(f"⚠️ No data found for '{hero}'.", style={"color": "orange"}),
+                *unchanged,
             )
-        buf = io.StringIO()
-        df.to_csv(buf, index=False)
+        token = _start_export(db_path, hero)
         return (
-            dcc.send_string(buf.getvalue(), "pokerhero_export.csv"),  # type: ignore[attr-defined, no-untyped-call]
-            html.Span("✅ Export ready — downloading…", style={"color": "green"}),
+            html.Span("⏳ Building export…", style={"color": "var(--text-4, #888)"}),
+            token,
+            False,
         )
 
     if triggered_id == "clear-db-btn":
         if db_path == ":memory:":
-            return None, html.Span(
-                "Nothing to clear.", style={"color": "var(--text-4, #888)"}
+            return (
+                html.Span("Nothing to clear.", style={"color": "var(--text-4, #888)"}),
+                *unchanged,
             )
-        conn = get_connection(db_path)
-        try:
+        with pool.acquire(db_path) as conn:
             clear_all_data(conn)
-        finally:
-            conn.close()
-        return None, html.Span(
-            "✅ Database cleared. Settings preserved.", style={"color": "green"}
+        return (
+            html.Span(
+                "✅ Database cleared. Settings preserved.", style={"color": "green"}
+            ),
+            *unchanged,
         )
 
     raise dash.exceptions.PreventUpdate
+
+
+@callback(
+    Output("settings-download", "data"),
+    Output("settings-action-msg", "children", allow_duplicate=True),
+    Output("settings-export-poll", "disabled", allow_duplicate=True),
+    Input("settings-export-poll", "n_intervals"),
+    State("settings-export-token", "data"),
+    prevent_initial_call=True,
+)
+def _poll_export(
+    n_intervals: int | None, token: str | None
+) -> tuple[dict[str, object] | None, html.Span, bool]:
+    """Deliver a finished background export and stop polling.
+
+    Raises PreventUpdate while the job is still running, and for a tick that
+    overlaps the one that already delivered the file. The finished job is
+    taken out of the registry under the lock, so exactly one tick delivers
+    it; the temporary CSV is deleted once its contents have been handed to
+    the Download component. An unknown token (expired, or started by another
+    server process) is reported instead of silently clearing the message.
+    """
+    key = token or ""
+    now = time.monotonic()
+    with _EXPORT_JOBS_LOCK:
+        _expire_export_jobs(now)
+        if key in _EXPORT_DELIVERED:
+            raise dash.exceptions.PreventUpdate
+        job = _EXPORT_JOBS.get(key)
+        if job is not None:
+            if not job[0].done():
+                raise dash.exceptions.PreventUpdate
+            del _EXPORT_JOBS[key]
+            _EXPORT_DELIVERED[key] = now
+    if job is None:
+        return (
+            None,
+            html.Span(
+                "⚠️ Export not found — it may have expired. Please export again.",
+                style={"color": "orange"},
+            ),
+            True,
+        )
+    future, out_path, _ = job
+    try:
+        n_rows = future.result()
+        if n_rows == 0:
+            return (
+                None,
+                html.Span(
+                    "No hands to export yet.", style={"color": "var(--text-4, #888)"}
+                ),
+                True,
+            )
+        download = dcc.send_file(out_path, filename=_EXPORT_FILENAME)  # type: ignore[attr-defined, no-untyped-call]
+    except Exception:
+        logger.exception("CSV export failed")
+        return (
+            None,
+            html.Span("⚠️ Export failed — see the log.", style={"color": "orange"}),
+            True,
+        )
+    finally:
+        _remove_export_file(out_path)
+    return (
+        download,
+        html.Span("✅ Export ready — downloading…", style={"color": "green"}),
+        True,
+    )
@@ -7,7 +7,10 @@ canonical positions.  Values are persisted to the ``target_settings`` table.
 
 from __future__ import annotations
 
+import contextlib
 import sqlite3
+from collections.abc import Iterator
+from typing import Any, Literal
 
 import dash
 from dash import Input, Output, callback, dcc, html
@@ -15,10 +18,11 @@ from dash import Input, Output, callback, dcc, html
 from pokerhero.analysis.targets import (
     POSITIONS,
     TARGET_DEFAULTS,
-    ensure_target_settings_table,
     read_target_settings,
+    write_target_settings,
 )
-from pokerhero.database.db import get_connection, init_db
+from pokerhero.database import pool
+from pokerhero.database.db import init_db
 
 dash.register_page(__name__, path="/settings/targets", name="Target Stats")  # type: ignore[no-untyped-call]
 
@@ -55,9 +59,14 @@ _BOUND_LABELS: dict[str, str] = {
 _BOUND_KEYS: tuple[str, ...] = ("green-min", "green-max", "yellow-min", "yellow-max")
 
 
-def _field_id(stat: str, pos: str, bound: str) -> str:
-    """Return the plain component ID string for a target bounds input."""
-    return f"target-{stat}-{pos}-{bound}"
+def _field_id(stat: str, pos: str, bound: str) -> dict[str, str]:
+    """Return the pattern-matching component ID for a target bounds input."""
+    return {"type": "target-input", "stat": stat, "pos": pos, "bound": bound}
+
+
+def _saved_id(stat: str, pos: str) -> dict[str, str]:
+    """Return the pattern-matching ID of the saved marker for one row."""
+    return {"type": "target-saved", "stat": stat, "pos": pos}
 
 
 def _bounds_row(stat: str, pos: str) -> html.Tr:
@@ -93,20 +102,20 @@ def _bounds_row(stat: str, pos: str) -> html.Tr:
                                 "fontSize": "13px",
                             },
                         ),
-                        html.Span(
-                            id=f"target-{stat}-{pos}-{bound}-saved",
-                            style={
-                                "marginLeft": "4px",
-                                "fontSize": "11px",
-                                "color": "var(--text-4, #888)",
-                            },
-                        ),
                     ],
                     style={"display": "flex", "alignItems": "center"},
                 ),
                 style={"paddingRight": "8px"},
             )
         )
+    cells.append(
+        html.Td(
+            html.Span(
+                id=_saved_id(stat, pos),
+                style={"fontSize": "11px", "color": "var(--text-4, #888)"},
+            )
+        )
+    )
     return html.Tr(cells)
 
 
@@ -125,6 +134,7 @@ def _stat_section(stat: str) -> html.Div:
                 },
             )
         )
+    header_cells.append(html.Th())  # saved-marker column
     rows = [html.Tr(header_cells)] + [_bounds_row(stat, pos) for pos in POSITIONS]
     return html.Div(
         style=_SECTION_STYLE,
@@ -173,28 +183,58 @@ layout = html.Div(
 )
 
 
+# The DB path of the app the cached value was read from; create_app() builds
+# a new app (tests do this with different paths), which invalidates it.
+_db_path_state: dict[str, Any] = {}
+
+
 def _get_db_path() -> str:
-    result: str = dash.get_app().server.config.get("DB_PATH", ":memory:")  # type: ignore[no-untyped-call]
+    """Return the configured DB path from the running Dash app's server config.
+
+    Memoised per app instance so callbacks skip the Flask config lookup.
+    """
+    app = dash.get_app()  # type: ignore[no-untyped-call]
+    if _db_path_state.get("app") is not app:
+        _db_path_state["path"] = app.server.config.get("DB_PATH", ":memory:")
+        _db_path_state["app"] = app
+    result: str = _db_path_state["path"]
     return result
 
 
-def _open_conn(db_path: str) -> sqlite3.Connection:
-    if db_path == ":memory:":
-        return init_db(":memory:")
-    return get_connection(db_path)
+@contextlib.contextmanager
+def _open_conn(db_path: str) -> Iterator[sqlite3.Connection]:
+    if db_path != ":memory:":
+        with pool.acquire(db_path) as conn:
+            yield conn
+        return
+    conn = init_db(":memory:")
+    try:
+        yield conn
+    finally:
+        conn.close()
 
 
 # ---------------------------------------------------------------------------
 # Load callback — pre-populate all inputs on page visit
 # ---------------------------------------------------------------------------
 
-_ALL_OUTPUT_IDS: list[str] = [
+_ALL_OUTPUT_IDS: list[dict[str, str]] = [
     _field_id(stat, pos, bound)
     for stat in ("vpip", "pfr", "3bet")
     for pos in POSITIONS
     for bound in _BOUND_KEYS
 ]
 
+# (stat, position, TargetBounds key) for each output of _load_targets, in the
+# same order as _ALL_OUTPUT_IDS.
+_BoundField = Literal["green_min", "green_max", "yellow_min", "yellow_max"]
+_LOAD_KEYS: list[tuple[str, str, _BoundField]] = [
+    (stat, pos, key)
+    for stat in ("vpip", "pfr", "3bet")
+    for pos in POSITIONS
+    for key in ("green_min", "green_max", "yellow_min", "yellow_max")
+]
+
 
 @callback(
     [Output(fid, "value") for fid in _ALL_OUTPUT_IDS],
@@ -206,68 +246,71 @@ def _load_targets(pathname: str) -> list[float]:
     if pathname != "/settings/targets":
         raise dash.exceptions.PreventUpdate
     db_path = _get_db_path()
-    conn = _open_conn(db_path)
-    try:
+    with _open_conn(db_path) as conn:
         targets = read_target_settings(conn)
-    finally:
-        conn.close()
 
-    result: list[float] = []
-    for stat in ("vpip", "pfr", "3bet"):
-        for pos in POSITIONS:
-            bounds = targets[(stat, pos)]
-            result.append(bounds["green_min"])
-            result.append(bounds["green_max"])
-            result.append(bounds["yellow_min"])
-            result.append(bounds["yellow_max"])
-    return result
+    return [targets[(stat, pos)][key] for stat, pos, key in _LOAD_KEYS]
 
 
 # ---------------------------------------------------------------------------
-# Save callbacks — one per (stat, position), triggered on any bound change
+# Save callback — one pattern-matching callback for every (stat, position)
 # ---------------------------------------------------------------------------
 
 
-def _make_save_callback(stat: str, pos: str) -> None:
-    """Register a save callback for one (stat, position) pair."""
-    inputs = [Input(_field_id(stat, pos, b), "value") for b in _BOUND_KEYS]
-    output = Output(f"target-{stat}-{pos}-green-min-saved", "children")
-
-    @callback(output, *inputs, prevent_initial_call=True)
-    def _save(
-        gmin: float | None,
-        gmax: float | None,
-        ymin: float | None,
-        ymax: float | None,
-        _stat: str = stat,
-        _pos: str = pos,
-    ) -> str:
-        if gmin is None or gmax is None or ymin is None or ymax is None:
-            return ""
-        gmin_f, gmax_f, ymin_f, ymax_f = (
-            float(gmin),
-            float(gmax),
-            float(ymin),
-            float(ymax),
-        )
-        db_path = _get_db_path()
-        if db_path == ":memory:":
-            return ""
-        conn = get_connection(db_path)
-        try:
-            ensure_target_settings_table(conn)
-            conn.execute(
-                "INSERT OR REPLACE INTO target_settings "
-                "(stat, position, green_min, green_max, yellow_min, yellow_max) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (_stat, _pos, gmin_f, gmax_f, ymin_f, ymax_f),
-            )
+def _save_target_rows(
+    bounds: dict[tuple[str, str], dict[str, float | None]],
+) -> dict[tuple[str, str], str]:
+    """Persist complete bound rows and return the saved marker per row.
+
+    Rows with an empty input are skipped (marker cleared); the rest are
+    written with a single ``executemany`` in one transaction.
+    """
+    markers: dict[tuple[str, str], str] = {}
+    rows: list[tuple[str, str, float, float, float, float]] = []
+    for (stat, pos), row in bounds.items():
+        values = [row.get(b) for b in _BOUND_KEYS]
+        if any(v is None for v in values):
+            markers[(stat, pos)] = ""
+            continue
+        gmin, gmax, ymin, ymax = (float(v) for v in values if v is not None)
+        rows.append((stat, pos, gmin, gmax, ymin, ymax))
+        markers[(stat, pos)] = "✓"
+    db_path = _get_db_path()
+    if db_path == ":memory:":
+        return dict.fromkeys(markers, "")
+    if rows:
+        with pool.acquire(db_path) as conn:
+            write_target_settings(conn, rows)
             conn.commit()
-        finally:
-            conn.close()
-        return "✓"
+    return markers
 
 
-for _stat in ("vpip", "pfr", "3bet"):
-    for _pos in POSITIONS:
-        _make_save_callback(_stat, _pos)
+@callback(
+    Output({"type": "target-saved", "stat": dash.ALL, "pos": dash.ALL}, "children"),
+    Input(
+        {"type": "target-input", "stat": dash.ALL, "pos": dash.ALL, "bound": dash.ALL},
+        "value",
+    ),
+    prevent_initial_call=True,
+)
+def _save_targets(values: list[float | None]) -> list[Any]:
+    """Persist the (stat, position) rows whose bounds changed.
+
+    All 72 inputs feed this one callback; the four bounds of each touched row
+    are grouped and written together, so a burst of edits costs one
+    transaction. Saved markers of untouched rows are left as they are.
+    """
+    bounds: dict[tuple[str, str], dict[str, float | None]] = {}
+    for item, value in zip(dash.ctx.inputs_list[0], values):
+        fid = item["id"]
+        bounds.setdefault((fid["stat"], fid["pos"]), {})[fid["bound"]] = value
+    triggered = {
+        (t["stat"], t["pos"])
+        for t in dash.ctx.triggered_prop_ids.values()
+        if isinstance(t, dict)
+    }
+    markers = _save_target_rows({k: v for k, v in bounds.items() if k in triggered})
+    return [
+        markers.get((item["id"]["stat"], item["id"]["pos"]), dash.no_update)
+        for item in dash.ctx.outputs_list
+    ]
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import dash
 from dash import Input, Output, State, callback, dcc, html
 
-from pokerhero.database.db import get_connection, get_setting, init_db, set_setting
+from pokerhero.database import pool
+from pokerhero.database.db import get_setting, init_db, set_setting
 from pokerhero.frontend.upload_handler import handle_upload
 
 dash.register_page(__name__, path="/upload", name="Upload Files")  # type: ignore[no-untyped-call]
@@ -79,17 +85,40 @@ layout = html.Div(
 )
 
 
+# The DB path of the app the cached value was read from; create_app() builds
+# a new app (tests do this with different paths), which invalidates it.
+_db_path_state: dict[str, Any] = {}
+
+
 def _get_db_path() -> str:
-    """Return the configured DB path from the running Dash app's server config."""
-    result: str = dash.get_app().server.config.get("DB_PATH", ":memory:")  # type: ignore[no-untyped-call]
+    """Return the configured DB path from the running Dash app's server config.
+
+    Memoised per app instance so callbacks skip the Flask config lookup.
+    """
+    app = dash.get_app()  # type: ignore[no-untyped-call]
+    if _db_path_state.get("app") is not app:
+        _db_path_state["path"] = app.server.config.get("DB_PATH", ":memory:")
+        _db_path_state["app"] = app
+    result: str = _db_path_state["path"]
     return result
 
 
-def _open_conn(db_path: str) -> sqlite3.Connection:
-    """Open (or initialise) a DB connection appropriate for db_path."""
-    if db_path == ":memory:":
-        return init_db(":memory:")
-    return get_connection(db_path)
+@contextlib.contextmanager
+def _open_conn(db_path: str) -> Iterator[sqlite3.Connection]:
+    """Yield a DB connection appropriate for db_path.
+
+    File databases borrow a pooled connection; ``:memory:`` gets a freshly
+    initialised database that is closed afterwards.
+    """
+    if db_path != ":memory:":
+        with pool.acquire(db_path) as conn:
+            yield conn
+        return
+    conn = init_db(":memory:")
+    try:
+        yield conn
+    finally:
+        conn.close()
 
 
 @callback(
@@ -104,11 +133,8 @@ def _load_username(pathname: str) -> str:
     db_path = _get_db_path()
     if db_path == ":memory:":
         return ""
-    conn = get_connection(db_path)
-    try:
+    with pool.acquire(db_path) as conn:
         return get_setting(conn, "hero_username", default="")
-    finally:
-        conn.close()
 
 
 @callback(
@@ -123,15 +149,53 @@ def _save_username(value: str | None) -> str:
     db_path = _get_db_path()
     if db_path == ":memory:":
         return ""
-    conn = get_connection(db_path)
-    try:
+    with pool.acquire(db_path) as conn:
         set_setting(conn, "hero_username", value.strip())
         conn.commit()
-    finally:
-        conn.close()
     return "✓ saved"
 
 
+# Files of one multi-file upload are ingested concurrently: parsing is pure
+# Python and overlaps with another worker's SQLite writes, which WAL mode
+# serialises at the database.
+_UPLOAD_WORKERS = 4
+# Workers queue for the single SQLite write lock; give a large file's write
+# phase time to finish before a waiting worker gives up with "locked".
+_UPLOAD_BUSY_TIMEOUT_MS = 60_000
+
+
+def _upload_status(
+    content: str, filename: str, hero_username: str, conn: sqlite3.Connection
+) -> tuple[str, str]:
+    """Ingest one uploaded file and return its (status message, colour)."""
+    try:
+        msg = handle_upload(content, filename, hero_username, conn)
+    except (OSError, ValueError, KeyError, sqlite3.Error) as exc:
+        # sqlite3.Error covers "database is locked" when a parallel upload
+        # holds the write lock past the busy timeout; it is this file's
+        # failure, not the whole batch's.
+        return f"❌ {filename} — unexpected error: {exc}", "red"
+    return msg, "green" if msg.startswith("✅") else "orange"
+
+
+def _upload_with_own_conn(
+    db_path: str, hero_username: str, content: str, filename: str
+) -> tuple[str, str]:
+    """Worker body: ingest one file on a connection owned by this thread.
+
+    The long busy timeout is only for this upload: the previous value is
+    restored before the connection goes back to the pool, so other callbacks
+    that borrow it later do not wait a minute on a lock.
+    """
+    with pool.acquire(db_path) as conn:
+        previous = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        conn.execute(f"PRAGMA busy_timeout = {_UPLOAD_BUSY_TIMEOUT_MS}")
+        try:
+            return _upload_status(content, filename, hero_username, conn)
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(previous)}")
+
+
 @callback(
     Output("upload-output", "children"),
     Input("upload-data", "contents"),
@@ -143,7 +207,7 @@ def _process_upload(
     contents_list: list[str] | None,
     filenames: list[str] | None,
     hero_username: str | None,
-) -> list[html.Div] | html.Div | str:
+) -> html.Div | str:
     if not contents_list:
         return ""
     if not hero_username or not hero_username.strip():
@@ -152,16 +216,26 @@ def _process_upload(
             style={"color": "orange"},
         )
 
-    conn = _open_conn(_get_db_path())
-    messages = []
-    for content, filename in zip(contents_list, filenames or []):
-        try:
-            msg = handle_upload(content, filename, hero_username.strip(), conn)
-            color = "green" if msg.startswith("✅") else "orange"
-        except (OSError, ValueError, KeyError) as exc:
-            msg = f"❌ {filename} — unexpected error: {exc}"
-            color = "red"
-        messages.append(html.Div(msg, style={"color": color, "marginBottom": "6px"}))
-
-    conn.close()
-    return messages
+    hero = hero_username.strip()
+    files = list(zip(contents_list, filenames or []))
+    db_path = _get_db_path()
+    if db_path == ":memory:" or len(files) == 1:
+        # Every :memory: connection is its own database, so those uploads
+        # must share one connection; a single file gains nothing from threads.
+        with _open_conn(db_path) as conn:
+            statuses = [_upload_status(c, f, hero, conn) for c, f in files]
+    else:
+        with ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS) as executor:
+            statuses = list(
+                executor.map(
+                    functools.partial(_upload_with_own_conn, db_path, hero),
+                    [content for content, _ in files],
+                    [filename for _, filename in files],
+                )
+            )
+    return html.Div(
+        [
+            html.Div(msg, style={"color": color, "marginBottom": "6px"})
+            for msg, color in statuses
+        ]
+    )
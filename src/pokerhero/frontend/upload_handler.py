@@ -6,11 +6,9 @@ a running Dash server.
 
 import base64
 import logging
-import os
 import sqlite3
-import tempfile
 
-from pokerhero.ingestion.pipeline import ingest_file
+from pokerhero.ingestion.pipeline import decode_history, ingest_text
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +39,8 @@ def handle_upload(
 
     logger.info("Upload received: %s", filename)
 
-    # Write to a temp file so ingest_file can read it normally.
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".txt")
-    try:
-        with os.fdopen(tmp_fd, "wb") as f:
-            f.write(decoded)
-        result = ingest_file(tmp_path, hero_username, conn)
-        conn.commit()
-    finally:
-        os.unlink(tmp_path)
+    result = ingest_text(decode_history(decoded), hero_username, conn, source=filename)
+    conn.commit()
 
     if result.failed == 0 and result.skipped == 0:
         status = f"✅ {filename} — {result.ingested} imported"
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import codecs
 import logging
 import sqlite3
 from dataclasses import dataclass, field
+from decimal import Decimal
 from pathlib import Path
 
 from pokerhero.database.db import (
@@ -12,7 +14,7 @@ from pokerhero.database.db import (
     save_parsed_hand,
     update_session_financials,
 )
-from pokerhero.ingestion.splitter import split_hands
+from pokerhero.ingestion.splitter import iter_hands
 from pokerhero.parser.hand_parser import HandParser
 
 logger = logging.getLogger(__name__)
@@ -29,12 +31,68 @@ class IngestResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _hero_financials(
+    hero_stacks: list[tuple[Decimal, Decimal]],
+) -> tuple[Decimal, Decimal]:
+    """Return the hero's (buy_in, cash_out) from per-hand stacks, in order.
+
+    The buy-in starts at the first hand's starting stack; whenever a hand
+    starts higher than the previous hand ended, the difference is a re-buy
+    and is added. The cash-out is the stack after the last hand.
+
+    Args:
+        hero_stacks: Non-empty list of the hero's (starting_stack, net_result)
+            per ingested hand.
+    """
+    buy_in, first_net = hero_stacks[0]
+    end_stack = buy_in + first_net
+    for starting_stack, net_result in hero_stacks[1:]:
+        if starting_stack > end_stack:
+            buy_in += starting_stack - end_stack
+        end_stack = starting_stack + net_result
+    return buy_in, end_stack
+
+
+def decode_history(raw: bytes) -> str:
+    """Decode the bytes of a hand history file, dropping a UTF-8 BOM if present.
+
+    Equivalent to ``raw.decode("utf-8-sig")`` but uses the plain ``utf-8``
+    codec, which is faster on large files.
+    """
+    return raw.removeprefix(codecs.BOM_UTF8).decode("utf-8")
+
+
 def ingest_file(
     path: Path | str,
     hero_username: str,
     conn: sqlite3.Connection,
+    parser: HandParser | None = None,
+) -> IngestResult:
+    """Read a .txt session file and ingest it with :func:`ingest_text`.
+
+    Args:
+        path: Path to the .txt session file.
+        hero_username: The hero's PokerStars username.
+        conn: An open SQLite connection (created via init_db).
+        parser: Parser to reuse across files; built for *hero_username*
+            when omitted.
+
+    Returns:
+        IngestResult with counts of ingested, skipped, and failed hands.
+    """
+    path = Path(path)
+    text = decode_history(path.read_bytes())
+    return ingest_text(text, hero_username, conn, source=str(path), parser=parser)
+
+
+def ingest_text(
+    text: str,
+    hero_username: str,
+    conn: sqlite3.Connection,
+    source: str = "<text>",
+    parser: HandParser | None = None,
 ) -> IngestResult:
-    """Parse a .txt session file and persist all hands to the database.
+    """Parse the text of a session file and persist all hands to the database.
 
     One session row is created per file using the first hand's metadata and
     timestamp. hero_buy_in is set to the hero's starting stack in the first
@@ -44,101 +102,141 @@ def ingest_file(
     hand that fails to parse or insert for any other reason is counted as failed.
 
     Args:
-        path: Path to the .txt session file.
+        text: Decoded content of a PokerStars .txt session file.
         hero_username: The hero's PokerStars username.
-        conn: An open SQLite connection (created via init_db).
+        conn: An open SQLite connection (created via init_db). If it already
+            has a transaction open, the file is written under a savepoint
+            inside it and committing is left to the caller.
+        source: Where the text came from (file path or upload name); used
+            for ``IngestResult.file_path`` and log messages.
+        parser: Parser to reuse across calls; must have been built for
+            *hero_username*. A new one is created when omitted.
 
     Returns:
         IngestResult with counts of ingested, skipped, and failed hands.
     """
-    path = Path(path)
-    result = IngestResult(file_path=str(path))
+    name = Path(source).name
+    result = IngestResult(file_path=source)
 
-    logger.info("Starting ingestion: %s", path)
+    logger.info("Starting ingestion: %s", source)
 
-    blocks = split_hands(path.read_text(encoding="utf-8-sig"))
-    if not blocks:
-        logger.warning("No hand blocks found in %s", path.name)
+    blocks = iter_hands(text)
+    first_block = next(blocks, None)
+    if first_block is None:
+        logger.warning("No hand blocks found in %s", name)
         return result
 
-    parser = HandParser(hero_username=hero_username)
+    if parser is None:
+        parser = HandParser(hero_username=hero_username)
 
     # Parse the first block to get session metadata for the session row.
     try:
-        first_parsed = parser.parse(blocks[0])
+        first_parsed = parser.parse(first_block)
     except Exception as exc:
-        result.failed = len(blocks)
+        result.failed = 1 + sum(1 for _ in blocks)
         result.errors.append(f"Could not parse first hand for session metadata: {exc}")
-        logger.error("Failed to parse session metadata from %s: %s", path.name, exc)
+        logger.error("Failed to parse session metadata from %s: %s", name, exc)
         return result
 
-    session_id = insert_session(
-        conn,
-        first_parsed.session,
-        start_time=first_parsed.hand.timestamp.isoformat(),
-    )
-    # Commit deferred until first hand is successfully inserted (M3).
-    logger.info("Session %d created for %s", session_id, path.name)
+    # Parse every block before touching the database so the write phase below
+    # is one uninterrupted transaction. Blocks are consumed lazily, so only
+    # the parsed hands (not the raw block strings) are kept in memory.
+    parsed_hands = [first_parsed]
+    for block in blocks:
+        try:
+            parsed_hands.append(parser.parse(block))
+        except Exception as exc:
+            result.failed += 1
+            result.errors.append(str(exc))
+            logger.error("Failed to ingest hand from %s: %s", name, exc)
 
-    hero_buy_in = None
-    hero_end_stack = None  # tracks starting_stack + net_result after each hand
-    hero_cash_out = None
-    session_committed = False
+    # The whole file is written in a single transaction (one commit, so one
+    # fsync, per file instead of per hand). Each hand runs under a SAVEPOINT
+    # so a duplicate or bad hand rolls back on its own without aborting the
+    # rest of the batch. BEGIN IMMEDIATE takes the write lock up front, so a
+    # concurrent writer waits here (busy timeout) rather than failing on a
+    # lock upgrade mid-file. Inside a transaction the caller already opened,
+    # the file runs under a SAVEPOINT instead and the caller keeps control of
+    # the commit: its other pending writes are neither committed early nor
+    # rolled back when this file fails.
+    owns_txn = not conn.in_transaction
+    if owns_txn:
+        conn.execute("BEGIN IMMEDIATE")
+    else:
+        conn.execute("SAVEPOINT ingest_file")
+    try:
+        session_id = insert_session(
+            conn,
+            first_parsed.session,
+            start_time=first_parsed.hand.timestamp.isoformat(),
+        )
+        logger.info("Session %d created for %s", session_id, name)
 
-    for i, block in enumerate(blocks):
-        try:
-            # Re-use the cached first parse to avoid double-parsing (L3).
-            parsed = first_parsed if i == 0 else parser.parse(block)
-            save_parsed_hand(conn, parsed, session_id)
-            conn.commit()
-            session_committed = True
+        hero_name = parser.hero
+        # (starting_stack, net_result) of the hero in each ingested hand.
+        hero_stacks: list[tuple[Decimal, Decimal]] = []
+
+        for parsed in parsed_hands:
+            conn.execute("SAVEPOINT ingest_hand")
+            try:
+                save_parsed_hand(conn, parsed, session_id)
+            except sqlite3.IntegrityError as ie:
+                conn.execute("ROLLBACK TO ingest_hand")
+                conn.execute("RELEASE ingest_hand")
+                if "source_hand_id" in str(ie).lower() or "unique" in str(ie).lower():
+                    result.skipped += 1
+                    logger.warning("Skipped duplicate hand in %s", name)
+                else:
+                    result.failed += 1
+                    result.errors.append(str(ie))
+                    logger.error("Integrity error in %s: %s", name, ie)
+                continue
+            except Exception as exc:
+                conn.execute("ROLLBACK TO ingest_hand")
+                conn.execute("RELEASE ingest_hand")
+                result.failed += 1
+                result.errors.append(str(exc))
+                logger.error("Failed to ingest hand from %s: %s", name, exc)
+                continue
+            conn.execute("RELEASE ingest_hand")
             result.ingested += 1
             logger.debug("Ingested hand %s", parsed.hand.hand_id)
 
-            hero = next((p for p in parsed.players if p.is_hero), None)
-            if hero is not None:
-                if hero_buy_in is None:
-                    # First hand: initialise buy-in from starting stack
-                    hero_buy_in = hero.starting_stack
-                elif hero.starting_stack > hero_end_stack:
-                    # Re-buy detected: hero's stack is higher than where they left off
-                    hero_buy_in += hero.starting_stack - hero_end_stack
-                hero_end_stack = hero.starting_stack + hero.net_result
-                hero_cash_out = hero_end_stack
-
-        except sqlite3.IntegrityError as ie:
-            conn.rollback()
-            if "source_hand_id" in str(ie).lower() or "unique" in str(ie).lower():
-                result.skipped += 1
-                logger.warning("Skipped duplicate hand in %s", path.name)
-            else:
-                result.failed += 1
-                result.errors.append(str(ie))
-                logger.error("Integrity error in %s: %s", path.name, ie)
-        except Exception as exc:
+            for player in parsed.players:
+                if player.username == hero_name:
+                    hero_stacks.append((player.starting_stack, player.net_result))
+                    break
+
+        # Clean up orphaned session if no hands were successfully inserted (M3).
+        if result.ingested == 0:
+            conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            logger.warning(
+                "Removed orphaned session %d (no hands ingested)", session_id
+            )
+        elif hero_stacks:
+            hero_buy_in, hero_cash_out = _hero_financials(hero_stacks)
+            update_session_financials(conn, session_id, hero_buy_in, hero_cash_out)
+            logger.debug(
+                "Session %d financials: buy_in=%s, cash_out=%s",
+                session_id,
+                hero_buy_in,
+                hero_cash_out,
+            )
+        if owns_txn:
+            conn.commit()
+        else:
+            conn.execute("RELEASE ingest_file")
+    except BaseException:
+        if owns_txn:
             conn.rollback()
-            result.failed += 1
-            result.errors.append(str(exc))
-            logger.error("Failed to ingest hand from %s: %s", path.name, exc)
-
-    # Clean up orphaned session if no hands were successfully inserted (M3).
-    if not session_committed:
-        conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
-        conn.commit()
-        logger.warning("Removed orphaned session %d (no hands ingested)", session_id)
-    elif hero_buy_in is not None and hero_cash_out is not None:
-        update_session_financials(conn, session_id, hero_buy_in, hero_cash_out)
-        conn.commit()
-        logger.debug(
-            "Session %d financials: buy_in=%s, cash_out=%s",
-            session_id,
-            hero_buy_in,
-            hero_cash_out,
-        )
+        else:
+            conn.execute("ROLLBACK TO ingest_file")
+            conn.execute("RELEASE ingest_file")
+        raise
 
     logger.info(
         "Ingestion complete — %s: %d ingested, %d skipped, %d failed",
-        path.name,
+        name,
         result.ingested,
         result.skipped,
         result.failed,
@@ -153,7 +251,8 @@ def ingest_directory(
 ) -> list[IngestResult]:
     """Ingest all .txt files in a directory.
 
-    Files are processed in sorted order. Non-.txt files are ignored.
+    Files are processed in sorted order. Non-.txt files are ignored. One
+    HandParser is shared by every file.
 
     Args:
         dir_path: Path to the directory containing .txt session files.
@@ -163,7 +262,8 @@ def ingest_directory(
     Returns:
         List of IngestResult, one per .txt file found.
     """
+    parser = HandParser(hero_username=hero_username)
     return [
-        ingest_file(txt_file, hero_username, conn)
+        ingest_file(txt_file, hero_username, conn, parser=parser)
         for txt_file in sorted(Path(dir_path).glob("*.txt"))
     ]
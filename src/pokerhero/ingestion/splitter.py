@@ -1,15 +1,43 @@
 """Utility for splitting a multi-hand PokerStars session file into individual
 hand blocks."""
 
-import re
+from collections.abc import Iterator
+
+_HAND_MARKER = "PokerStars Hand #"
+
+
+def iter_hands(text: str) -> Iterator[str]:
+    """Yield the hand blocks of a raw session file one at a time.
+
+    Each block starts with 'PokerStars Hand #' and runs up to the next
+    marker (or the end of the text). Blocks are stripped of surrounding
+    whitespace; anything before the first marker is discarded. Line endings
+    are normalised to ``\\n`` before splitting.
+
+    Unlike a ``re.split`` over the whole file, only the current block is
+    materialised, so callers that consume blocks lazily never hold a second
+    copy of the file as a list of substrings.
+
+    Args:
+        text: Raw text content of a PokerStars .txt session file.
+
+    Yields:
+        Hand block strings in file order.
+    """
+    # Most exports are already LF-only; skip both full-text copies for them.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    start = text.find(_HAND_MARKER)
+    while start != -1:
+        end = text.find(_HAND_MARKER, start + 1)
+        yield text[start : end if end != -1 else len(text)].strip()
+        start = end
 
 
 def split_hands(text: str) -> list[str]:
-    """Split a raw session file into individual hand blocks.
+    """Split a raw session file into a list of individual hand blocks.
 
-    Each block starts with 'PokerStars Hand #'. Blocks are stripped of
-    leading/trailing whitespace and empty blocks are discarded.
-    Line endings are normalised to ``\\n`` before splitting.
+    Eager form of :func:`iter_hands`; see it for the splitting rules.
 
     Args:
         text: Raw text content of a PokerStars .txt session file.
@@ -17,6 +45,4 @@ def split_hands(text: str) -> list[str]:
     Returns:
         List of hand block strings, one per hand. Empty list if no hands found.
     """
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    blocks = re.split(r"(?=PokerStars Hand #)", text)
-    return [b.strip() for b in blocks if b.strip().startswith("PokerStars Hand #")]
+    return list(iter_hands(text))
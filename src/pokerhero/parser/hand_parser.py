@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import re
+import sys
+import types
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from decimal import Decimal
-from typing import TypedDict
+from typing import Literal, TypedDict, final
 
 from pokerhero.parser.models import (
     ActionData,
+    ActionType,
     HandData,
     HandPlayerData,
     ParsedHand,
     SessionData,
+    Street,
 )
 
 # ---------------------------------------------------------------------------
@@ -35,13 +43,14 @@ class _HandMeta(TypedDict):
 
 
 class _RawAction(TypedDict):
+    # Amounts are integer cents (see _to_cents) until ActionData is built.
     seq: int
     player: str
-    street: str
-    action_type: str
-    amount: Decimal
-    amount_to_call: Decimal
-    pot_before: Decimal
+    street: Street
+    action_type: ActionType
+    amount: int
+    amount_to_call: int
+    pot_before: int
     is_all_in: bool
 
 
@@ -59,63 +68,129 @@ class _SummaryData(TypedDict):
 # Regex patterns
 # ---------------------------------------------------------------------------
 
-_RE_CASH_HEADER = re.compile(
-    r"PokerStars Hand #(\d+):\s+Hold'em No Limit"
-    r" \(([€$])?(\d+(?:\.\d+)?)/[€$]?(\d+(?:\.\d+)?)(?:\s+[A-Z]+)?\)"
-    r" - (\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})"
+# These use the standard-library engine on purpose. Compiled with google-re2
+# instead (same patterns, identical parse output) the parser ran about 4x
+# slower: each line is short, so RE2's per-call wrapper overhead outweighs its
+# linear-time matching. None of the patterns backtracks super-linearly.
+# A Hyperscan database over the body patterns was also tried: scanning a whole
+# hand costs ~12 us on its own and reports only match offsets, so every line
+# would still need a ``re`` pass for its captures. Most body lines are already
+# classified by plain string checks before any regex runs (see _parse_body).
+# All are compiled with re.ASCII: amounts and timestamps use ASCII digits, so
+# \d and \s need not consult the Unicode tables (names are matched by
+# negated classes and are unaffected).
+
+# Tournament and cash headers in one alternation, so the hand line is scanned
+# once; ``lastgroup`` ("tourn" / "cash") tells which form matched.
+_RE_HEADER = re.compile(
+    r"PokerStars Hand #(?:"
+    r"(?P<tourn>(?P<t_hand_id>\d+): Tournament #(?P<tourn_id>\d+),"
+    r" [\d+]+ Hold'em No Limit"
+    r" - (?P<level>Level [IVX]+) \((?P<t_sb>\d+)/(?P<t_bb>\d+)\)"
+    r" - (?P<t_ts>\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}))"
+    r"|(?P<cash>(?P<c_hand_id>\d+):\s+Hold'em No Limit"
+    r" \((?P<currency>[€$])?(?P<c_sb>\d+(?:\.\d+)?)/[€$]?(?P<c_bb>\d+(?:\.\d+)?)"
+    r"(?:\s+[A-Z]+)?\)"
+    r" - (?P<c_ts>\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}))"
+    r")",
+    re.ASCII,
 )
-_RE_TOURN_HEADER = re.compile(
-    r"PokerStars Hand #(\d+): Tournament #(\d+), [\d+]+ Hold'em No Limit"
-    r" - (Level [IVX]+) \((\d+)/(\d+)\)"
-    r" - (\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})"
+_RE_TABLE = re.compile(r"Table '(.+?)' (\d+)-max.*Seat #(\d+) is the button", re.ASCII)
+_RE_SEAT = re.compile(
+    r"Seat (\d+): (.+?) \([€$]?(\d+(?:\.\d+)?) in chips\)(.*)", re.ASCII
 )
-_RE_TABLE = re.compile(r"Table '(.+?)' (\d+)-max.*Seat #(\d+) is the button")
-_RE_SEAT = re.compile(r"Seat (\d+): (.+?) \([€$]?(\d+(?:\.\d+)?) in chips\)(.*)")
+# The body-line patterns carry no leading "^": they are only used via
+# ``match`` (directly or through ``_RE_BODY``), which already anchors there.
+# PokerStars screen names cannot contain ":", so "<name>: " prefixes use a
+# greedy ``[^:\n]+`` that stops at the first colon instead of a lazy ``.+?``
+# that re-tests ": " after every character.
 _RE_POST_BLIND = re.compile(
-    r"^(.+?): posts (?:small blind|big blind|small & big blinds) [€$]?(\d+(?:\.\d+)?)"
+    r"([^:\n]+): posts (?:small blind|big blind|small & big blinds)"
+    r" [€$]?(\d+(?:\.\d+)?)",
+    re.ASCII,
 )
-_RE_POST_ANTE = re.compile(r"^(.+?): posts the ante [€$]?(\d+(?:\.\d+)?)")
-_RE_DEALT = re.compile(r"Dealt to (.+?) \[(.+?)\]")
+_RE_POST_ANTE = re.compile(r"([^:\n]+): posts the ante [€$]?(\d+(?:\.\d+)?)", re.ASCII)
 _RE_ACTION = re.compile(
-    r"^(.+?): (folds|checks|calls|bets|raises)"
-    r"(?: [€$]?(\d+(?:\.\d+)?))?(?: to [€$]?(\d+(?:\.\d+)?))?(?: and is all-in)?"
+    r"([^:\n]+): (folds|checks|calls|bets|raises)"
+    r"(?: [€$]?(\d+(?:\.\d+)?))?(?: to [€$]?(\d+(?:\.\d+)?))?(?: and is all-in)?",
+    re.ASCII,
 )
-_RE_ALLIN = re.compile(r"and is all-in")
-_RE_UNCALLED = re.compile(r"Uncalled bet \([€$]?(\d+(?:\.\d+)?)\) returned to (.+)")
 _RE_COLLECTED = re.compile(
-    r"^(.+?) collected [€$]?(\d+(?:\.\d+)?) from (?:pot|main pot|side pot)"
+    r"(.+?) collected [€$]?(\d+(?:\.\d+)?) from (?:pot|main pot|side pot)",
+    re.ASCII,
 )
 _RE_SUMMARY_POT = re.compile(
-    r"Total pot [€$]?(\d+(?:\.\d+)?).*\| Rake [€$]?(\d+(?:\.\d+)?)"
+    r"Total pot [€$]?(\d+(?:\.\d+)?).*\| Rake [€$]?(\d+(?:\.\d+)?)",
+    re.ASCII,
 )
-_RE_BOARD = re.compile(r"Board \[(.+?)\]")
+_RE_BOARD = re.compile(r"Board \[(.+?)\]", re.ASCII)
 _RE_SUMMARY_SEAT = re.compile(
     r"Seat \d+: (.+?) (?:showed \[(.+?)\] and (won|lost)"
-    r"|mucked \[(.+?)\]|collected \((\d+(?:\.\d+)?)\)|(folded|didn't))"
+    r"|mucked \[(.+?)\]|collected \((\d+(?:\.\d+)?)\)|(folded|didn't))",
+    re.ASCII,
 )
-_RE_SUMMARY_WON = re.compile(r"showed \[.+?\] and won \([€$]?([\d.]+)\)")
-_RE_SUMMARY_COLLECTED = re.compile(r"collected \([€$]?([\d.]+)\)")
-_RE_MUCKS_SHOWDOWN = re.compile(r"^(.+?): mucks hand")
-_RE_SHOWS_SHOWDOWN = re.compile(r"^(.+?): shows \[(.+?)\]")
-_RE_MUCKED_SUMMARY = re.compile(r"mucked \[(.+?)\]")
-_RE_TIMESTAMP = re.compile(r"(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})")
-
-# Lines that should be silently ignored (produce no action)
-_NOISE_PATTERNS = [
-    re.compile(p)
-    for p in [
-        r"^.+ is disconnected",
-        r"^.+ has timed out(?: while disconnected)?$",
-        r"^.+ leaves the table",
-        r"^.+ joins the table at seat #\d+",
-        r"^.+ will be allowed to play after the button",
-        r"^.+ out of hand \(",
-        r"^.+: doesn't show hand",
-        r"^\*\*\*",
-    ]
-]
-
-_STREET_MARKERS = {
+_RE_SUMMARY_WON = re.compile(r"showed \[.+?\] and won \([€$]?([\d.]+)\)", re.ASCII)
+_RE_SUMMARY_COLLECTED = re.compile(r"collected \([€$]?([\d.]+)\)", re.ASCII)
+_RE_MUCKS_SHOWDOWN = re.compile(r"([^:\n]+): mucks hand", re.ASCII)
+_RE_SHOWS_SHOWDOWN = re.compile(r"([^:\n]+): shows \[(.+?)\]", re.ASCII)
+_RE_MUCKED_SUMMARY = re.compile(r"mucked \[(.+?)\]", re.ASCII)
+_RE_SHOWED_SUMMARY = re.compile(r"showed \[(.+?)\]", re.ASCII)
+_RE_TIMESTAMP = re.compile(r"(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})", re.ASCII)
+
+# Lines that should be silently ignored (produce no action). Each marker is a
+# fixed literal, so plain substring tests (C-level string search) replace the
+# old "^.+ <literal>" regexes, which scanned and backtracked over every line.
+_NOISE_SUBSTR: tuple[str, ...] = (
+    " is disconnected",
+    " leaves the table",
+    " joins the table at seat #",
+    " will be allowed to play after the button",
+    " out of hand (",
+    ": doesn't show hand",
+)
+_NOISE_SUFFIX: tuple[str, ...] = (
+    " has timed out",
+    " has timed out while disconnected",
+)
+
+# The remaining body-line patterns folded into one alternation; one ``match``
+# per line replaces a cascade of per-kind regexes. "Dealt to" and "Uncalled
+# bet" lines have fixed prefixes and are split with string operations instead
+# (_split_dealt / _split_uncalled), and plain collected lines are skipped
+# before matching, so the alternatives are ordered by how often the remaining
+# lines hit them. The kinds are disjoint, so the order does not change which
+# one matches. The outer named group closes last, so ``lastgroup`` names the
+# kind that matched and ``lastindex`` is its group number; that pattern's own
+# captures follow at offsets +1, +2, ...
+_BODY_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("blind", _RE_POST_BLIND.pattern),
+    ("ante", _RE_POST_ANTE.pattern),
+    ("shows", _RE_SHOWS_SHOWDOWN.pattern),
+    ("mucks", _RE_MUCKS_SHOWDOWN.pattern),
+    ("collected", _RE_COLLECTED.pattern),
+    ("action", _RE_ACTION.pattern),
+)
+_RE_BODY = re.compile(
+    "|".join(f"(?P<{tag}>{pat})" for tag, pat in _BODY_PATTERNS), re.ASCII
+)
+
+# Verbs that make "<name>: <verb> ..." a regular action line. Action lines are
+# the bulk of a hand body and sit last in _RE_BODY, so they are recognised up
+# front and split with string operations (_split_action_amounts).
+_ACTION_VERBS = frozenset({"folds", "checks", "calls", "bets", "raises"})
+
+# "<name>: posts <prefix><amount>" layouts and the kind each one records.
+_POST_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("small blind ", "blind"),
+    ("big blind ", "blind"),
+    ("the ante ", "ante"),
+    ("small & big blinds ", "blind"),
+)
+
+# Shared zero amount; Decimal is immutable, so one instance serves every default.
+_ZERO = Decimal("0")
+
+_STREET_MARKERS: dict[str, Street | Literal["SUMMARY"]] = {
     "*** HOLE CARDS ***": "PREFLOP",
     "*** FLOP ***": "FLOP",
     "*** TURN ***": "TURN",
@@ -126,37 +201,212 @@ _STREET_MARKERS = {
 
 
 def _is_noise(line: str) -> bool:
-    return any(p.match(line) for p in _NOISE_PATTERNS)
+    return (
+        line.startswith("***")
+        or line.endswith(_NOISE_SUFFIX)
+        or any(marker in line for marker in _NOISE_SUBSTR)
+    )
+
+
+def _split_dealt(line: str) -> tuple[str, str] | None:
+    """Split ``Dealt to NAME [CARDS]`` into ``(NAME, CARDS)``.
+
+    The name runs up to the first ``" ["`` and the cards up to the next
+    ``"]"``, so ``Dealt to Mr [Big] Shot [Ts 9s]`` gives ``("Mr", "Big")``.
+    Returns ``None`` if the line lacks a non-empty card list (e.g. other
+    players in Zoom hands).
+    """
+    bracket = line.find(" [", 10)
+    if bracket < 0:
+        return None
+    close = line.find("]", bracket + 3)
+    if close < 0:
+        return None
+    return line[9:bracket], line[bracket + 2 : close]
+
+
+def _amount_token(token: str) -> str | None:
+    """Return *token* without its currency symbol if it is a plain amount.
+
+    An amount is digits with an optional decimal part (``\\d+(?:\\.\\d+)?``
+    in the regexes); anything else gives ``None``.
+    """
+    if token[:1] in ("€", "$"):
+        token = token[1:]
+    whole, dot, frac = token.partition(".")
+    if not whole.isdecimal() or (dot and not frac.isdecimal()):
+        return None
+    return token
+
+
+def _split_action_amounts(tail: str) -> tuple[str | None, str | None]:
+    """Split the text after an action verb into its amounts.
+
+    ``"0.50"`` (calls/bets), ``"1 to 3"`` (raises) and ``""`` (folds/checks)
+    give ``("0.50", None)``, ``("1", "3")`` and ``(None, None)``; a trailing
+    ``"and is all-in"`` is ignored.
+    """
+    parts = tail.split(" ", 3)
+    first = _amount_token(parts[0]) if parts[0] else None
+    i = 0 if first is None else 1
+    second = None
+    if len(parts) > i + 1 and parts[i] == "to":
+        second = _amount_token(parts[i + 1])
+    return first, second
+
+
+def _split_post(rest: str) -> tuple[str, str] | None:
+    """Classify the text after ``"<name>: posts "`` as a blind or ante post.
+
+    Mirrors ``_RE_POST_BLIND`` / ``_RE_POST_ANTE``: returns ``("blind", amount)``
+    or ``("ante", amount)``, or ``None`` if the layout is not recognised.
+    """
+    for prefix, kind in _POST_PREFIXES:
+        if rest.startswith(prefix):
+            amount = _amount_token(rest[len(prefix) :].split(" ", 1)[0])
+            return None if amount is None else (kind, amount)
+    return None
+
+
+def _split_bracketed(rest: str) -> str | None:
+    """Return the text inside a leading ``[...]`` (e.g. shown cards), or ``None``."""
+    if not rest.startswith("["):
+        return None
+    close = rest.find("]", 2)
+    return None if close < 0 else rest[1:close]
+
+
+def _split_uncalled(line: str) -> tuple[str, str] | None:
+    """Split ``Uncalled bet (AMOUNT) returned to NAME`` into ``(AMOUNT, NAME)``.
+
+    An optional currency symbol is dropped and the amount must be digits with
+    an optional decimal part; the name is the rest of the line, stripped.
+    Anything else (including an empty name) gives ``None``.
+    """
+    close = line.find(") returned to ", 14)
+    if close < 0 or close + 14 >= len(line):
+        return None
+    amount = _amount_token(line[14:close])
+    if amount is None:
+        return None
+    return amount, line[close + 14 :].strip()
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_date(date_str: str) -> tuple[int, int, int]:
+    """Split a ``YYYY/MM/DD`` date into ints; a session repeats the same day."""
+    return int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
 
 
 def _parse_timestamp(ts_str: str) -> datetime:
-    return datetime.strptime(ts_str, "%Y/%m/%d %H:%M:%S")
+    """Parse a header timestamp ``YYYY/MM/DD HH:MM:SS``.
+
+    The header regexes only capture this fixed layout, so slicing the fields
+    directly is safe and avoids ``strptime``'s format/locale machinery.
+    Out-of-range fields still raise ``ValueError`` from ``datetime``.
+    """
+    year, month, day = _parse_date(ts_str[:10])
+    return datetime(
+        year,
+        month,
+        day,
+        int(ts_str[11:13]),
+        int(ts_str[14:16]),
+        int(ts_str[17:19]),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _dec(amount: str) -> Decimal:
+    """Build a ``Decimal`` from an amount string, reusing repeated values.
+
+    Stacks, blinds and pot sizes recur across a session, and ``Decimal``
+    values are immutable, so each distinct string is parsed only once.
+    """
+    return Decimal(amount)
+
+
+def _to_cents(amount: str) -> int:
+    """Convert a PokerStars amount string (at most 2 decimals) to integer cents.
+
+    ``_parse_body`` keeps its running totals in cents because ``int``
+    arithmetic is much cheaper than ``Decimal`` for these small values.
+    """
+    dot = amount.find(".")
+    if dot < 0:
+        return int(amount) * 100
+    return int(amount[:dot] or "0") * 100 + int(amount[dot + 1 : dot + 3].ljust(2, "0"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a ``Decimal`` amount.
+
+    Cached because the same handful of stake-sized amounts recur on almost
+    every action line, and ``Decimal`` values are immutable.
+    """
+    return Decimal(cents) / 100
+
+
+def _summary_username(line: str, marker: str) -> str:
+    """Return the username on a summary seat line, e.g. ``Seat 3: Bob (button)``.
+
+    The name sits between ``"Seat N: "`` and *marker*; a trailing position
+    tag such as ``(button)`` or ``(small blind)`` is dropped. Plain string
+    operations are used since the layout is fixed.
+    """
+    name = line.split(": ", 1)[1].split(marker)[0].strip()
+    if name.endswith(")"):
+        open_idx = name.rfind("(")
+        tag = name[open_idx + 1 : -1]
+        if open_idx >= 0 and tag and ")" not in tag:
+            name = name[:open_idx].rstrip()
+    return name
+
+
+# First line of every hand block in a session file.
+_HAND_MARKER = "PokerStars Hand #"
+
+# Position labels clockwise from the button, by number of seated players.
+_LABELS_BY_COUNT: dict[int, tuple[str, ...]] = {
+    2: ("BTN", "BB"),
+    3: ("BTN", "SB", "BB"),
+    4: ("BTN", "SB", "BB", "UTG"),
+    5: ("BTN", "SB", "BB", "UTG", "CO"),
+    6: ("BTN", "SB", "BB", "UTG", "MP", "CO"),
+    7: ("BTN", "SB", "BB", "UTG", "MP", "MP+1", "CO"),
+    8: ("BTN", "SB", "BB", "UTG", "UTG+1", "MP", "MP+1", "CO"),
+    9: ("BTN", "SB", "BB", "UTG", "UTG+1", "MP", "MP+1", "CO", "HJ"),
+}
+
 
+@functools.lru_cache(maxsize=4096)
+def _positions_for_seats(
+    seat_order: tuple[int, ...], btn_seat: int
+) -> Mapping[int, str]:
+    """Assign position labels clockwise from BTN for the given seat list.
 
-def _positions_for_seats(seat_order: list[int], btn_seat: int) -> dict[int, str]:
-    """Assign position labels clockwise from BTN for the given seat list."""
+    Cached because a table's seating and button rotation repeat hand after
+    hand. The mapping is shared between calls, so it is returned read-only.
+    """
     n = len(seat_order)
     if n == 0:
-        return {}
+        return types.MappingProxyType({})
 
-    btn_idx = seat_order.index(btn_seat) if btn_seat in seat_order else 0
+    try:
+        btn_idx = seat_order.index(btn_seat)
+    except ValueError:
+        btn_idx = 0
     # Rotate so BTN is first
     rotated = seat_order[btn_idx:] + seat_order[:btn_idx]
 
-    labels_by_count = {
-        2: ["BTN", "BB"],
-        3: ["BTN", "SB", "BB"],
-        4: ["BTN", "SB", "BB", "UTG"],
-        5: ["BTN", "SB", "BB", "UTG", "CO"],
-        6: ["BTN", "SB", "BB", "UTG", "MP", "CO"],
-        7: ["BTN", "SB", "BB", "UTG", "MP", "MP+1", "CO"],
-        8: ["BTN", "SB", "BB", "UTG", "UTG+1", "MP", "MP+1", "CO"],
-        9: ["BTN", "SB", "BB", "UTG", "UTG+1", "MP", "MP+1", "CO", "HJ"],
-    }
-    labels = labels_by_count.get(n, [f"P{i}" for i in range(n)])
-    return {seat: labels[i] for i, seat in enumerate(rotated)}
+    labels = _LABELS_BY_COUNT.get(n)
+    if labels is None:
+        labels = tuple(f"P{i}" for i in range(n))
+    return types.MappingProxyType(dict(zip(rotated, labels)))
 
 
+@final
 class HandParser:
     """Parse a single PokerStars hand history text block."""
 
@@ -164,19 +414,91 @@ class HandParser:
         self.hero = hero_username
 
     def parse(self, text: str) -> ParsedHand:
-        lines = [ln.rstrip() for ln in text.splitlines()]
-        lines = [ln for ln in lines if ln]  # drop blank lines
+        return self.parse_lines(text.splitlines())
+
+    def parse_many(
+        self, texts: list[str], workers: int | None = None
+    ) -> list[ParsedHand]:
+        """Parse many hand blocks across worker processes.
+
+        Parsing is pure-Python regex and Decimal work that holds the GIL, so
+        threads would not help; processes scale with cores. The parser
+        carries only the hero name, so shipping it to workers is cheap.
+
+        Args:
+            texts: Hand history blocks, one hand each.
+            workers: Worker process count (default: ``os.cpu_count()``).
+                With ``1`` or a single text, parsing runs in-process.
+
+        Returns:
+            Parsed hands in the same order as *texts*.
+
+        Raises:
+            ValueError: If a block cannot be parsed; as with :meth:`parse`,
+                the first failing block in order is the one reported.
+        """
+        if workers == 1 or len(texts) <= 1:
+            return [self.parse(text) for text in texts]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.parse, texts, chunksize=64))
+
+    def parse_stream(self, raw_lines: Iterable[str]) -> Iterator[ParsedHand]:
+        """Parse a whole session one hand at a time from a line source.
+
+        A new hand starts at each line beginning with ``"PokerStars Hand #"``;
+        anything before the first such line is ignored. Only the current
+        hand's lines are held in memory, so a file object can be streamed
+        without reading the session into one string first.
+
+        Args:
+            raw_lines: Lines of a session, e.g. a text file opened with
+                ``encoding="utf-8-sig"``.
+
+        Yields:
+            Parsed hands in file order.
+
+        Raises:
+            ValueError: If a hand cannot be parsed; iteration stops there.
+        """
+        hand_lines: list[str] = []
+        for line in raw_lines:
+            if line.startswith(_HAND_MARKER):
+                if hand_lines:
+                    yield self.parse_lines(hand_lines)
+                hand_lines = [line]
+            elif hand_lines:
+                hand_lines.append(line)
+        if hand_lines:
+            yield self.parse_lines(hand_lines)
+
+    def parse_lines(self, raw_lines: Iterable[str]) -> ParsedHand:
+        """Parse one hand given as an iterable of lines.
+
+        Accepts any line source (a list, a file object positioned at a hand,
+        a generator) so callers need not join a hand into one string first.
+        Line endings and surrounding whitespace are ignored.
+        """
+        # Strip once here; the section parsers work on the stripped lines
+        # directly. Blank lines are dropped.
+        lines = [s for s in (ln.strip() for ln in raw_lines) if s]
 
+        # Each section parser stops where the next section starts, so the
+        # body and summary are walked once rather than by every parser.
         session, hand_meta = self._parse_headers(lines)
-        seats = self._parse_seats(lines)
+        seats, body_start = self._parse_seats(lines)
         (
             actions_raw,
             showdown_cards,
             showdown_players,
             total_committed,
             uncalled_bet_total,
-        ) = self._parse_body(lines, session, seats)
-        summary = self._parse_summary(lines)
+            summary_start,
+            ante,
+        ) = self._parse_body(lines, seats, body_start)
+        if ante:
+            # SessionData is frozen; the ante is only known from the posts.
+            session = dataclasses.replace(session, ante=ante)
+        summary = self._parse_summary(lines, summary_start)
 
         # Merge showdown cards into seats
         for username, cards in showdown_cards.items():
@@ -210,28 +532,24 @@ class HandParser:
         hand_line = lines[0]
         table_line = lines[1]
 
-        # Tournament?
-        m_tourn = _RE_TOURN_HEADER.search(hand_line)
-        if m_tourn:
-            hand_id = m_tourn.group(1)
-            tourn_id = m_tourn.group(2)
-            level = m_tourn.group(3)
-            sb = Decimal(m_tourn.group(4))
-            bb = Decimal(m_tourn.group(5))
-            ts = _parse_timestamp(m_tourn.group(6))
+        m = _RE_HEADER.search(hand_line)
+        if m is None:
+            raise ValueError(f"Cannot parse hand header: {hand_line!r}")
+        if m.lastgroup == "tourn":
+            hand_id = m["t_hand_id"]
+            sb = _dec(m["t_sb"])
+            bb = _dec(m["t_bb"])
+            ts = _parse_timestamp(m["t_ts"])
             is_tournament = True
-            tournament_id = tourn_id
-            tournament_level = level
+            tournament_id = m["tourn_id"]
+            tournament_level = m["level"]
             currency = "PLAY"
         else:
-            m_cash = _RE_CASH_HEADER.search(hand_line)
-            if not m_cash:
-                raise ValueError(f"Cannot parse hand header: {hand_line!r}")
-            hand_id = m_cash.group(1)
-            currency_sym = m_cash.group(2)  # "€", "$", or None for play money
-            sb = Decimal(m_cash.group(3))
-            bb = Decimal(m_cash.group(4))
-            ts = _parse_timestamp(m_cash.group(5))
+            hand_id = m["c_hand_id"]
+            currency_sym = m["currency"]  # "€", "$", or None for play money
+            sb = _dec(m["c_sb"])
+            bb = _dec(m["c_bb"])
+            ts = _parse_timestamp(m["c_ts"])
             is_tournament = False
             tournament_id = None
             tournament_level = None
@@ -255,7 +573,7 @@ class HandParser:
             limit_type="NL",
             small_blind=sb,
             big_blind=bb,
-            ante=Decimal("0"),  # updated later from ante posts
+            ante=_ZERO,  # updated later from ante posts
             max_seats=max_seats,
             is_tournament=is_tournament,
             tournament_id=tournament_id,
@@ -267,7 +585,7 @@ class HandParser:
             "hand_id": hand_id,
             "timestamp": ts,
             "button_seat": button_seat,
-            "uncalled_bet": Decimal("0"),
+            "uncalled_bet": _ZERO,
         }
         return session, hand_meta
 
@@ -275,15 +593,29 @@ class HandParser:
     # Seat parsing
     # ------------------------------------------------------------------
 
-    def _parse_seats(self, lines: list[str]) -> dict[str, _SeatInfo]:
-        """Return {username: {seat, starting_stack, hole_cards, sitting_out}}."""
+    def _parse_seats(self, lines: list[str]) -> tuple[dict[str, _SeatInfo], int]:
+        """Parse the seat lines that follow the two header lines.
+
+        Seat lines precede the first ``***`` marker, so the scan stops there.
+
+        Returns:
+            ``({username: {seat, starting_stack, hole_cards, sitting_out}},
+            body_start)``, where *body_start* is the index just past the last
+            seat line (2 when there are none); ``_parse_body`` starts there.
+        """
         seats: dict[str, _SeatInfo] = {}
-        for line in lines:
+        body_start = 2
+        for idx, line in enumerate(lines[2:], 2):
+            if line.startswith("***"):
+                break
             m = _RE_SEAT.match(line)
             if m:
+                body_start = idx + 1
                 seat_num = int(m.group(1))
-                username = m.group(2).strip()
-                stack = Decimal(m.group(3))
+                # Interned: a session repeats the same few names on every
+                # hand, so all its records can share one string per player.
+                username = sys.intern(m.group(2).strip())
+                stack = _dec(m.group(3))
                 flags = m.group(4)
                 sitting_out = "sitting out" in flags or "out of hand" in flags
                 seats[username] = {
@@ -292,7 +624,7 @@ class HandParser:
                     "hole_cards": None,
                     "sitting_out": sitting_out,
                 }
-        return seats
+        return seats, body_start
 
     # ------------------------------------------------------------------
     # Body parsing
@@ -301,230 +633,256 @@ class HandParser:
     def _parse_body(
         self,
         lines: list[str],
-        session: SessionData,
         seats: dict[str, _SeatInfo],
-    ) -> tuple[list[_RawAction], dict[str, str], set[str], dict[str, Decimal], Decimal]:
+        start: int,
+    ) -> tuple[
+        list[_RawAction],
+        dict[str, str],
+        set[str],
+        dict[str, Decimal],
+        Decimal,
+        int,
+        Decimal,
+    ]:
         """
-        Walk the hand body and collect:
+        Walk the hand body from index *start* (just past the seat lines, as
+        returned by ``_parse_seats``) and collect:
         - actions_raw: list of raw action dicts
         - showdown_cards: {username: cards_str} for cards revealed at showdown
         - showdown_players: set of usernames that reached showdown
         - total_committed: {username: total chips invested}
         - uncalled_bet_total: total uncalled bet returned
+        - summary_start: index of the ``*** SUMMARY ***`` line (len(lines) if
+          there is none), where ``_parse_summary`` picks up
+        - ante: the first ante posted (0 if there were none)
         """
         actions_raw: list[_RawAction] = []
         showdown_cards: dict[str, str] = {}
         showdown_players: set[str] = set()
 
-        current_street = "PREFLOP"
+        current_street: Street = "PREFLOP"
         seq = 0
-        pot = Decimal("0")
+        # Running totals and raw action amounts are integer cents (see
+        # _to_cents); the returned totals are converted back to Decimal via
+        # _from_cents, and raw actions in _build_actions.
+        # The per-player dicts are plain dicts updated via .get(key, 0):
+        # defaultdict measured slower here, as subscripting a dict subclass
+        # misses CPython's specialised dict fast path.
+        pot = 0
         # Track per-street facing bet (for amount_to_call)
-        street_bet: Decimal = Decimal("0")
+        street_bet = 0
         # Track each player's total committed this street (for is_all_in detection)
-        street_committed: dict[str, Decimal] = {}
+        street_committed: dict[str, int] = {}
         # Track each player's total stack committed across all streets
-        total_committed: dict[str, Decimal] = {}
+        total_committed: dict[str, int] = {}
         # Track uncalled bets returned
-        uncalled_bet_total: Decimal = Decimal("0")
+        uncalled_bet_total = 0
         # Track whether current street has an all-in bet/raise pending
         facing_allin: bool = False
 
         # Natural SB/BB posters (first two blind posts)
         blind_posters: list[str] = []
-        ante_amount: Decimal = Decimal("0")
-
-        in_summary = False
-
-        for line in lines[2:]:  # skip hand + table header lines
-            stripped = line.strip()
+        ante_amount = 0
 
+        summary_start = len(lines)
+        for idx, line in enumerate(lines[start:], start):
             # --- Street transitions ---
-            for marker, street in _STREET_MARKERS.items():
-                if stripped.startswith(marker):
-                    if street == "SUMMARY":
-                        in_summary = True
-                    elif street != current_street:
-                        current_street = street
-                        street_bet = Decimal("0")
-                        street_committed = {}
-                        facing_allin = False
-                    break
-
-            if in_summary:
-                continue
-
-            if _is_noise(stripped):
+            # Only "***" lines can be markers; the marker is the text up to
+            # the closing " ***" (e.g. "*** FLOP *** [..]" -> "*** FLOP ***").
+            if line.startswith("***"):
+                close = line.find(" ***", 3)
+                street = _STREET_MARKERS.get(line[: close + 4]) if close > 0 else None
+                if street == "SUMMARY":
+                    summary_start = idx
+                    break  # the summary section has no body lines
+                if street is not None and street != current_street:
+                    current_street = street
+                    street_bet = 0
+                    street_committed = {}
+                    facing_allin = False
                 continue
 
-            # --- Dealt to hero ---
-            m_dealt = _RE_DEALT.match(stripped)
-            if m_dealt:
-                username = m_dealt.group(1)
-                if username in seats:
-                    seats[username]["hole_cards"] = m_dealt.group(2)
-                continue
-
-            # --- Uncalled bet ---
-            m_unc = _RE_UNCALLED.match(stripped)
-            if m_unc:
-                unc_amount = Decimal(m_unc.group(1))
-                unc_player = m_unc.group(2).strip()
-                pot -= unc_amount
-                uncalled_bet_total += unc_amount
-                total_committed[unc_player] = (
-                    total_committed.get(unc_player, Decimal("0")) - unc_amount
-                )
+            if _is_noise(line):
                 continue
 
-            # --- Collected (non-summary) ---
-            m_coll = _RE_COLLECTED.match(stripped)
-            if m_coll:
-                continue  # ignore mid-hand collected lines
-
-            # --- Showdown ---
-            m_shows = _RE_SHOWS_SHOWDOWN.match(stripped)
-            if m_shows:
-                username = m_shows.group(1).strip()
-                showdown_players.add(username)
-                cards = m_shows.group(2)
-                if len(cards.split()) == 2:  # only store complete 2-card hands
-                    showdown_cards[username] = cards
-                continue
-
-            m_mucks = _RE_MUCKS_SHOWDOWN.match(stripped)
-            if m_mucks:
-                showdown_players.add(m_mucks.group(1).strip())
-                continue
+            # Action lines ("<name>: <verb> ...") are split with string
+            # operations; every other kind goes through _RE_BODY.
+            colon = line.find(": ")
+            verb = line[colon + 2 :].split(" ", 1)[0] if colon > 0 else ""
+            if verb in _ACTION_VERBS:
+                # --- Regular actions ---
+                username = line[:colon].strip()
+                amt1, amt2 = _split_action_amounts(line[colon + 3 + len(verb) :])
+            else:
+                if line.startswith("Dealt to "):
+                    # --- Dealt to hero ---
+                    dealt = _split_dealt(line)
+                    if dealt is not None and dealt[0] in seats:
+                        seats[dealt[0]]["hole_cards"] = dealt[1]
+                    continue
+                if line.startswith("Uncalled bet ("):
+                    # --- Uncalled bet ---
+                    uncalled = _split_uncalled(line)
+                    if uncalled is not None:
+                        unc_amount = _to_cents(uncalled[0])
+                        unc_player = uncalled[1]
+                        pot -= unc_amount
+                        uncalled_bet_total += unc_amount
+                        total_committed[unc_player] = (
+                            total_committed.get(unc_player, 0) - unc_amount
+                        )
+                    continue
+                if colon < 0 and " collected " in line:
+                    continue  # ignore mid-hand collected lines
+
+                # Posts and showdown lines are split by verb; _RE_BODY covers
+                # anything these fixed layouts do not recognise.
+                tag: str | None = None
+                value: str | None = None
+                if verb == "posts":
+                    post = _split_post(line[colon + 8 :])
+                    if post is not None:
+                        tag, value = post
+                elif verb == "shows":
+                    cards_str = _split_bracketed(line[colon + 8 :])
+                    if cards_str is not None:
+                        tag, value = "shows", cards_str
+                elif verb == "mucks" and line.startswith("hand", colon + 8):
+                    tag = "mucks"
+                if tag is not None:
+                    username = line[:colon].strip()
+                else:
+                    m = _RE_BODY.match(line)
+                    if m is None:
+                        continue
+                    tag = m.lastgroup
+                    g = m.lastindex or 0
+                    username = m.group(g + 1).strip()
+                    if tag == "action":
+                        # --- Regular actions the verb screen did not catch ---
+                        verb = m.group(g + 2)
+                        amt1 = m.group(g + 3)
+                        amt2 = m.group(g + 4)
+                    else:
+                        value = m.group(g + 2)
+
+                # --- Collected (non-summary) ---
+                if tag == "collected":
+                    continue
 
-            # --- Ante posts ---
-            m_ante = _RE_POST_ANTE.match(stripped)
-            if m_ante:
-                username = m_ante.group(1).strip()
-                amount = Decimal(m_ante.group(2))
-                if ante_amount == Decimal("0"):
-                    ante_amount = amount
-                    session.ante = amount
-                seq += 1
-                pot += amount
-                total_committed[username] = (
-                    total_committed.get(username, Decimal("0")) + amount
-                )
-                actions_raw.append(
-                    {
-                        "seq": seq,
-                        "player": username,
-                        "street": "PREFLOP",
-                        "action_type": "POST_ANTE",
-                        "amount": amount,
-                        "amount_to_call": Decimal("0"),
-                        "pot_before": pot - amount,
-                        "is_all_in": False,
-                    }
-                )
-                continue
+                # --- Showdown ---
+                if tag == "shows" and value is not None:
+                    showdown_players.add(username)
+                    cards = value
+                    if len(cards.split()) == 2:  # only store complete 2-card hands
+                        showdown_cards[username] = cards
+                    continue
 
-            # --- Blind posts ---
-            m_blind = _RE_POST_BLIND.match(stripped)
-            if m_blind:
-                username = m_blind.group(1).strip()
-                amount = Decimal(m_blind.group(2))
-                if len(blind_posters) < 2:
-                    blind_posters.append(username)
-                seq += 1
-                pot += amount
-                total_committed[username] = (
-                    total_committed.get(username, Decimal("0")) + amount
-                )
-                street_committed[username] = (
-                    street_committed.get(username, Decimal("0")) + amount
-                )
-                # Update street_bet (BB sets the facing bet)
-                if amount > street_bet:
-                    street_bet = amount
-                actions_raw.append(
-                    {
-                        "seq": seq,
-                        "player": username,
-                        "street": "PREFLOP",
-                        "action_type": "POST_BLIND",
-                        "amount": amount,
-                        "amount_to_call": Decimal("0"),
-                        "pot_before": pot - amount,
-                        "is_all_in": False,
-                    }
-                )
-                continue
+                if tag == "mucks":
+                    showdown_players.add(username)
+                    continue
 
-            # --- Regular actions ---
-            m_act = _RE_ACTION.match(stripped)
-            if not m_act:
-                continue
+                # --- Ante posts ---
+                if tag == "ante" and value is not None:
+                    amount = _to_cents(value)
+                    if ante_amount == 0:
+                        ante_amount = amount
+                    seq += 1
+                    pot += amount
+                    total_committed[username] = (
+                        total_committed.get(username, 0) + amount
+                    )
+                    actions_raw.append(
+                        {
+                            "seq": seq,
+                            "player": username,
+                            "street": "PREFLOP",
+                            "action_type": "POST_ANTE",
+                            "amount": amount,
+                            "amount_to_call": 0,
+                            "pot_before": pot - amount,
+                            "is_all_in": False,
+                        }
+                    )
+                    continue
 
-            username = m_act.group(1).strip()
-            verb = m_act.group(2)
-            num1 = Decimal(m_act.group(3)) if m_act.group(3) else None
-            num2 = Decimal(m_act.group(4)) if m_act.group(4) else None
-            is_all_in = bool(_RE_ALLIN.search(stripped))
+                # --- Blind posts ---
+                if tag == "blind" and value is not None:
+                    amount = _to_cents(value)
+                    if len(blind_posters) < 2:
+                        blind_posters.append(username)
+                    seq += 1
+                    pot += amount
+                    total_committed[username] = (
+                        total_committed.get(username, 0) + amount
+                    )
+                    street_committed[username] = (
+                        street_committed.get(username, 0) + amount
+                    )
+                    # Update street_bet (BB sets the facing bet)
+                    if amount > street_bet:
+                        street_bet = amount
+                    actions_raw.append(
+                        {
+                            "seq": seq,
+                            "player": username,
+                            "street": "PREFLOP",
+                            "action_type": "POST_BLIND",
+                            "amount": amount,
+                            "amount_to_call": 0,
+                            "pot_before": pot - amount,
+                            "is_all_in": False,
+                        }
+                    )
+                    continue
+            num1 = _to_cents(amt1) if amt1 else None
+            num2 = _to_cents(amt2) if amt2 else None
+            is_all_in = "and is all-in" in line
 
             # If calling into an all-in bet/raise, mark as all-in too
             if verb == "calls" and facing_allin:
                 is_all_in = True
 
             # Compute action type and amount
+            action_type: ActionType
             if verb == "folds":
                 action_type = "FOLD"
-                amount = Decimal("0")
-                atc = max(
-                    Decimal("0"),
-                    street_bet - street_committed.get(username, Decimal("0")),
-                )
+                amount = 0
+                atc = max(0, street_bet - street_committed.get(username, 0))
             elif verb == "checks":
                 action_type = "CHECK"
-                amount = Decimal("0")
-                atc = Decimal("0")
+                amount = 0
+                atc = 0
             elif verb == "calls":
                 action_type = "CALL"
-                amount = num1 if num1 is not None else Decimal("0")
-                atc = street_bet - street_committed.get(username, Decimal("0"))
-                if atc < Decimal("0"):
-                    atc = Decimal("0")
+                amount = num1 if num1 is not None else 0
+                atc = street_bet - street_committed.get(username, 0)
+                if atc < 0:
+                    atc = 0
                 pot += amount
-                total_committed[username] = (
-                    total_committed.get(username, Decimal("0")) + amount
-                )
-                street_committed[username] = (
-                    street_committed.get(username, Decimal("0")) + amount
-                )
+                total_committed[username] = total_committed.get(username, 0) + amount
+                street_committed[username] = street_committed.get(username, 0) + amount
             elif verb == "bets":
                 action_type = "BET"
-                amount = num1 if num1 is not None else Decimal("0")
-                atc = Decimal("0")
+                amount = num1 if num1 is not None else 0
+                atc = 0
                 street_bet = amount
                 pot += amount
-                total_committed[username] = (
-                    total_committed.get(username, Decimal("0")) + amount
-                )
-                street_committed[username] = (
-                    street_committed.get(username, Decimal("0")) + amount
-                )
+                total_committed[username] = total_committed.get(username, 0) + amount
+                street_committed[username] = street_committed.get(username, 0) + amount
             elif verb == "raises":
                 action_type = "RAISE"
                 # "raises X to Y" → amount=Y (total size)
-                amount = (
-                    num2
-                    if num2 is not None
-                    else (num1 if num1 is not None else Decimal("0"))
-                )
-                atc = street_bet - street_committed.get(username, Decimal("0"))
-                if atc < Decimal("0"):
-                    atc = Decimal("0")
-                incremental = amount - street_committed.get(username, Decimal("0"))
-                if incremental < Decimal("0"):
-                    incremental = Decimal("0")
+                amount = num2 if num2 is not None else (num1 if num1 is not None else 0)
+                atc = street_bet - street_committed.get(username, 0)
+                if atc < 0:
+                    atc = 0
+                incremental = amount - street_committed.get(username, 0)
+                if incremental < 0:
+                    incremental = 0
                 pot += incremental
                 total_committed[username] = (
-                    total_committed.get(username, Decimal("0")) + incremental
+                    total_committed.get(username, 0) + incremental
                 )
                 street_committed[username] = amount
                 street_bet = amount
@@ -562,18 +920,21 @@ class HandParser:
             actions_raw,
             showdown_cards,
             showdown_players,
-            total_committed,
-            uncalled_bet_total,
+            {u: _from_cents(c) for u, c in total_committed.items()},
+            _from_cents(uncalled_bet_total),
+            summary_start,
+            _from_cents(ante_amount),
         )
 
     # ------------------------------------------------------------------
     # Summary parsing
     # ------------------------------------------------------------------
 
-    def _parse_summary(self, lines: list[str]) -> _SummaryData:
+    def _parse_summary(self, lines: list[str], start: int) -> _SummaryData:
+        """Parse the summary section, whose ``*** SUMMARY ***`` line is at *start*."""
         result: _SummaryData = {
-            "total_pot": Decimal("0"),
-            "rake": Decimal("0"),
+            "total_pot": _ZERO,
+            "rake": _ZERO,
             "board_flop": None,
             "board_turn": None,
             "board_river": None,
@@ -581,22 +942,14 @@ class HandParser:
             "shown_cards": {},  # {username: cards}
         }
 
-        in_summary = False
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("*** SUMMARY ***"):
-                in_summary = True
-                continue
-            if not in_summary:
-                continue
-
-            m_pot = _RE_SUMMARY_POT.search(stripped)
+        for line in lines[start + 1 :]:
+            m_pot = _RE_SUMMARY_POT.search(line)
             if m_pot:
-                result["total_pot"] = Decimal(m_pot.group(1))
-                result["rake"] = Decimal(m_pot.group(2))
+                result["total_pot"] = _dec(m_pot.group(1))
+                result["rake"] = _dec(m_pot.group(2))
                 continue
 
-            m_board = _RE_BOARD.search(stripped)
+            m_board = _RE_BOARD.search(line)
             if m_board:
                 cards = m_board.group(1).split()
                 if len(cards) >= 3:
@@ -608,42 +961,33 @@ class HandParser:
                 continue
 
             # Seat lines: parse winnings and shown cards
-            if stripped.startswith("Seat "):
+            if line.startswith("Seat "):
                 # won via showed + won
-                m_won = _RE_SUMMARY_WON.search(stripped)
+                m_won = _RE_SUMMARY_WON.search(line)
                 if m_won:
-                    # extract username (between "Seat N: " and " showed")
-                    after_seat = re.sub(r"^Seat \d+: ", "", stripped)
-                    # username is everything before " showed"
-                    uname = after_seat.split(" showed ")[0].strip()
-                    # strip position tags like "(button)", "(small blind)"
-                    uname = re.sub(r"\s*\([^)]+\)\s*$", "", uname).strip()
+                    uname = _summary_username(line, " showed ")
                     result["collected"][uname] = result["collected"].get(
-                        uname, Decimal("0")
-                    ) + Decimal(m_won.group(1))
+                        uname, _ZERO
+                    ) + _dec(m_won.group(1))
                     # cards shown
-                    m_cards = re.search(r"showed \[(.+?)\]", stripped)
+                    m_cards = _RE_SHOWED_SUMMARY.search(line)
                     if m_cards and len(m_cards.group(1).split()) == 2:
                         result["shown_cards"][uname] = m_cards.group(1)
                     continue
 
                 # won via collected (X)
-                m_coll = _RE_SUMMARY_COLLECTED.search(stripped)
+                m_coll = _RE_SUMMARY_COLLECTED.search(line)
                 if m_coll:
-                    after_seat = re.sub(r"^Seat \d+: ", "", stripped)
-                    uname = after_seat.split(" collected")[0].strip()
-                    uname = re.sub(r"\s*\([^)]+\)\s*$", "", uname).strip()
+                    uname = _summary_username(line, " collected")
                     result["collected"][uname] = result["collected"].get(
-                        uname, Decimal("0")
-                    ) + Decimal(m_coll.group(1))
+                        uname, _ZERO
+                    ) + _dec(m_coll.group(1))
                     continue
 
                 # mucked cards
-                m_mucked = _RE_MUCKED_SUMMARY.search(stripped)
+                m_mucked = _RE_MUCKED_SUMMARY.search(line)
                 if m_mucked and len(m_mucked.group(1).split()) == 2:
-                    after_seat = re.sub(r"^Seat \d+: ", "", stripped)
-                    uname = after_seat.split(" mucked")[0].strip()
-                    uname = re.sub(r"\s*\([^)]+\)\s*$", "", uname).strip()
+                    uname = _summary_username(line, " mucked")
                     result["shown_cards"][uname] = m_mucked.group(1)
 
         return result
@@ -662,8 +1006,7 @@ class HandParser:
         total_committed: dict[str, Decimal],
     ) -> list[HandPlayerData]:
         # Active seats (have a seat number)
-        seat_numbers = [info["seat"] for info in seats.values()]
-        seat_numbers.sort()
+        seat_numbers = tuple(sorted(info["seat"] for info in seats.values()))
 
         # Find button seat
         btn_seat = hand_meta["button_seat"]
@@ -675,8 +1018,8 @@ class HandParser:
         for username, info in seats.items():
             seat = info["seat"]
             position = positions.get(seat, "?")
-            won = summary["collected"].get(username, Decimal("0"))
-            invested = total_committed.get(username, Decimal("0"))
+            won = summary["collected"].get(username, _ZERO)
+            invested = total_committed.get(username, _ZERO)
             net_result = won - invested
             hole_cards = info["hole_cards"]
             if hole_cards is None:
@@ -712,80 +1055,36 @@ class HandParser:
         # net_result is already correctly set in _build_players via total_committed.
         # This method only needs to build ActionData, compute SPR/MDF, and set VPIP/PFR.
 
-        # VPIP / PFR / three_bet
-        vpip_set: set[str] = set()
-        pfr_set: set[str] = set()
-        three_bet_set: set[str] = set()
+        # VPIP / PFR / three_bet are set on the player records directly from
+        # the preflop actions in the loop below (they start out False). Only
+        # voluntary calls and raises count: posting blinds or the BB checking
+        # its option is not VPIP.
+        players_by_name = {p.username: p for p in players}
         preflop_raise_count = 0
 
-        # Find natural BB (second blind poster)
-        natural_blind_posters: list[str] = []
-        for raw in actions_raw:
-            if raw["action_type"] == "POST_BLIND" and raw["street"] == "PREFLOP":
-                if raw["player"] not in natural_blind_posters:
-                    natural_blind_posters.append(raw["player"])
-        natural_bb = (
-            natural_blind_posters[1] if len(natural_blind_posters) >= 2 else None
-        )
-
-        for raw in actions_raw:
-            if raw["street"] != "PREFLOP":
-                continue
-            atype = raw["action_type"]
-            username = raw["player"]
-            if atype == "CALL":
-                vpip_set.add(username)
-            elif atype == "RAISE":
-                vpip_set.add(username)
-                pfr_set.add(username)
-                if preflop_raise_count == 1:
-                    three_bet_set.add(username)
-                preflop_raise_count += 1
-            elif atype == "CHECK" and username == natural_bb:
-                pass  # BB checks — not VPIP
-
         # SPR / MDF tracking
         hero_first_flop_done = False
-        stacks_at_flop: dict[str, Decimal] = {}
 
-        # Compute stacks at flop start: starting_stack - invested_preflop.
-        # Track street_committed_pf to correctly compute incremental cost for raises.
-        preflop_invested: dict[str, Decimal] = {}
+        # Preflop investment is accumulated while building the actions below
+        # (preflop actions always come first), so stacks at the flop
+        # (starting_stack - invested_preflop) are ready by the hero's first
+        # FLOP action. Track street_committed_pf to correctly compute
+        # incremental cost for raises.
+        # Raw amounts are integer cents; they become Decimal on the
+        # ActionData records only.
+        in_preflop = True
+        preflop_invested: dict[str, int] = {}
         preflop_folders: set[str] = set()
-        street_committed_pf: dict[str, Decimal] = {}
-        for raw in actions_raw:
-            if raw["street"] != "PREFLOP":
-                break
-            atype = raw["action_type"]
-            username = raw["player"]
-            amount = raw["amount"]
-            if atype == "FOLD":
-                preflop_folders.add(username)
-            elif atype in ("POST_BLIND", "POST_ANTE", "CALL", "BET"):
-                preflop_invested[username] = (
-                    preflop_invested.get(username, Decimal("0")) + amount
-                )
-                street_committed_pf[username] = (
-                    street_committed_pf.get(username, Decimal("0")) + amount
-                )
-            elif atype == "RAISE":
-                # amount = total raise; incremental = amount - already committed
-                prior = street_committed_pf.get(username, Decimal("0"))
-                inc = amount - prior
-                preflop_invested[username] = (
-                    preflop_invested.get(username, Decimal("0")) + inc
-                )
-                street_committed_pf[username] = amount
-
-        for p in players:
-            stacks_at_flop[p.username] = p.starting_stack - preflop_invested.get(
-                p.username, Decimal("0")
-            )
+        street_committed_pf: dict[str, int] = {}
 
         # Build ActionData list
         result: list[ActionData] = []
         for raw in actions_raw:
             username = raw["player"]
+            player = players_by_name.get(username)
+            if player is not None:
+                # Store the seat's interned name, not this line's copy.
+                username = player.username
             is_hero = username == self.hero
             atype = raw["action_type"]
             street = raw["street"]
@@ -794,48 +1093,78 @@ class HandParser:
             pot_before = raw["pot_before"]
             is_all_in = raw["is_all_in"]
 
+            if in_preflop and street != "PREFLOP":
+                in_preflop = False
+            if in_preflop:
+                if atype == "CALL" or atype == "RAISE":
+                    if player is not None:
+                        player.vpip = True
+                        if atype == "RAISE":
+                            player.pfr = True
+                            if preflop_raise_count == 1:
+                                player.three_bet = True
+                    if atype == "RAISE":
+                        preflop_raise_count += 1
+
+                if atype == "FOLD":
+                    preflop_folders.add(username)
+                elif atype in ("POST_BLIND", "POST_ANTE", "CALL", "BET"):
+                    preflop_invested[username] = (
+                        preflop_invested.get(username, 0) + amount
+                    )
+                    street_committed_pf[username] = (
+                        street_committed_pf.get(username, 0) + amount
+                    )
+                elif atype == "RAISE":
+                    # amount = total raise; incremental = amount - already committed
+                    inc = amount - street_committed_pf.get(username, 0)
+                    preflop_invested[username] = preflop_invested.get(username, 0) + inc
+                    street_committed_pf[username] = amount
+
             # SPR: only on first hero FLOP action
             spr: Decimal | None = None
             if is_hero and street == "FLOP" and not hero_first_flop_done:
                 hero_first_flop_done = True
-                hero_stack = stacks_at_flop.get(self.hero, Decimal("0"))
+                stacks_at_flop = {
+                    p.username: p.starting_stack
+                    - _from_cents(preflop_invested.get(p.username, 0))
+                    for p in players
+                }
+                hero_stack = stacks_at_flop.get(self.hero, _ZERO)
                 # Effective stack = min(hero, max(active villain stacks))
                 active_stacks = [
                     stacks_at_flop[u]
                     for u in stacks_at_flop
                     if u != self.hero
-                    and stacks_at_flop[u] > Decimal("0")
+                    and stacks_at_flop[u] > _ZERO
                     and u not in preflop_folders
                 ]
-                if active_stacks and pot_before > Decimal("0"):
+                if active_stacks and pot_before > 0:
                     effective = min(hero_stack, max(active_stacks))
-                    spr = effective / pot_before
+                    spr = effective / _from_cents(pot_before)
 
             # MDF: only when hero faces a bet and has not folded
             mdf: Decimal | None = None
-            if is_hero and atc > Decimal("0") and atype != "FOLD":
-                mdf = pot_before / (pot_before + atc)
+            if is_hero and atc > 0 and atype != "FOLD":
+                mdf = _from_cents(pot_before) / _from_cents(pot_before + atc)
 
+            # Positional, in field order: binding eleven keyword arguments
+            # costs more than the generated __init__ body itself, and this
+            # runs once per action.
             result.append(
                 ActionData(
-                    sequence=raw["seq"],
-                    player=username,
-                    is_hero=is_hero,
-                    street=street,
-                    action_type=atype,
-                    amount=amount,
-                    amount_to_call=atc,
-                    pot_before=pot_before,
-                    is_all_in=is_all_in,
-                    spr=spr,
-                    mdf=mdf,
+                    raw["seq"],  # sequence
+                    username,  # player
+                    is_hero,
+                    street,
+                    atype,  # action_type
+                    _from_cents(amount),
+                    _from_cents(atc),  # amount_to_call
+                    _from_cents(pot_before),
+                    is_all_in,
+                    spr,
+                    mdf,
                 )
             )
 
-        # Apply VPIP/PFR/three_bet to players
-        for p in players:
-            p.vpip = p.username in vpip_set
-            p.pfr = p.username in pfr_set
-            p.three_bet = p.username in three_bet_set
-
         return result
@@ -5,11 +5,22 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
+# Closed value sets for ActionData. They stay plain strings, which is what the
+# database stores and the analysis code compares against; the parser takes
+# them from literals, so every record shares the same few str objects.
+# No betting happens at SHOWDOWN, but it is a street the parser tracks.
+Street = Literal["PREFLOP", "FLOP", "TURN", "RIVER", "SHOWDOWN"]
+ActionType = Literal["POST_BLIND", "POST_ANTE", "FOLD", "CHECK", "CALL", "BET", "RAISE"]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SessionData:
-    """Metadata that describes the table/game context for a hand."""
+    """Metadata that describes the table/game context for a hand.
+
+    Frozen: built once per hand and never updated, so it is hashable.
+    """
 
     table_name: str
     game_type: str  # e.g. "NLHE"
@@ -24,9 +35,12 @@ class SessionData:
     currency: str = "PLAY"  # "USD", "EUR", or "PLAY" (play money / tournament chips)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HandData:
-    """Hand-level metadata: identifiers, board, pot, rake."""
+    """Hand-level metadata: identifiers, board, pot, rake.
+
+    Frozen: built once per hand and never updated, so it is hashable.
+    """
 
     hand_id: str
     timestamp: datetime
@@ -39,7 +53,7 @@ class HandData:
     uncalled_bet_returned: Decimal = Decimal("0")
 
 
-@dataclass
+@dataclass(slots=True)
 class HandPlayerData:
     """Per-player record for a single hand."""
 
@@ -56,15 +70,15 @@ class HandPlayerData:
     is_hero: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionData:
     """A single in-hand action (post, fold, call, bet, raise, check)."""
 
     sequence: int
     player: str
     is_hero: bool
-    street: str  # PREFLOP / FLOP / TURN / RIVER
-    action_type: str  # POST_BLIND / POST_ANTE / FOLD / CHECK / CALL / BET / RAISE
+    street: Street
+    action_type: ActionType
     amount: Decimal  # total bet/raise size on street; 0 for FOLD/CHECK
     amount_to_call: Decimal  # facing bet size; 0 for BET/CHECK/FOLD/POST_*
     pot_before: Decimal  # running pot before this action
@@ -73,7 +87,7 @@ class ActionData:
     mdf: Decimal | None = None  # set only when is_hero and amount_to_call > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedHand:
     """Container returned by HandParser.parse()."""
 
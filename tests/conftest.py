@@ -0,0 +1,17 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _dash_app():
+    """Instantiate the Dash app once per session (and per xdist worker).
+
+    Importing a ``pokerhero.frontend.pages`` module calls
+    ``dash.register_page()``, which raises ``PageError`` unless a Dash app
+    already exists. A serial run always creates one early, but an xdist
+    worker may be handed a page-importing test first.
+    """
+    from pokerhero.frontend.app import create_app
+
+    return create_app(db_path=":memory:")
@@ -5,6 +5,40 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from pokerhero.analysis.queries import (
+    get_actions,
+    get_export_cursor,
+    get_export_data,
+    get_hands,
+    get_hero_actions,
+    get_hero_hand_players,
+    get_hero_opportunity_actions,
+    get_hero_timeline,
+    get_session_hero_actions,
+    get_session_kpis,
+    get_session_player_stats,
+    get_session_showdown_hands,
+    get_sessions,
+)
+from pokerhero.analysis.stats import (
+    _board_at_street,
+    _boards_by_street,
+    aggression_factor,
+    cbet_pct,
+    classify_player,
+    compute_equity,
+    compute_equity_multiway,
+    compute_equity_vs_range,
+    compute_ev,
+    confidence_tier,
+    pfr_pct,
+    three_bet_pct,
+    total_profit,
+    vpip_pct,
+    win_rate_bb100,
+    wtsd_pct,
+)
+
 FRATERNITAS = Path(__file__).parent / "fixtures" / "play_money_two_hand_session.txt"
 
 
@@ -13,7 +47,7 @@ FRATERNITAS = Path(__file__).parent / "fixtures" / "play_money_two_hand_session.
 # Hand 1 — jsalinas96 BB, folds preflop:  vpip=False, pfr=False, wts=False
 # Hand 2 — jsalinas96 SB, sees flop, loses at showdown: vpip=True, wts=True
 # ---------------------------------------------------------------------------
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def db_with_data(tmp_path_factory):
     from pokerhero.database.db import init_db
     from pokerhero.ingestion.pipeline import ingest_file
@@ -26,7 +60,7 @@ def db_with_data(tmp_path_factory):
     conn.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def hero_player_id(db_with_data):
     row = db_with_data.execute(
         "SELECT id FROM players WHERE username = ?", ("jsalinas96",)
@@ -35,26 +69,54 @@ def hero_player_id(db_with_data):
     return row[0]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def session_id(db_with_data):
     row = db_with_data.execute("SELECT id FROM sessions LIMIT 1").fetchone()
     assert row is not None
     return row[0]
 
 
+@pytest.fixture(scope="session")
+def first_hand_id(db_with_data, session_id, hero_player_id):
+    return get_hands(db_with_data, session_id, hero_player_id)["id"].iloc[0]
+
+
+@pytest.fixture(scope="session")
+def second_hand_id(db_with_data, session_id, hero_player_id):
+    return get_hands(db_with_data, session_id, hero_player_id)["id"].iloc[1]
+
+
+# Unfiltered hero query results, computed once and shared read-only by the
+# tests below (none of them mutates the frames).
+@pytest.fixture(scope="session")
+def hero_hand_players_df(db_with_data, hero_player_id):
+    return get_hero_hand_players(db_with_data, hero_player_id)
+
+
+@pytest.fixture(scope="session")
+def hero_timeline_df(db_with_data, hero_player_id):
+    return get_hero_timeline(db_with_data, hero_player_id)
+
+
+@pytest.fixture(scope="session")
+def hero_actions_df(db_with_data, hero_player_id):
+    return get_hero_actions(db_with_data, hero_player_id)
+
+
+@pytest.fixture(scope="session")
+def hero_opportunity_actions_df(db_with_data, hero_player_id):
+    return get_hero_opportunity_actions(db_with_data, hero_player_id)
+
+
 # ---------------------------------------------------------------------------
 # TestQueries
 # ---------------------------------------------------------------------------
 class TestQueries:
     def test_get_sessions_returns_dataframe(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_sessions
-
         result = get_sessions(db_with_data, hero_player_id)
         assert isinstance(result, pd.DataFrame)
 
     def test_get_sessions_has_expected_columns(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_sessions
-
         df = get_sessions(db_with_data, hero_player_id)
         assert {
             "id",
@@ -69,21 +131,17 @@ class TestQueries:
     def test_get_sessions_returns_one_row_for_one_file(
         self, db_with_data, hero_player_id
     ):
-        from pokerhero.analysis.queries import get_sessions
-
         assert len(get_sessions(db_with_data, hero_player_id)) == 1
 
-    def test_get_hands_returns_dataframe(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hands, get_sessions
-
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
+    def test_get_hands_returns_dataframe(
+        self, db_with_data, hero_player_id, session_id
+    ):
         result = get_hands(db_with_data, session_id, hero_player_id)
         assert isinstance(result, pd.DataFrame)
 
-    def test_get_hands_has_expected_columns(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hands, get_sessions
-
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
+    def test_get_hands_has_expected_columns(
+        self, db_with_data, hero_player_id, session_id
+    ):
         df = get_hands(db_with_data, session_id, hero_player_id)
         assert {
             "id",
@@ -94,27 +152,26 @@ class TestQueries:
             "hole_cards",
         } <= set(df.columns)
 
-    def test_get_hands_returns_correct_count(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hands, get_sessions
-
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
+    def test_get_hands_returns_correct_count(
+        self, db_with_data, hero_player_id, session_id
+    ):
         assert len(get_hands(db_with_data, session_id, hero_player_id)) == 2
 
-    def test_get_hands_includes_position_and_flags(self, db_with_data, hero_player_id):
+    def test_get_hands_includes_position_and_flags(
+        self, db_with_data, hero_player_id, session_id
+    ):
         """get_hands must include position, went_to_showdown, and saw_flop columns
         for use by the hand-level filter controls."""
-        from pokerhero.analysis.queries import get_hands, get_sessions
 
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
         df = get_hands(db_with_data, session_id, hero_player_id)
         assert {"position", "went_to_showdown", "saw_flop"} <= set(df.columns)
 
-    def test_get_hands_includes_ev_flag_columns(self, db_with_data, hero_player_id):
+    def test_get_hands_includes_ev_flag_columns(
+        self, db_with_data, hero_player_id, session_id
+    ):
         """get_hands must include has_bad_call, has_good_call, has_bad_fold for the
         EV-based hand filter."""
-        from pokerhero.analysis.queries import get_hands, get_sessions
 
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
         df = get_hands(db_with_data, session_id, hero_player_id)
         assert {"has_bad_call", "has_good_call", "has_bad_fold"} <= set(df.columns)
 
@@ -124,7 +181,6 @@ class TestQueries:
         EV cache rows from a *different* session must not bleed through and mark
         hands in the queried session as has_bad_call=1.
         """
-        from pokerhero.analysis.queries import get_hands
         from pokerhero.database.db import init_db
 
         conn = init_db(str(tmp_path / "test_ev_scope.db"))
@@ -199,20 +255,12 @@ class TestQueries:
 
         conn.close()
 
-    def test_get_actions_returns_dataframe(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_actions, get_hands, get_sessions
-
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
-        hand_id = get_hands(db_with_data, session_id, hero_player_id)["id"].iloc[0]
-        result = get_actions(db_with_data, hand_id)
+    def test_get_actions_returns_dataframe(self, db_with_data, first_hand_id):
+        result = get_actions(db_with_data, first_hand_id)
         assert isinstance(result, pd.DataFrame)
 
-    def test_get_actions_has_expected_columns(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_actions, get_hands, get_sessions
-
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
-        hand_id = get_hands(db_with_data, session_id, hero_player_id)["id"].iloc[0]
-        df = get_actions(db_with_data, hand_id)
+    def test_get_actions_has_expected_columns(self, db_with_data, first_hand_id):
+        df = get_actions(db_with_data, first_hand_id)
         assert {
             "sequence",
             "is_hero",
@@ -224,28 +272,14 @@ class TestQueries:
             "position",
         } <= set(df.columns)
 
-    def test_get_actions_is_ordered_by_sequence(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_actions, get_hands, get_sessions
-
-        session_id = get_sessions(db_with_data, hero_player_id)["id"].iloc[0]
-        hand_id = get_hands(db_with_data, session_id, hero_player_id)["id"].iloc[1]
-        df = get_actions(db_with_data, hand_id)
+    def test_get_actions_is_ordered_by_sequence(self, db_with_data, second_hand_id):
+        df = get_actions(db_with_data, second_hand_id)
         assert list(df["sequence"]) == sorted(df["sequence"].tolist())
 
-    def test_get_hero_hand_players_returns_dataframe(
-        self, db_with_data, hero_player_id
-    ):
-        from pokerhero.analysis.queries import get_hero_hand_players
-
-        result = get_hero_hand_players(db_with_data, hero_player_id)
-        assert isinstance(result, pd.DataFrame)
+    def test_get_hero_hand_players_returns_dataframe(self, hero_hand_players_df):
+        assert isinstance(hero_hand_players_df, pd.DataFrame)
 
-    def test_get_hero_hand_players_has_expected_columns(
-        self, db_with_data, hero_player_id
-    ):
-        from pokerhero.analysis.queries import get_hero_hand_players
-
-        df = get_hero_hand_players(db_with_data, hero_player_id)
+    def test_get_hero_hand_players_has_expected_columns(self, hero_hand_players_df):
         assert {
             "vpip",
             "pfr",
@@ -253,31 +287,35 @@ class TestQueries:
             "net_result",
             "big_blind",
             "saw_flop",
-        } <= set(df.columns)
+        } <= set(hero_hand_players_df.columns)
 
-    def test_get_hero_hand_players_returns_all_hands(
-        self, db_with_data, hero_player_id
-    ):
-        from pokerhero.analysis.queries import get_hero_hand_players
+    def test_get_hero_hand_players_returns_all_hands(self, hero_hand_players_df):
+        assert len(hero_hand_players_df) == 2
 
-        assert len(get_hero_hand_players(db_with_data, hero_player_id)) == 2
-
-    def test_get_hero_hand_players_saw_flop_correct(self, db_with_data, hero_player_id):
+    def test_get_hero_hand_players_saw_flop_correct(self, hero_hand_players_df):
         """Hand 1: hero folds preflop (saw_flop=0).
         Hand 2: hero plays flop (saw_flop=1)."""
-        from pokerhero.analysis.queries import get_hero_hand_players
 
-        df = get_hero_hand_players(db_with_data, hero_player_id)
-        assert df["saw_flop"].sum() == 1
+        assert hero_hand_players_df["saw_flop"].sum() == 1
 
-    def test_get_hero_hand_players_includes_session_id(
-        self, db_with_data, hero_player_id
-    ):
+    def test_get_hero_hand_players_includes_session_id(self, hero_hand_players_df):
         """get_hero_hand_players must include a session_id column for nav links."""
-        from pokerhero.analysis.queries import get_hero_hand_players
 
-        df = get_hero_hand_players(db_with_data, hero_player_id)
-        assert "session_id" in df.columns
+        assert "session_id" in hero_hand_players_df.columns
+
+    def test_get_export_cursor_matches_export_data(self, db_with_data):
+        """The streaming export cursor yields the same rows as get_export_data."""
+
+        df = get_export_data(db_with_data, "jsalinas96")
+        assert len(df) == 2
+        cursor, header = get_export_cursor(db_with_data, "jsalinas96")
+        rows = cursor.fetchall()
+        assert header == list(df.columns)
+        assert rows == list(df.itertuples(index=False, name=None))
+        assert all(type(row) is tuple for row in rows)
+
+    def test_get_export_data_unknown_username_is_empty(self, db_with_data):
+        assert get_export_data(db_with_data, "nobody").empty
 
 
 # ---------------------------------------------------------------------------
@@ -285,55 +323,37 @@ class TestQueries:
 # ---------------------------------------------------------------------------
 class TestStats:
     def test_vpip_pct_basic(self):
-        from pokerhero.analysis.stats import vpip_pct
-
         df = pd.DataFrame({"vpip": [1, 0, 1, 1, 0]})
         assert vpip_pct(df) == pytest.approx(0.6)
 
     def test_vpip_pct_all_vpip(self):
-        from pokerhero.analysis.stats import vpip_pct
-
         df = pd.DataFrame({"vpip": [1, 1, 1]})
         assert vpip_pct(df) == pytest.approx(1.0)
 
     def test_vpip_pct_empty_returns_zero(self):
-        from pokerhero.analysis.stats import vpip_pct
-
         assert vpip_pct(pd.DataFrame({"vpip": []})) == 0.0
 
     def test_pfr_pct_basic(self):
-        from pokerhero.analysis.stats import pfr_pct
-
         df = pd.DataFrame({"pfr": [1, 0, 0, 1]})
         assert pfr_pct(df) == pytest.approx(0.5)
 
     def test_pfr_pct_empty_returns_zero(self):
-        from pokerhero.analysis.stats import pfr_pct
-
         assert pfr_pct(pd.DataFrame({"pfr": []})) == 0.0
 
     def test_win_rate_bb100_positive(self):
-        from pokerhero.analysis.stats import win_rate_bb100
-
         # +200 and -100 at BB=200 → +1 and -0.5 BB = +0.5BB / 2 hands * 100 = 25 bb/100
         df = pd.DataFrame({"net_result": [200.0, -100.0], "big_blind": [200.0, 200.0]})
         assert win_rate_bb100(df) == pytest.approx(25.0)
 
     def test_win_rate_bb100_negative(self):
-        from pokerhero.analysis.stats import win_rate_bb100
-
         df = pd.DataFrame({"net_result": [-400.0], "big_blind": [200.0]})
         assert win_rate_bb100(df) == pytest.approx(-200.0)
 
     def test_win_rate_bb100_empty_returns_zero(self):
-        from pokerhero.analysis.stats import win_rate_bb100
-
         df = pd.DataFrame({"net_result": [], "big_blind": []})
         assert win_rate_bb100(df) == 0.0
 
     def test_aggression_factor_basic(self):
-        from pokerhero.analysis.stats import aggression_factor
-
         df = pd.DataFrame(
             {
                 "action_type": ["BET", "RAISE", "CALL", "CALL", "FOLD"],
@@ -344,8 +364,6 @@ class TestStats:
         assert aggression_factor(df) == pytest.approx(1.0)
 
     def test_aggression_factor_no_calls_returns_infinity(self):
-        from pokerhero.analysis.stats import aggression_factor
-
         df = pd.DataFrame(
             {
                 "action_type": ["BET", "RAISE"],
@@ -355,8 +373,6 @@ class TestStats:
         assert aggression_factor(df) == float("inf")
 
     def test_aggression_factor_preflop_excluded(self):
-        from pokerhero.analysis.stats import aggression_factor
-
         df = pd.DataFrame(
             {
                 "action_type": ["RAISE", "CALL"],
@@ -367,27 +383,19 @@ class TestStats:
         assert aggression_factor(df) == float("inf")
 
     def test_wtsd_pct_basic(self):
-        from pokerhero.analysis.stats import wtsd_pct
-
         # 2 saw flop, 1 went to showdown → 50%
         df = pd.DataFrame({"went_to_showdown": [1, 0], "saw_flop": [1, 1]})
         assert wtsd_pct(df) == pytest.approx(0.5)
 
     def test_wtsd_pct_no_flops_returns_zero(self):
-        from pokerhero.analysis.stats import wtsd_pct
-
         df = pd.DataFrame({"went_to_showdown": [0, 0], "saw_flop": [0, 0]})
         assert wtsd_pct(df) == 0.0
 
     def test_total_profit_positive(self):
-        from pokerhero.analysis.stats import total_profit
-
         df = pd.DataFrame({"net_result": [500.0, -200.0, 100.0]})
         assert total_profit(df) == pytest.approx(400.0)
 
     def test_total_profit_empty_returns_zero(self):
-        from pokerhero.analysis.stats import total_profit
-
         assert total_profit(pd.DataFrame({"net_result": []})) == 0.0
 
 
@@ -395,28 +403,19 @@ class TestStats:
 # TestHeroTimeline — get_hero_timeline (for bankroll graph)
 # ---------------------------------------------------------------------------
 class TestHeroTimeline:
-    def test_get_hero_timeline_returns_dataframe(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_timeline
+    def test_get_hero_timeline_returns_dataframe(self, hero_timeline_df):
+        assert isinstance(hero_timeline_df, pd.DataFrame)
 
-        assert isinstance(get_hero_timeline(db_with_data, hero_player_id), pd.DataFrame)
+    def test_get_hero_timeline_has_expected_columns(self, hero_timeline_df):
+        assert {"timestamp", "net_result"} <= set(hero_timeline_df.columns)
 
-    def test_get_hero_timeline_has_expected_columns(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_timeline
-
-        df = get_hero_timeline(db_with_data, hero_player_id)
-        assert {"timestamp", "net_result"} <= set(df.columns)
-
-    def test_get_hero_timeline_one_row_per_hand(self, db_with_data, hero_player_id):
+    def test_get_hero_timeline_one_row_per_hand(self, hero_timeline_df):
         """Fraternitas file has 2 hands — expect 2 timeline rows."""
-        from pokerhero.analysis.queries import get_hero_timeline
 
-        assert len(get_hero_timeline(db_with_data, hero_player_id)) == 2
+        assert len(hero_timeline_df) == 2
 
-    def test_get_hero_timeline_ordered_by_timestamp(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_timeline
-
-        df = get_hero_timeline(db_with_data, hero_player_id)
-        timestamps = df["timestamp"].tolist()
+    def test_get_hero_timeline_ordered_by_timestamp(self, hero_timeline_df):
+        timestamps = hero_timeline_df["timestamp"].tolist()
         assert timestamps == sorted(timestamps)
 
 
@@ -424,53 +423,36 @@ class TestHeroTimeline:
 # TestHeroActions — get_hero_actions (for per-position aggression factor)
 # ---------------------------------------------------------------------------
 class TestHeroActions:
-    def test_get_hero_actions_returns_dataframe(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_actions
-
-        assert isinstance(get_hero_actions(db_with_data, hero_player_id), pd.DataFrame)
+    def test_get_hero_actions_returns_dataframe(self, hero_actions_df):
+        assert isinstance(hero_actions_df, pd.DataFrame)
 
-    def test_get_hero_actions_has_expected_columns(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_actions
-
-        df = get_hero_actions(db_with_data, hero_player_id)
-        assert {"hand_id", "street", "action_type", "position"} <= set(df.columns)
+    def test_get_hero_actions_has_expected_columns(self, hero_actions_df):
+        assert {"hand_id", "street", "action_type", "position"} <= set(
+            hero_actions_df.columns
+        )
 
-    def test_get_hero_actions_only_postflop_streets(self, db_with_data, hero_player_id):
+    def test_get_hero_actions_only_postflop_streets(self, hero_actions_df):
         """Only FLOP/TURN/RIVER rows must be returned — no PREFLOP."""
-        from pokerhero.analysis.queries import get_hero_actions
-
-        df = get_hero_actions(db_with_data, hero_player_id)
-        assert set(df["street"].unique()) <= {"FLOP", "TURN", "RIVER"}
 
-    def test_get_hero_actions_no_preflop_rows(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_actions
+        assert set(hero_actions_df["street"].unique()) <= {"FLOP", "TURN", "RIVER"}
 
-        df = get_hero_actions(db_with_data, hero_player_id)
-        assert "PREFLOP" not in df["street"].values
+    def test_get_hero_actions_no_preflop_rows(self, hero_actions_df):
+        assert "PREFLOP" not in hero_actions_df["street"].values
 
-    def test_get_hero_actions_has_rows_when_flop_seen(
-        self, db_with_data, hero_player_id
-    ):
+    def test_get_hero_actions_has_rows_when_flop_seen(self, hero_actions_df):
         """Hand 2: hero sees flop → at least one post-flop action row."""
-        from pokerhero.analysis.queries import get_hero_actions
 
-        assert len(get_hero_actions(db_with_data, hero_player_id)) > 0
+        assert len(hero_actions_df) > 0
 
 
 # ---------------------------------------------------------------------------
 # TestOpportunityActions — get_hero_opportunity_actions (for 3-Bet%/C-Bet%)
 # ---------------------------------------------------------------------------
 class TestOpportunityActions:
-    def test_returns_dataframe(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_opportunity_actions
-
-        result = get_hero_opportunity_actions(db_with_data, hero_player_id)
-        assert isinstance(result, pd.DataFrame)
-
-    def test_has_expected_columns(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_opportunity_actions
+    def test_returns_dataframe(self, hero_opportunity_actions_df):
+        assert isinstance(hero_opportunity_actions_df, pd.DataFrame)
 
-        df = get_hero_opportunity_actions(db_with_data, hero_player_id)
+    def test_has_expected_columns(self, hero_opportunity_actions_df):
         assert {
             "hand_id",
             "saw_flop",
@@ -478,18 +460,16 @@ class TestOpportunityActions:
             "is_hero",
             "street",
             "action_type",
-        } <= set(df.columns)
-
-    def test_only_preflop_and_flop_streets(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_opportunity_actions
+        } <= set(hero_opportunity_actions_df.columns)
 
-        df = get_hero_opportunity_actions(db_with_data, hero_player_id)
-        assert set(df["street"].unique()) <= {"PREFLOP", "FLOP"}
-
-    def test_has_rows(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_hero_opportunity_actions
+    def test_only_preflop_and_flop_streets(self, hero_opportunity_actions_df):
+        assert set(hero_opportunity_actions_df["street"].unique()) <= {
+            "PREFLOP",
+            "FLOP",
+        }
 
-        assert len(get_hero_opportunity_actions(db_with_data, hero_player_id)) > 0
+    def test_has_rows(self, hero_opportunity_actions_df):
+        assert len(hero_opportunity_actions_df) > 0
 
 
 # ---------------------------------------------------------------------------
@@ -553,8 +533,6 @@ class TestThreeBetCBet:
         )
 
     def test_three_bet_pct_empty_returns_zero(self):
-        from pokerhero.analysis.stats import three_bet_pct
-
         df = pd.DataFrame(
             columns=[
                 "hand_id",
@@ -569,7 +547,6 @@ class TestThreeBetCBet:
 
     def test_three_bet_pct_no_opportunity_returns_zero(self):
         """No raise before hero preflop → no opportunities → 0.0."""
-        from pokerhero.analysis.stats import three_bet_pct
 
         df = pd.DataFrame(
             {
@@ -585,13 +562,11 @@ class TestThreeBetCBet:
 
     def test_three_bet_pct_one_of_two(self):
         """Hand 1: opportunity, no 3-bet. Hand 2: opportunity, 3-bet → 0.5."""
-        from pokerhero.analysis.stats import three_bet_pct
 
         assert three_bet_pct(self._make_preflop_df()) == pytest.approx(0.5)
 
     def test_three_bet_pct_all_three_bet(self):
         """All opportunities result in a 3-bet → 1.0."""
-        from pokerhero.analysis.stats import three_bet_pct
 
         df = pd.DataFrame(
             {
@@ -615,7 +590,6 @@ class TestThreeBetCBet:
         empty (only SB's blind post before it), so zero opportunities are
         counted and the result is incorrectly 0.0.
         """
-        from pokerhero.analysis.stats import three_bet_pct
 
         df = pd.DataFrame(
             {
@@ -641,7 +615,6 @@ class TestThreeBetCBet:
         Hero 4-bets (RAISE seq 5). Two raises before hero → 4-bet opp,
         not 3-bet opp → 0 opportunities, result 0.0.
         """
-        from pokerhero.analysis.stats import three_bet_pct
 
         df = pd.DataFrame(
             {
@@ -668,7 +641,6 @@ class TestThreeBetCBet:
         Hand 2: two raises before hero → 4-bet opportunity (not counted).
         Result: 1 opportunity, 0 made → 0.0 (not 0.5 from counting both).
         """
-        from pokerhero.analysis.stats import three_bet_pct
 
         df = pd.DataFrame(
             {
@@ -690,7 +662,6 @@ class TestThreeBetCBet:
             }
         )
         assert three_bet_pct(df) == pytest.approx(0.0)
-        from pokerhero.analysis.stats import cbet_pct
 
         df = pd.DataFrame(
             columns=[
@@ -706,7 +677,6 @@ class TestThreeBetCBet:
 
     def test_cbet_pct_no_opportunity_returns_zero(self):
         """Hero not preflop last-raiser → no c-bet opportunity."""
-        from pokerhero.analysis.stats import cbet_pct
 
         df = pd.DataFrame(
             {
@@ -723,13 +693,11 @@ class TestThreeBetCBet:
 
     def test_cbet_pct_one_of_two(self):
         """Hand 1: c-bet made. Hand 2: opportunity but checks → 0.5."""
-        from pokerhero.analysis.stats import cbet_pct
 
         assert cbet_pct(self._make_cbet_df()) == pytest.approx(0.5)
 
     def test_cbet_pct_all_cbet(self):
         """Single hand: hero is PF raiser, bets flop → 1.0."""
-        from pokerhero.analysis.stats import cbet_pct
 
         df = pd.DataFrame(
             {
@@ -747,68 +715,71 @@ class TestThreeBetCBet:
 # ---------------------------------------------------------------------------
 # TestEV — compute_ev using PokerKit equity
 # ---------------------------------------------------------------------------
+@pytest.mark.xdist_group("equity")
 class TestEV:
+    # Complete-board cases pass sample_count=1: with nothing left to deal a
+    # single Monte Carlo sample gives the exact equity.
     def test_returns_none_when_villain_is_none(self):
         """When villain cards are unknown, EV cannot be computed."""
-        from pokerhero.analysis.stats import compute_ev
 
         assert compute_ev("Ah Kh", None, "Qh Jh Th", 100.0, 300.0) is None
 
     def test_returns_none_when_villain_is_empty(self):
         """Empty villain string also returns None."""
-        from pokerhero.analysis.stats import compute_ev
 
         assert compute_ev("Ah Kh", "", "Qh Jh Th", 100.0, 300.0) is None
 
     def test_winning_hand_is_positive_ev(self):
         """Hero has royal flush vs trash on complete board → positive EV."""
-        from pokerhero.analysis.stats import compute_ev
 
         # Hero: Ah Kh, Board: Qh Jh Th 9d 2s (A-K-Q-J-T royal flush for hero)
         # Villain: 2c 3d (no hand)
-        result = compute_ev("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0)
+        result = compute_ev(
+            "Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0, sample_count=1
+        )
         assert result is not None
         assert result[0] > 0
 
     def test_losing_hand_is_negative_ev(self):
         """Hero has trash vs royal flush on complete board → negative EV."""
-        from pokerhero.analysis.stats import compute_ev
 
         # Hero: 2c 3d, Villain: Ah Kh, Board: Qh Jh Th 9d 2s
-        result = compute_ev("2c 3d", "Ah Kh", "Qh Jh Th 9d 2s", 100.0, 300.0)
+        result = compute_ev(
+            "2c 3d", "Ah Kh", "Qh Jh Th 9d 2s", 100.0, 300.0, sample_count=1
+        )
         assert result is not None
         assert result[0] < 0
 
     def test_ev_formula_at_river(self):
         """Complete board → exact equity; EV = equity*pot_to_win - wager."""
-        from pokerhero.analysis.stats import compute_ev
 
         # Hero: Ah Kh vs 2c 3d on complete board → equity=1.0
         # EV = 1.0 * 300 - 100 = 200 (net profit, not gross pot)
-        result = compute_ev("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0)
+        result = compute_ev(
+            "Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0, sample_count=1
+        )
         assert result is not None
         assert result[0] == pytest.approx(200.0, abs=5.0)
 
     def test_ev_partial_board_in_range(self):
         """Partial board (flop only) → equity between 0 and 1 for non-trivial hand."""
-        from pokerhero.analysis.stats import compute_ev
 
         # Hero: Ah Kh (nut flush draw), Villain: 2c 2d (pair of 2s), Board: Qh Jh 2s
         # Villain has set of 2s, hero has many outs (flush + straight outs)
-        result = compute_ev("Ah Kh", "2c 2d", "Qh Jh 2s", 100.0, 300.0)
+        result = compute_ev(
+            "Ah Kh", "2c 2d", "Qh Jh 2s", 100.0, 300.0, sample_count=200
+        )
         assert result is not None
         # Result is a 2-tuple of finite floats
         assert isinstance(result, tuple)
 
     def test_returns_none_for_single_card_villain(self):
         """Villain with only one card (e.g. one-card show) must not crash."""
-        from pokerhero.analysis.stats import compute_ev
 
         assert compute_ev("Ah Kh", "2d", "Qh Jh Th", 100.0, 300.0) is None
 
     def test_returns_none_for_single_card_hero(self):
         """Malformed hero cards (one card) must not crash."""
-        from pokerhero.analysis.stats import compute_ev
 
         assert compute_ev("Ah", "2c 3d", "Qh Jh Th", 100.0, 300.0) is None
 
@@ -816,84 +787,97 @@ class TestEV:
 # ---------------------------------------------------------------------------
 # TestEVTuple — compute_ev must return (ev, equity) tuple (not bare float)
 # ---------------------------------------------------------------------------
+@pytest.mark.xdist_group("equity")
 class TestEVTuple:
     """Failing tests: compute_ev must return tuple[float, float] | None.
 
     These tests drive the A1 sub-task of the EV redesign.
     """
 
+    # Complete-board calls use sample_count=1, as in TestEV.
+
     def test_returns_none_when_villain_unknown(self):
         """None is still returned when villain cards are absent."""
-        from pokerhero.analysis.stats import compute_ev
 
         assert compute_ev("Ah Kh", None, "Qh Jh Th", 100.0, 300.0) is None
 
     def test_returns_tuple_not_bare_float(self):
         """Result must be a 2-tuple, not a bare float."""
-        from pokerhero.analysis.stats import compute_ev
 
-        result = compute_ev("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0)
+        result = compute_ev(
+            "Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0, sample_count=1
+        )
         assert isinstance(result, tuple)
         assert len(result) == 2
 
     def test_first_element_is_ev(self):
         """result[0] is EV — positive when hero has royal flush vs trash."""
-        from pokerhero.analysis.stats import compute_ev
 
-        ev, _ = compute_ev("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0)
+        ev, _ = compute_ev(
+            "Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0, sample_count=1
+        )
         assert ev > 0
 
     def test_second_element_is_equity(self):
         """result[1] is equity — a float in [0, 1]."""
-        from pokerhero.analysis.stats import compute_ev
 
-        _, equity = compute_ev("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0)
+        _, equity = compute_ev(
+            "Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0, sample_count=1
+        )
         assert 0.0 <= equity <= 1.0
 
     def test_equity_near_one_for_dominating_hand(self):
         """Hero royal flush on complete board → equity ≈ 1.0."""
-        from pokerhero.analysis.stats import compute_ev
 
-        _, equity = compute_ev("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0)
+        _, equity = compute_ev(
+            "Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 100.0, 300.0, sample_count=1
+        )
         assert equity == pytest.approx(1.0, abs=0.01)
 
     def test_ev_formula_consistent_with_equity(self):
         """EV should equal equity*pot_to_win - amount_risked."""
-        from pokerhero.analysis.stats import compute_ev
 
         amount_risked, pot_to_win = 100.0, 300.0
         ev, equity = compute_ev(
-            "Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", amount_risked, pot_to_win
+            "Ah Kh",
+            "2c 3d",
+            "Qh Jh Th 9d 2s",
+            amount_risked,
+            pot_to_win,
+            sample_count=1,
         )
         expected_ev = equity * pot_to_win - amount_risked
         assert ev == pytest.approx(expected_ev, abs=0.01)
 
 
 # ---------------------------------------------------------------------------
+@pytest.mark.xdist_group("equity")
 class TestComputeEquity:
     def setup_method(self):
         """Clear the equity cache before each test for isolation."""
-        from pokerhero.analysis.stats import compute_equity
 
         compute_equity.cache_clear()
 
     def test_complete_board_winner_equity_is_one(self):
-        """Hero royal flush vs trash on complete 5-card board → equity ≈ 1.0."""
-        from pokerhero.analysis.stats import compute_equity
+        """Hero royal flush vs trash on complete 5-card board → equity ≈ 1.0.
 
-        equity = compute_equity("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 5000)
+        Nothing is left to deal, so a single sample is exact.
+        """
+
+        equity = compute_equity("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 1)
         assert equity == pytest.approx(1.0, abs=0.01)
 
     def test_complete_board_loser_equity_is_zero(self):
-        """Hero trash vs royal flush on complete 5-card board → equity ≈ 0.0."""
-        from pokerhero.analysis.stats import compute_equity
+        """Hero trash vs royal flush on complete 5-card board → equity ≈ 0.0.
+
+        Nothing is left to deal, so a single sample is exact.
+        """
 
-        equity = compute_equity("2c 3d", "Ah Kh", "Qh Jh Th 9d 2s", 5000)
+        equity = compute_equity("2c 3d", "Ah Kh", "Qh Jh Th 9d 2s", 1)
         assert equity == pytest.approx(0.0, abs=0.01)
 
     def test_partial_board_equity_in_unit_interval(self):
         """Non-trivial flop: equity must be strictly between 0 and 1."""
-        from pokerhero.analysis.stats import compute_equity
 
         # Hero: Ah Kh (royal flush draw), Villain: 2c 2d (set of 2s), Board: Qh Jh 2s
         equity = compute_equity("Ah Kh", "2c 2d", "Qh Jh 2s", 200)
@@ -901,11 +885,10 @@ class TestComputeEquity:
 
     def test_result_is_cached(self):
         """Second call with identical args must be a cache hit, not a recompute."""
-        from pokerhero.analysis.stats import compute_equity
 
-        equity1 = compute_equity("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 5000)
+        equity1 = compute_equity("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 1)
         hits_before = compute_equity.cache_info().hits
-        equity2 = compute_equity("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 5000)
+        equity2 = compute_equity("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 1)
         assert compute_equity.cache_info().hits == hits_before + 1
         assert equity1 == equity2
 
@@ -919,21 +902,15 @@ class TestDateFilter:
     def test_get_sessions_since_far_future_returns_empty(
         self, db_with_data, hero_player_id
     ):
-        from pokerhero.analysis.queries import get_sessions
-
         df = get_sessions(db_with_data, hero_player_id, since_date="2099-01-01")
         assert df.empty
 
     def test_get_sessions_since_past_returns_all(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_sessions
-
         all_df = get_sessions(db_with_data, hero_player_id)
         filtered = get_sessions(db_with_data, hero_player_id, since_date="2000-01-01")
         assert len(filtered) == len(all_df)
 
     def test_get_sessions_since_none_returns_all(self, db_with_data, hero_player_id):
-        from pokerhero.analysis.queries import get_sessions
-
         all_df = get_sessions(db_with_data, hero_player_id)
         filtered = get_sessions(db_with_data, hero_player_id, since_date=None)
         assert len(filtered) == len(all_df)
@@ -941,8 +918,6 @@ class TestDateFilter:
     def test_get_hero_hand_players_since_far_future_returns_empty(
         self, db_with_data, hero_player_id
     ):
-        from pokerhero.analysis.queries import get_hero_hand_players
-
         df = get_hero_hand_players(
             db_with_data, hero_player_id, since_date="2099-01-01"
         )
@@ -951,24 +926,18 @@ class TestDateFilter:
     def test_get_hero_timeline_since_far_future_returns_empty(
         self, db_with_data, hero_player_id
     ):
-        from pokerhero.analysis.queries import get_hero_timeline
-
         df = get_hero_timeline(db_with_data, hero_player_id, since_date="2099-01-01")
         assert df.empty
 
     def test_get_hero_actions_since_far_future_returns_empty(
         self, db_with_data, hero_player_id
     ):
-        from pokerhero.analysis.queries import get_hero_actions
-
         df = get_hero_actions(db_with_data, hero_player_id, since_date="2099-01-01")
         assert df.empty
 
     def test_get_hero_opportunity_actions_since_far_future_returns_empty(
         self, db_with_data, hero_player_id
     ):
-        from pokerhero.analysis.queries import get_hero_opportunity_actions
-
         df = get_hero_opportunity_actions(
             db_with_data, hero_player_id, since_date="2099-01-01"
         )
@@ -1038,7 +1007,6 @@ class TestCurrencyFilter:
 
     def test_get_sessions_includes_currency_column(self, cdb):
         """get_sessions must return a 'currency' column."""
-        from pokerhero.analysis.queries import get_sessions
 
         conn, pid = cdb
         df = get_sessions(conn, pid)
@@ -1046,7 +1014,6 @@ class TestCurrencyFilter:
 
     def test_get_sessions_currency_type_real_returns_only_real(self, cdb):
         """currency_type='real' returns only EUR/USD sessions."""
-        from pokerhero.analysis.queries import get_sessions
 
         conn, pid = cdb
         df = get_sessions(conn, pid, currency_type="real")
@@ -1055,7 +1022,6 @@ class TestCurrencyFilter:
 
     def test_get_sessions_currency_type_play_returns_only_play(self, cdb):
         """currency_type='play' returns only PLAY sessions."""
-        from pokerhero.analysis.queries import get_sessions
 
         conn, pid = cdb
         df = get_sessions(conn, pid, currency_type="play")
@@ -1064,7 +1030,6 @@ class TestCurrencyFilter:
 
     def test_get_sessions_currency_type_none_returns_all(self, cdb):
         """currency_type=None (default) returns all sessions."""
-        from pokerhero.analysis.queries import get_sessions
 
         conn, pid = cdb
         df = get_sessions(conn, pid)
@@ -1074,7 +1039,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_hand_players_currency_real_filters(self, cdb):
         """currency_type='real' returns only hands from EUR/USD sessions."""
-        from pokerhero.analysis.queries import get_hero_hand_players
 
         conn, pid = cdb
         df = get_hero_hand_players(conn, pid, currency_type="real")
@@ -1082,7 +1046,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_hand_players_currency_play_filters(self, cdb):
         """currency_type='play' returns only hands from PLAY sessions."""
-        from pokerhero.analysis.queries import get_hero_hand_players
 
         conn, pid = cdb
         df = get_hero_hand_players(conn, pid, currency_type="play")
@@ -1092,7 +1055,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_timeline_currency_real_filters(self, cdb):
         """currency_type='real' returns only hands from real-money sessions."""
-        from pokerhero.analysis.queries import get_hero_timeline
 
         conn, pid = cdb
         df = get_hero_timeline(conn, pid, currency_type="real")
@@ -1100,7 +1062,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_timeline_currency_play_filters(self, cdb):
         """currency_type='play' returns only hands from play-money sessions."""
-        from pokerhero.analysis.queries import get_hero_timeline
 
         conn, pid = cdb
         df = get_hero_timeline(conn, pid, currency_type="play")
@@ -1110,7 +1071,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_actions_currency_real_filters(self, cdb):
         """currency_type='real' returns only post-flop actions from real sessions."""
-        from pokerhero.analysis.queries import get_hero_actions
 
         conn, pid = cdb
         df = get_hero_actions(conn, pid, currency_type="real")
@@ -1118,7 +1078,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_actions_currency_play_filters(self, cdb):
         """currency_type='play' returns only post-flop actions from play sessions."""
-        from pokerhero.analysis.queries import get_hero_actions
 
         conn, pid = cdb
         df = get_hero_actions(conn, pid, currency_type="play")
@@ -1128,7 +1087,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_opportunity_actions_currency_real_filters(self, cdb):
         """currency_type='real' filters opportunity actions to real sessions."""
-        from pokerhero.analysis.queries import get_hero_opportunity_actions
 
         conn, pid = cdb
         df = get_hero_opportunity_actions(conn, pid, currency_type="real")
@@ -1136,7 +1094,6 @@ class TestCurrencyFilter:
 
     def test_get_hero_opportunity_actions_currency_play_filters(self, cdb):
         """currency_type='play' filters opportunity actions to play sessions."""
-        from pokerhero.analysis.queries import get_hero_opportunity_actions
 
         conn, pid = cdb
         df = get_hero_opportunity_actions(conn, pid, currency_type="play")
@@ -1153,49 +1110,41 @@ class TestClassifyPlayer:
 
     def test_tag_tight_aggressive(self):
         """VPIP < 25% and PFR/VPIP >= 0.5 → TAG."""
-        from pokerhero.analysis.stats import classify_player
 
         assert classify_player(vpip_pct=20.0, pfr_pct=15.0, hands_played=20) == "TAG"
 
     def test_lag_loose_aggressive(self):
         """VPIP >= 25% and PFR/VPIP >= 0.5 → LAG."""
-        from pokerhero.analysis.stats import classify_player
 
         assert classify_player(vpip_pct=35.0, pfr_pct=25.0, hands_played=20) == "LAG"
 
     def test_nit_tight_passive(self):
         """VPIP < 25% and PFR/VPIP < 0.5 → Nit."""
-        from pokerhero.analysis.stats import classify_player
 
         assert classify_player(vpip_pct=15.0, pfr_pct=5.0, hands_played=20) == "Nit"
 
     def test_fish_loose_passive(self):
         """VPIP >= 25% and PFR/VPIP < 0.5 → Fish."""
-        from pokerhero.analysis.stats import classify_player
 
         assert classify_player(vpip_pct=40.0, pfr_pct=10.0, hands_played=20) == "Fish"
 
     def test_below_min_hands_returns_none(self):
         """Fewer than 15 hands returns None (insufficient sample)."""
-        from pokerhero.analysis.stats import classify_player
 
         assert classify_player(vpip_pct=30.0, pfr_pct=20.0, hands_played=14) is None
 
     def test_exactly_min_hands_classifies(self):
         """Exactly 15 hands is sufficient — returns a label, not None."""
-        from pokerhero.analysis.stats import classify_player
 
         assert classify_player(vpip_pct=30.0, pfr_pct=20.0, hands_played=15) is not None
 
     def test_zero_vpip_is_nit(self):
         """VPIP of 0% (never entered pot) → Nit."""
-        from pokerhero.analysis.stats import classify_player
 
         assert classify_player(vpip_pct=0.0, pfr_pct=0.0, hands_played=20) == "Nit"
 
     def test_boundary_vpip_25_is_loose(self):
         """VPIP exactly 25% is classified as Loose (≥ threshold)."""
-        from pokerhero.analysis.stats import classify_player
 
         # 25% VPIP with high aggression → LAG
         result = classify_player(vpip_pct=25.0, pfr_pct=20.0, hands_played=20)
@@ -1203,7 +1152,6 @@ class TestClassifyPlayer:
 
     def test_min_hands_kwarg_raises_threshold(self):
         """Passing min_hands=20 causes hands_played=18 to return None."""
-        from pokerhero.analysis.stats import classify_player
 
         assert (
             classify_player(vpip_pct=30.0, pfr_pct=20.0, hands_played=18, min_hands=20)
@@ -1212,7 +1160,6 @@ class TestClassifyPlayer:
 
     def test_min_hands_kwarg_allows_classification(self):
         """Passing min_hands=10 causes hands_played=12 to return an archetype."""
-        from pokerhero.analysis.stats import classify_player
 
         result = classify_player(
             vpip_pct=30.0, pfr_pct=20.0, hands_played=12, min_hands=10
@@ -1230,21 +1177,18 @@ class TestConfidenceTier:
 
     def test_below_50_is_preliminary(self):
         """Hands below 50 → 'preliminary' tier."""
-        from pokerhero.analysis.stats import confidence_tier
 
         assert confidence_tier(1) == "preliminary"
         assert confidence_tier(49) == "preliminary"
 
     def test_50_to_99_is_standard(self):
         """50–99 hands → 'standard' tier."""
-        from pokerhero.analysis.stats import confidence_tier
 
         assert confidence_tier(50) == "standard"
         assert confidence_tier(99) == "standard"
 
     def test_100_and_above_is_confirmed(self):
         """100+ hands → 'confirmed' tier."""
-        from pokerhero.analysis.stats import confidence_tier
 
         assert confidence_tier(100) == "confirmed"
         assert confidence_tier(500) == "confirmed"
@@ -1313,7 +1257,6 @@ class TestSessionPlayerStats:
 
     def test_returns_dataframe(self, sdb):
         """get_session_player_stats returns a DataFrame."""
-        from pokerhero.analysis.queries import get_session_player_stats
 
         conn, hero_pid, sid = sdb
         result = get_session_player_stats(conn, sid, hero_pid)
@@ -1321,7 +1264,6 @@ class TestSessionPlayerStats:
 
     def test_excludes_hero(self, sdb):
         """Hero is not included in the returned player stats."""
-        from pokerhero.analysis.queries import get_session_player_stats
 
         conn, hero_pid, sid = sdb
         result = get_session_player_stats(conn, sid, hero_pid)
@@ -1329,7 +1271,6 @@ class TestSessionPlayerStats:
 
     def test_includes_both_villains(self, sdb):
         """Both alice and bob are present in the results."""
-        from pokerhero.analysis.queries import get_session_player_stats
 
         conn, hero_pid, sid = sdb
         result = get_session_player_stats(conn, sid, hero_pid)
@@ -1338,7 +1279,6 @@ class TestSessionPlayerStats:
 
     def test_hands_played_count(self, sdb):
         """hands_played is the correct count of hands for each villain."""
-        from pokerhero.analysis.queries import get_session_player_stats
 
         conn, hero_pid, sid = sdb
         result = get_session_player_stats(conn, sid, hero_pid)
@@ -1347,7 +1287,6 @@ class TestSessionPlayerStats:
 
     def test_vpip_count(self, sdb):
         """vpip_count matches the number of hands each villain voluntarily entered."""
-        from pokerhero.analysis.queries import get_session_player_stats
 
         conn, hero_pid, sid = sdb
         result = get_session_player_stats(conn, sid, hero_pid)
@@ -1358,7 +1297,6 @@ class TestSessionPlayerStats:
 
     def test_pfr_count(self, sdb):
         """pfr_count matches the number of hands each villain raised preflop."""
-        from pokerhero.analysis.queries import get_session_player_stats
 
         conn, hero_pid, sid = sdb
         result = get_session_player_stats(conn, sid, hero_pid)
@@ -1369,7 +1307,6 @@ class TestSessionPlayerStats:
 
     def test_required_columns_present(self, sdb):
         """Result DataFrame has the required columns."""
-        from pokerhero.analysis.queries import get_session_player_stats
 
         conn, hero_pid, sid = sdb
         result = get_session_player_stats(conn, sid, hero_pid)
@@ -1386,7 +1323,7 @@ class TestSessionPlayerStats:
 class TestSessionAnalysisQueries:
     """Tests for get_session_kpis, get_session_hero_actions, get_session_showdown_hands.
 
-    Uses the shared db_with_data + hero_player_id + session_id module fixtures
+    Uses the shared db_with_data + hero_player_id + session_id session fixtures
     which ingest the two-hand play_money_two_hand_session fixture:
       Hand 1 — jsalinas96 BB, folds preflop (vpip=0, saw_flop=0, wts=0, net=-200)
       Hand 2 — jsalinas96 SB, calls/sees flop/loses showdown (vpip=1, saw_flop=1,
@@ -1400,7 +1337,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """get_session_kpis returns a DataFrame."""
-        from pokerhero.analysis.queries import get_session_kpis
 
         result = get_session_kpis(db_with_data, session_id, hero_player_id)
         assert isinstance(result, pd.DataFrame)
@@ -1409,7 +1345,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """get_session_kpis returns columns compatible with existing stats functions."""
-        from pokerhero.analysis.queries import get_session_kpis
 
         df = get_session_kpis(db_with_data, session_id, hero_player_id)
         assert {
@@ -1424,14 +1359,12 @@ class TestSessionAnalysisQueries:
 
     def test_get_session_kpis_row_count(self, db_with_data, hero_player_id, session_id):
         """One row per hand hero participated in (2 hands in fixture)."""
-        from pokerhero.analysis.queries import get_session_kpis
 
         df = get_session_kpis(db_with_data, session_id, hero_player_id)
         assert len(df) == 2
 
     def test_get_session_kpis_vpip_sum(self, db_with_data, hero_player_id, session_id):
         """Only hand 2 is a VPIP hand → sum(vpip) == 1."""
-        from pokerhero.analysis.queries import get_session_kpis
 
         df = get_session_kpis(db_with_data, session_id, hero_player_id)
         assert int(df["vpip"].sum()) == 1
@@ -1440,7 +1373,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """Only hand 2 reaches the flop → sum(saw_flop) == 1."""
-        from pokerhero.analysis.queries import get_session_kpis
 
         df = get_session_kpis(db_with_data, session_id, hero_player_id)
         assert int(df["saw_flop"].sum()) == 1
@@ -1449,7 +1381,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """Only hand 2 reaches showdown → sum(went_to_showdown) == 1."""
-        from pokerhero.analysis.queries import get_session_kpis
 
         df = get_session_kpis(db_with_data, session_id, hero_player_id)
         assert int(df["went_to_showdown"].sum()) == 1
@@ -1460,7 +1391,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """get_session_hero_actions returns a DataFrame."""
-        from pokerhero.analysis.queries import get_session_hero_actions
 
         result = get_session_hero_actions(db_with_data, session_id, hero_player_id)
         assert isinstance(result, pd.DataFrame)
@@ -1469,7 +1399,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """get_session_hero_actions has columns compatible with aggression_factor."""
-        from pokerhero.analysis.queries import get_session_hero_actions
 
         df = get_session_hero_actions(db_with_data, session_id, hero_player_id)
         assert {"hand_id", "street", "action_type", "position"} <= set(df.columns)
@@ -1478,7 +1407,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """No PREFLOP rows — only FLOP, TURN, RIVER."""
-        from pokerhero.analysis.queries import get_session_hero_actions
 
         df = get_session_hero_actions(db_with_data, session_id, hero_player_id)
         assert "PREFLOP" not in df["street"].values
@@ -1487,7 +1415,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """Hand 2: CHECK+CALL on FLOP, CHECK on TURN, CHECK+CALL on RIVER → 5 rows."""
-        from pokerhero.analysis.queries import get_session_hero_actions
 
         df = get_session_hero_actions(db_with_data, session_id, hero_player_id)
         assert len(df) == 5
@@ -1498,7 +1425,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """get_session_showdown_hands returns a DataFrame."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         result = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert isinstance(result, pd.DataFrame)
@@ -1507,7 +1433,6 @@ class TestSessionAnalysisQueries:
         self, db_with_data, hero_player_id, session_id
     ):
         """Result has all columns needed for EV computation."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         df = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert {
@@ -1801,7 +1726,6 @@ class TestSessionAnalysisQueriesShowdown:
         self, db_with_data, hero_player_id, session_id
     ):
         """Hand 1 is a preflop fold (no cards known) — only hand 2 returned."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         df = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert len(df) == 1
@@ -1810,7 +1734,6 @@ class TestSessionAnalysisQueriesShowdown:
         self, db_with_data, hero_player_id, session_id
     ):
         """Hero hole cards in hand 2 are Tc Jd."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         df = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert df.iloc[0]["hero_cards"] == "Tc Jd"
@@ -1819,7 +1742,6 @@ class TestSessionAnalysisQueriesShowdown:
         self, db_with_data, hero_player_id, session_id
     ):
         """Villain (Bob) hole cards in hand 2 are Kh Qd."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         df = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert df.iloc[0]["villain_cards"] == "Kh Qd"
@@ -1828,7 +1750,6 @@ class TestSessionAnalysisQueriesShowdown:
         self, db_with_data, hero_player_id, session_id
     ):
         """Villain username is Bob."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         df = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert df.iloc[0]["villain_username"] == "Bob"
@@ -1837,7 +1758,6 @@ class TestSessionAnalysisQueriesShowdown:
         self, db_with_data, hero_player_id, session_id
     ):
         """Board string is non-empty for hand 2 (full 5-card board)."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         df = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert df.iloc[0]["board"].strip() != ""
@@ -1846,7 +1766,6 @@ class TestSessionAnalysisQueriesShowdown:
         self, db_with_data, hero_player_id, session_id
     ):
         """Hero lost hand 2 → net_result < 0."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         df = get_session_showdown_hands(db_with_data, session_id, hero_player_id)
         assert df.iloc[0]["net_result"] < 0
@@ -1862,21 +1781,18 @@ class TestComputeEquityMultiway:
 
     def test_returns_float(self):
         """compute_equity_multiway returns a float."""
-        from pokerhero.analysis.stats import compute_equity_multiway
 
         result = compute_equity_multiway("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 500)
         assert isinstance(result, float)
 
     def test_high_equity_hand_near_one(self):
         """Royal flush (Ah Kh on QhJhTh9d2s) vs trash → equity near 1.0."""
-        from pokerhero.analysis.stats import compute_equity_multiway
 
         result = compute_equity_multiway("Ah Kh", "2c 3d", "Qh Jh Th 9d 2s", 1000)
         assert result > 0.95
 
     def test_two_villains_reduces_equity(self):
         """Adding a second villain lowers hero equity vs heads-up."""
-        from pokerhero.analysis.stats import compute_equity, compute_equity_multiway
 
         # Use a board where hero has a mediocre hand to amplify the difference
         heads_up = compute_equity("7s 8s", "2c 3d", "Ah Kd Qc", 2000)
@@ -1885,7 +1801,6 @@ class TestComputeEquityMultiway:
 
     def test_single_villain_close_to_compute_equity(self):
         """Single villain produces equity within MC noise of compute_equity."""
-        from pokerhero.analysis.stats import compute_equity, compute_equity_multiway
 
         # Use a large sample count to reduce Monte Carlo variance
         eq1 = compute_equity("Ah Kh", "2c 3d", "Qh Jh Th", 5000)
@@ -1972,7 +1887,6 @@ class TestGetSessionShowdownHandsMultiway:
 
     def test_villain_cards_pipe_separated_for_multiway(self, multiway_db):
         """Two villains → villain_cards contains a pipe separator."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         conn, sid, hero_id = multiway_db
         df = get_session_showdown_hands(conn, sid, hero_id)
@@ -1981,7 +1895,6 @@ class TestGetSessionShowdownHandsMultiway:
 
     def test_villain_username_comma_separated_for_multiway(self, multiway_db):
         """Two villains → villain_username contains both names."""
-        from pokerhero.analysis.queries import get_session_showdown_hands
 
         conn, sid, hero_id = multiway_db
         df = get_session_showdown_hands(conn, sid, hero_id)
@@ -2129,6 +2042,39 @@ class TestReadTargetSettings:
         assert result[("vpip", "btn")]["green_min"] == 30.0
         assert result[("vpip", "btn")]["green_max"] == 45.0
 
+    def test_read_does_not_write_when_table_exists(self):
+        """A read on an initialised DB issues no writes (no seeding per read)."""
+        from pokerhero.analysis.targets import read_target_settings
+        from pokerhero.database.db import init_db
+
+        conn = init_db(":memory:")
+        before = conn.total_changes
+        read_target_settings(conn)
+        assert conn.total_changes == before
+        assert not conn.in_transaction
+
+    def test_write_target_settings_upserts_all_rows(self):
+        """write_target_settings stores every row in one call."""
+        import sqlite3
+
+        from pokerhero.analysis.targets import (
+            read_target_settings,
+            write_target_settings,
+        )
+
+        conn = sqlite3.connect(":memory:")
+        write_target_settings(
+            conn,
+            [
+                ("vpip", "btn", 30.0, 45.0, 24.0, 52.0),
+                ("pfr", "sb", 10.0, 20.0, 5.0, 25.0),
+            ],
+        )
+        conn.commit()
+        result = read_target_settings(conn)
+        assert result[("vpip", "btn")]["yellow_max"] == 52.0
+        assert result[("pfr", "sb")]["green_min"] == 10.0
+
 
 # ---------------------------------------------------------------------------
 # TestSeedTargetDefaults — seed_target_defaults writes defaults to DB
@@ -2516,8 +2462,6 @@ class TestComputeEquityVsRange:
     """Integration tests for compute_equity_vs_range in stats.py."""
 
     def _fn(self, **kwargs):
-        from pokerhero.analysis.stats import compute_equity_vs_range
-
         defaults = dict(
             hero_cards="Th Td",
             board="Ah Kh Qh",
@@ -2580,3 +2524,25 @@ class TestComputeEquityVsRange:
             pfr_pct=40.0,
         )
         assert size_4bet < size_2bet
+
+
+class TestBoardsByStreet:
+    """Unit tests for the per-hand street → board map in stats.py."""
+
+    def test_matches_board_at_street_for_every_street(self):
+        """Each entry equals the board _board_at_street returns for that street."""
+
+        boards = _boards_by_street("Ah Kh Qh", "2c", "3d")
+        for street in ("PREFLOP", "FLOP", "TURN", "RIVER"):
+            assert boards[street] == _board_at_street("Ah Kh Qh", "2c", "3d", street)
+
+    def test_missing_streets_yield_partial_board(self):
+        """A hand that ended on the flop has the flop on TURN and RIVER."""
+
+        boards = _boards_by_street("Ah Kh Qh", None, None)
+        assert boards == {
+            "PREFLOP": "",
+            "FLOP": "Ah Kh Qh",
+            "TURN": "Ah Kh Qh",
+            "RIVER": "Ah Kh Qh",
+        }
@@ -332,3 +332,29 @@ class TestDashboardFmtPnl:
 
         result = _fmt_pnl(0.000001)
         assert "e" not in result.lower(), f"Scientific notation: {result}"
+
+
+class TestDashboardHeroLookup:
+    """_get_hero_player_id reads the hero id without taking the write lock."""
+
+    def test_hero_lookup_works_while_write_lock_is_held(self, tmp_path):
+        """An ingest holding BEGIN IMMEDIATE must not block the hero lookup."""
+        import sqlite3
+
+        from pokerhero.database.db import init_db, set_setting, upsert_player
+        from pokerhero.frontend.pages.dashboard import _get_hero_player_id
+
+        path = str(tmp_path / "a.db")
+        conn = init_db(path)
+        set_setting(conn, "hero_username", "hero")
+        player_id = upsert_player(conn, "hero")
+        conn.commit()
+        conn.close()
+
+        writer = sqlite3.connect(path, timeout=0)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            assert _get_hero_player_id(path) == player_id
+        finally:
+            writer.rollback()
+            writer.close()
@@ -1,3 +1,4 @@
+import contextlib
 import sqlite3
 from pathlib import Path
 
@@ -232,6 +233,45 @@ class TestConnection:
         assert result[0] == 1
         conn.close()
 
+    def test_file_database_uses_wal_and_normal_sync(self, tmp_path):
+        """File databases get WAL journaling and synchronous=NORMAL."""
+        from pokerhero.database.db import get_connection
+
+        conn = get_connection(tmp_path / "test.db")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        conn.close()
+
+    def test_wal_persists_for_later_connections(self, tmp_path):
+        """A second connection to the same file still sees WAL mode."""
+        from pokerhero.database.db import get_connection
+
+        db_path = tmp_path / "test.db"
+        get_connection(db_path).close()
+        conn = get_connection(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_recreated_file_is_switched_back_to_wal(self, tmp_path):
+        """A file deleted and recreated at the same path gets WAL again."""
+        from pokerhero.database.db import get_connection
+
+        db_path = tmp_path / "test.db"
+        get_connection(db_path).close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        conn = get_connection(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_memory_database_skips_file_pragmas(self):
+        from pokerhero.database.db import get_connection
+
+        conn = get_connection(":memory:")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        conn.close()
+
     def test_init_db_creates_tables(self, tmp_path):
         from pokerhero.database.db import init_db
 
@@ -1055,6 +1095,62 @@ class TestSettings:
         set_setting(idb, "hero_username", "jsalinas96")
         assert get_setting(idb, "other_key", default="fallback") == "fallback"
 
+    def test_get_settings_returns_only_stored_keys(self, idb):
+        from pokerhero.database.db import get_settings, set_setting
+
+        set_setting(idb, "hero_username", "jsalinas96")
+        set_setting(idb, "min_hands_classification", "20")
+        result = get_settings(
+            idb, ["hero_username", "min_hands_classification", "missing_key"]
+        )
+        assert result == {
+            "hero_username": "jsalinas96",
+            "min_hands_classification": "20",
+        }
+
+    def test_get_settings_with_no_keys_is_empty(self, idb):
+        from pokerhero.database.db import get_settings
+
+        assert get_settings(idb, []) == {}
+
+    def test_set_settings_upserts_every_pair(self, idb):
+        from pokerhero.database.db import get_settings, set_setting, set_settings
+
+        set_setting(idb, "hero_username", "old")
+        set_settings(idb, [("hero_username", "new"), ("min_hands_classification", "9")])
+        assert get_settings(idb, ["hero_username", "min_hands_classification"]) == {
+            "hero_username": "new",
+            "min_hands_classification": "9",
+        }
+
+
+class TestPlayerExists:
+    @pytest.fixture
+    def idb(self, tmp_path):
+        from pokerhero.database.db import init_db
+
+        conn = init_db(tmp_path / "test.db")
+        yield conn
+        conn.close()
+
+    def test_existing_player(self, idb):
+        from pokerhero.database.db import player_exists, upsert_player
+
+        upsert_player(idb, "jsalinas96")
+        assert player_exists(idb, "jsalinas96") is True
+
+    def test_missing_player(self, idb):
+        from pokerhero.database.db import player_exists
+
+        assert player_exists(idb, "nobody") is False
+
+    def test_get_player_id(self, idb):
+        from pokerhero.database.db import get_player_id, upsert_player
+
+        player_id = upsert_player(idb, "jsalinas96")
+        assert get_player_id(idb, "jsalinas96") == player_id
+        assert get_player_id(idb, "nobody") is None
+
 
 class TestFavorites:
     """Tests for is_favorite schema column and toggle functions."""
@@ -1475,3 +1571,55 @@ class TestActionEvCache:
         row = get_action_ev(db, aid, hero_id)
         assert row is not None
         assert row["ev_type"] == "range"
+
+
+class TestConnectionPool:
+    def test_connection_is_reused(self, tmp_path):
+        from pokerhero.database import pool
+
+        db_path = tmp_path / "pool.db"
+        with pool.acquire(db_path) as first:
+            pass
+        with pool.acquire(db_path) as second:
+            assert second is first
+        pool.close_all()
+
+    def test_concurrent_borrowers_get_distinct_connections(self, tmp_path):
+        from pokerhero.database import pool
+
+        db_path = tmp_path / "pool.db"
+        with pool.acquire(db_path) as a, pool.acquire(db_path) as b:
+            assert a is not b
+        pool.close_all()
+
+    def test_uncommitted_work_is_rolled_back_on_release(self, tmp_path):
+        from pokerhero.database import pool
+        from pokerhero.database.db import init_db
+
+        db_path = tmp_path / "pool.db"
+        init_db(db_path).close()
+        with pytest.raises(RuntimeError):
+            with pool.acquire(db_path) as conn:
+                conn.execute("INSERT INTO settings (key, value) VALUES ('k', 'v')")
+                raise RuntimeError
+        with pool.acquire(db_path) as conn:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM settings").fetchone()[0] == 0
+        pool.close_all()
+
+    def test_idle_connections_are_capped(self, tmp_path):
+        from pokerhero.database import pool
+
+        db_path = tmp_path / "pool.db"
+        with contextlib.ExitStack() as stack:
+            for _ in range(pool._MAX_IDLE + 2):
+                stack.enter_context(pool.acquire(db_path))
+        assert len(pool._POOLS[str(db_path)]) == pool._MAX_IDLE
+        pool.close_all()
+
+    def test_memory_database_is_rejected(self):
+        from pokerhero.database import pool
+
+        with pytest.raises(ValueError):
+            with pool.acquire(":memory:"):
+                pass
@@ -47,6 +47,22 @@ class TestSplitHands:
         for block in split_hands(text):
             assert block == block.strip()
 
+    def test_text_before_first_hand_is_discarded(self):
+        from pokerhero.ingestion.splitter import split_hands
+
+        text = "junk header\n\nPokerStars Hand #1: a\n\nPokerStars Hand #2: b\n"
+        assert split_hands(text) == ["PokerStars Hand #1: a", "PokerStars Hand #2: b"]
+
+    def test_iter_hands_is_lazy_and_matches_split_hands(self):
+        import types
+
+        from pokerhero.ingestion.splitter import iter_hands, split_hands
+
+        text = FRATERNITAS.read_text(encoding="utf-8")
+        blocks = iter_hands(text)
+        assert isinstance(blocks, types.GeneratorType)
+        assert list(blocks) == split_hands(text)
+
 
 class TestIngestFile:
     @pytest.fixture
@@ -111,6 +127,87 @@ class TestIngestFile:
         assert result.file_path == str(FRATERNITAS)
 
 
+class TestIngestText:
+    @pytest.fixture
+    def db(self, tmp_path):
+        from pokerhero.database.db import init_db
+
+        conn = init_db(tmp_path / "test.db")
+        yield conn
+        conn.close()
+
+    def test_ingests_text_without_a_file(self, db):
+        from pokerhero.ingestion.pipeline import ingest_text
+
+        text = FRATERNITAS.read_text(encoding="utf-8")
+        result = ingest_text(text, "jsalinas96", db, source="upload.txt")
+        assert result.ingested == 2
+        assert result.file_path == "upload.txt"
+        assert db.execute("SELECT COUNT(*) FROM hands").fetchone()[0] == 2
+
+    def test_matches_ingest_file(self, db, tmp_path):
+        from pokerhero.database.db import init_db
+        from pokerhero.ingestion.pipeline import ingest_file, ingest_text
+
+        text_result = ingest_text(FRATERNITAS.read_text(), "jsalinas96", db)
+        other = init_db(tmp_path / "other.db")
+        file_result = ingest_file(FRATERNITAS, "jsalinas96", other)
+        other.close()
+        assert (text_result.ingested, text_result.skipped, text_result.failed) == (
+            file_result.ingested,
+            file_result.skipped,
+            file_result.failed,
+        )
+
+    def test_entry_points_persist_identical_rows(self, tmp_path):
+        """ingest_file, ingest_text and handle_upload store the same data."""
+        import base64
+
+        from pokerhero.database.db import init_db
+        from pokerhero.frontend.upload_handler import handle_upload
+        from pokerhero.ingestion.pipeline import ingest_file, ingest_text
+
+        uri = "data:text/plain;base64," + base64.b64encode(
+            REBUY_FIXTURE.read_bytes()
+        ).decode("ascii")
+        runs = {
+            "file": lambda c: ingest_file(REBUY_FIXTURE, "jsalinas96", c),
+            "text": lambda c: ingest_text(REBUY_FIXTURE.read_text(), "jsalinas96", c),
+            "upload": lambda c: handle_upload(uri, REBUY_FIXTURE.name, "jsalinas96", c),
+        }
+        snapshots = {}
+        for label, run in runs.items():
+            conn = init_db(tmp_path / f"{label}.db")
+            run(conn)
+            snapshots[label] = (
+                conn.execute(
+                    "SELECT hero_buy_in, hero_cash_out FROM sessions"
+                ).fetchall(),
+                conn.execute(
+                    "SELECT source_hand_id, total_pot FROM hands ORDER BY 1"
+                ).fetchall(),
+                conn.execute("SELECT COUNT(*) FROM actions").fetchone()[0],
+            )
+            conn.close()
+        assert snapshots["file"][2] > 0
+        assert snapshots["file"] == snapshots["text"] == snapshots["upload"]
+
+    def test_each_block_is_parsed_once(self, db):
+        """The first block's metadata parse is reused for its hand row."""
+        from unittest import mock
+
+        from pokerhero.ingestion.pipeline import ingest_text
+        from pokerhero.parser.hand_parser import HandParser
+
+        parser = HandParser(hero_username="jsalinas96")
+        with mock.patch.object(parser, "parse", wraps=parser.parse) as parse:
+            result = ingest_text(
+                FRATERNITAS.read_text(), "jsalinas96", db, parser=parser
+            )
+        assert result.ingested == 2
+        assert parse.call_count == 2
+
+
 class TestIngestDirectory:
     @pytest.fixture
     def db(self, tmp_path):
@@ -154,6 +251,21 @@ class TestIngestDirectory:
 
         assert ingest_directory(tmp_path, "jsalinas96", db) == []
 
+    def test_one_parser_shared_across_files(self, db, tmp_path):
+        import shutil
+        from unittest import mock
+
+        from pokerhero.ingestion import pipeline
+
+        shutil.copy(FRATERNITAS, tmp_path / "a.txt")
+        shutil.copy(REBUY_FIXTURE, tmp_path / "b.txt")
+        with mock.patch.object(
+            pipeline, "HandParser", wraps=pipeline.HandParser
+        ) as parser_cls:
+            results = pipeline.ingest_directory(tmp_path, "jsalinas96", db)
+        assert len(results) == 2
+        assert parser_cls.call_count == 1
+
 
 class TestHeroBuyInWithRebuy:
     @pytest.fixture
@@ -200,6 +312,18 @@ class TestHeroBuyInWithRebuy:
         # (42368 - 42368) + (49500 - 50000) = -500
         assert abs((row[1] - row[0]) - net_row[0]) < 0.01
 
+    def test_hero_financials_adds_each_rebuy(self):
+        from decimal import Decimal
+
+        from pokerhero.ingestion.pipeline import _hero_financials
+
+        stacks = [
+            (Decimal("100"), Decimal("-100")),  # busts
+            (Decimal("100"), Decimal("20")),  # re-buy of 100
+            (Decimal("120"), Decimal("-30")),  # continues from 120
+        ]
+        assert _hero_financials(stacks) == (Decimal("200"), Decimal("90"))
+
 
 class TestSessionFinancials:
     @pytest.fixture
@@ -325,6 +449,21 @@ class TestBOMHandling:
         blocks = split_hands(bom_text)
         assert len(blocks) == 2
 
+    def test_decode_history_strips_only_a_leading_bom(self):
+        from pokerhero.ingestion.pipeline import decode_history
+
+        raw = FRATERNITAS.read_bytes()
+        assert decode_history(b"\xef\xbb\xbf" + raw) == raw.decode("utf-8")
+        assert decode_history(raw) == raw.decode("utf-8")
+
+    def test_crlf_file_ingests_successfully(self, db, tmp_path):
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        crlf_file = tmp_path / "crlf_session.txt"
+        crlf_file.write_bytes(FRATERNITAS.read_bytes().replace(b"\n", b"\r\n"))
+        result = ingest_file(crlf_file, "jsalinas96", db)
+        assert result.ingested == 2
+
 
 class TestCRLFHandling:
     """M4: Files with CRLF line endings must split correctly."""
@@ -345,6 +484,13 @@ class TestCRLFHandling:
         for block in split_hands(crlf_text):
             assert "\r" not in block
 
+    def test_bare_cr_line_endings_are_normalised(self):
+        from pokerhero.ingestion.splitter import split_hands
+
+        raw = FRATERNITAS.read_text(encoding="utf-8")
+        blocks = split_hands(raw.replace("\n", "\r"))
+        assert blocks == split_hands(raw)
+
 
 class TestOrphanedSession:
     """M3: No orphaned sessions when all hands fail to insert."""
@@ -371,6 +517,105 @@ class TestOrphanedSession:
         assert count == 0, "Orphaned session should be cleaned up"
 
 
+class TestSingleTransactionIngest:
+    """A file is written in one transaction with a savepoint per hand."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        from pokerhero.database.db import init_db
+
+        conn = init_db(tmp_path / "test.db")
+        yield conn
+        conn.close()
+
+    def test_one_commit_per_file(self, db):
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        statements: list[str] = []
+        db.set_trace_callback(statements.append)
+        result = ingest_file(FRATERNITAS, "jsalinas96", db)
+        db.set_trace_callback(None)
+        assert result.ingested == 2
+        assert sum(s.strip().upper() == "COMMIT" for s in statements) == 1
+
+    def test_write_lock_taken_up_front(self, db):
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        statements: list[str] = []
+        db.set_trace_callback(statements.append)
+        ingest_file(FRATERNITAS, "jsalinas96", db)
+        db.set_trace_callback(None)
+        begins = [s for s in statements if s.strip().upper().startswith("BEGIN")]
+        assert begins == ["BEGIN IMMEDIATE"]
+
+    def test_autocommit_connection_is_committed(self, tmp_path):
+        from pokerhero.database.db import get_connection, init_db
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        path = tmp_path / "auto.db"
+        init_db(path).close()
+        conn = get_connection(path)
+        conn.isolation_level = None
+        assert ingest_file(FRATERNITAS, "jsalinas96", conn).ingested == 2
+        assert not conn.in_transaction
+        conn.close()
+        other = get_connection(path)
+        assert other.execute("SELECT COUNT(*) FROM hands").fetchone()[0] == 2
+        other.close()
+
+    def test_failed_first_hand_keeps_session_for_later_hands(self, db, monkeypatch):
+        from pokerhero.database.db import save_parsed_hand
+        from pokerhero.ingestion import pipeline
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        calls = {"n": 0}
+
+        def _fail_first(conn, parsed, session_id):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                save_parsed_hand(conn, parsed, session_id)  # partial writes
+                raise RuntimeError("injected")
+            save_parsed_hand(conn, parsed, session_id)
+
+        monkeypatch.setattr(pipeline, "save_parsed_hand", _fail_first)
+        result = ingest_file(FRATERNITAS, "jsalinas96", db)
+        assert (result.ingested, result.failed) == (1, 1)
+        assert db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 1
+        assert db.execute("SELECT COUNT(*) FROM hands").fetchone()[0] == 1
+        assert not db.in_transaction
+
+    def test_caller_transaction_is_left_open(self, db):
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        db.execute("INSERT INTO settings (key, value) VALUES ('pending', '1')")
+        assert db.in_transaction
+        assert ingest_file(FRATERNITAS, "jsalinas96", db).ingested == 2
+        assert db.in_transaction
+        # Nothing was committed behind the caller's back.
+        db.rollback()
+        assert db.execute("SELECT COUNT(*) FROM hands").fetchone()[0] == 0
+        assert (
+            db.execute("SELECT * FROM settings WHERE key = 'pending'").fetchone()
+            is None
+        )
+
+    def test_failed_file_keeps_caller_pending_writes(self, db, monkeypatch):
+        from pokerhero.ingestion import pipeline
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        def _boom(*args, **kwargs):
+            raise RuntimeError("injected")
+
+        db.execute("INSERT INTO settings (key, value) VALUES ('pending', '1')")
+        monkeypatch.setattr(pipeline, "update_session_financials", _boom)
+        with pytest.raises(RuntimeError):
+            ingest_file(FRATERNITAS, "jsalinas96", db)
+        assert db.in_transaction
+        assert db.execute("SELECT COUNT(*) FROM hands").fetchone()[0] == 0
+        row = db.execute("SELECT value FROM settings WHERE key = 'pending'").fetchone()
+        assert row[0] == "1"
+
+
 class TestIntegrityErrorClassification:
     """M5: Only source_hand_id duplicates should be classified as skipped."""
 
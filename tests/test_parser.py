@@ -1475,11 +1475,10 @@ class TestRegexRejectsMalformedAmounts:
         m = _RE_ACTION.match("Player1: bets 1.2.3")
         assert m is None or "." not in (m.group(3) or "").replace(".", "", 1)
 
-    def test_uncalled_regex_rejects_multi_dot_amount(self):
-        from pokerhero.parser.hand_parser import _RE_UNCALLED
+    def test_uncalled_split_rejects_multi_dot_amount(self):
+        from pokerhero.parser.hand_parser import _split_uncalled
 
-        m = _RE_UNCALLED.match("Uncalled bet (1.2.3) returned to Player1")
-        assert m is None or "." not in (m.group(1) or "").replace(".", "", 1)
+        assert _split_uncalled("Uncalled bet (1.2.3) returned to Player1") is None
 
     def test_collected_regex_rejects_multi_dot_amount(self):
         from pokerhero.parser.hand_parser import _RE_COLLECTED
@@ -1492,3 +1491,451 @@ class TestRegexRejectsMalformedAmounts:
 
         m = _RE_SUMMARY_POT.match("Total pot 1.2.3 | Rake 0.4.5")
         assert m is None or "." not in (m.group(1) or "").replace(".", "", 1)
+
+
+# ===========================================================================
+# Body-line classification — one alternation regex per line
+# ===========================================================================
+
+
+class TestBodyLineClassification:
+    """_RE_BODY tags each body line with the same kind the old cascade did."""
+
+    def _classify(self, line):
+        from pokerhero.parser.hand_parser import _RE_BODY
+
+        m = _RE_BODY.match(line)
+        if m is None:
+            return None, ()
+        g = m.lastindex
+        return m.lastgroup, m.groups()[g : g + 4]
+
+    def test_each_kind_is_tagged_with_its_captures(self):
+        cases = {
+            "Villain collected 5 from pot": ("collected", ("Villain", "5")),
+            "Villain: shows [Qs Qh]": ("shows", ("Villain", "Qs Qh")),
+            "Villain: mucks hand": ("mucks", ("Villain",)),
+            "Villain: posts the ante 10": ("ante", ("Villain", "10")),
+            "Villain: posts big blind $0.10": ("blind", ("Villain", "0.10")),
+            "Hero: raises 2 to 3 and is all-in": (
+                "action",
+                ("Hero", "raises", "2", "3"),
+            ),
+        }
+        for line, (tag, captures) in cases.items():
+            got_tag, got = self._classify(line)
+            assert got_tag == tag, line
+            assert got[: len(captures)] == captures, line
+
+    def test_noise_lines_are_recognised_without_regex(self):
+        from pokerhero.parser.hand_parser import _is_noise
+
+        for line in (
+            "Villain: doesn't show hand",
+            "*** FLOP *** [Ah Kd 2c]",
+            "Villain is disconnected",
+            "Villain has timed out while disconnected",
+            "Villain leaves the table",
+            "Villain joins the table at seat #4",
+            "Villain will be allowed to play after the button",
+            "Villain out of hand (moved from another table into small blind)",
+        ):
+            assert _is_noise(line), line
+        assert not _is_noise("Villain: folds")
+        assert not _is_noise("Villain has timed out and folds")
+
+    def test_unrecognised_line_does_not_match(self):
+        assert self._classify('Villain said, "nice hand"')[0] is None
+
+
+class TestStreetMarkers:
+    """Street transitions are read from "***" lines only."""
+
+    def test_board_suffix_on_marker_line_still_changes_street(self):
+        hand = HandParser(hero_username=HERO).parse(
+            (FIXTURES_DIR / "cash_hero_wins_showdown.txt").read_text()
+        )
+        streets = {a.street for a in hand.actions}
+        assert {"PREFLOP", "FLOP"} <= streets
+
+    def test_lines_after_summary_are_not_actions(self):
+        text = (FIXTURES_DIR / "cash_hero_wins_showdown.txt").read_text()
+        base = HandParser(hero_username=HERO).parse(text)
+        extra = HandParser(hero_username=HERO).parse(
+            text.rstrip() + f"\n{HERO}: bets 5\n"
+        )
+        assert len(extra.actions) == len(base.actions)
+
+
+class TestParseTimestamp:
+    def test_matches_strptime(self):
+        from datetime import datetime
+
+        from pokerhero.parser.hand_parser import _parse_timestamp
+
+        ts = "2024/02/29 23:05:09"
+        assert _parse_timestamp(ts) == datetime.strptime(ts, "%Y/%m/%d %H:%M:%S")
+
+    def test_out_of_range_field_raises(self):
+        from pokerhero.parser.hand_parser import _parse_timestamp
+
+        with pytest.raises(ValueError):
+            _parse_timestamp("2023/02/29 10:00:00")
+
+
+class TestMergedHeaderRegex:
+    def test_tournament_header_selects_tourn_branch(self):
+        from pokerhero.parser.hand_parser import _RE_HEADER
+
+        m = _RE_HEADER.search(
+            "PokerStars Hand #1: Tournament #99, 100+10 Hold'em No Limit"
+            " - Level IV (50/100) - 2024/01/02 03:04:05 CET"
+        )
+        assert m is not None
+        assert m.lastgroup == "tourn"
+        assert (m["tourn_id"], m["level"], m["t_bb"]) == ("99", "Level IV", "100")
+
+    def test_cash_header_selects_cash_branch(self):
+        from pokerhero.parser.hand_parser import _RE_HEADER
+
+        m = _RE_HEADER.search(
+            "PokerStars Hand #7: Hold'em No Limit (€0.02/€0.05 EUR)"
+            " - 2024/01/02 03:04:05 CET"
+        )
+        assert m is not None
+        assert m.lastgroup == "cash"
+        assert (m["currency"], m["c_sb"], m["c_bb"]) == ("€", "0.02", "0.05")
+
+
+class TestCentsConversion:
+    @pytest.mark.parametrize(
+        "raw, cents",
+        [("0.02", 2), ("0.1", 10), ("1.50", 150), ("3", 300), ("12500", 1250000)],
+    )
+    def test_to_cents(self, raw, cents):
+        from pokerhero.parser.hand_parser import _to_cents
+
+        assert _to_cents(raw) == cents
+
+    def test_round_trip_matches_decimal(self):
+        from decimal import Decimal
+
+        from pokerhero.parser.hand_parser import _from_cents, _to_cents
+
+        for raw in ("0.02", "0.25", "7.05", "1500"):
+            assert _from_cents(_to_cents(raw)) == Decimal(raw)
+
+
+class TestDecimalMemo:
+    def test_repeated_amount_reuses_instance(self):
+        from decimal import Decimal
+
+        from pokerhero.parser.hand_parser import _dec
+
+        first = _dec("0.25")
+        assert first == Decimal("0.25")
+        assert _dec("0.25") is first
+
+
+class TestLineNormalisation:
+    def test_surrounding_whitespace_is_ignored(self):
+        text = (FIXTURES_DIR / "cash_hero_wins_showdown.txt").read_text()
+        padded = "\n".join(f"  {ln}\t " for ln in text.splitlines())
+        base = HandParser(hero_username=HERO).parse(text)
+        assert HandParser(hero_username=HERO).parse(padded) == base
+
+
+class TestSummaryUsername:
+    @pytest.mark.parametrize(
+        "line, marker, expected",
+        [
+            ("Seat 1: Hero (button) showed [Ah Kd] and won (5)", " showed ", "Hero"),
+            (
+                "Seat 2: Vil (la) in (small blind) collected (3)",
+                " collected",
+                "Vil (la) in",
+            ),
+            ("Seat 4: a: b collected (1)", " collected", "a: b"),
+            ("Seat 6: Bob mucked [2c 2d]", " mucked", "Bob"),
+        ],
+    )
+    def test_extracts_name_without_position_tag(self, line, marker, expected):
+        from pokerhero.parser.hand_parser import _summary_username
+
+        assert _summary_username(line, marker) == expected
+
+
+class TestActionPreScreen:
+    def test_prescreen_agrees_with_body_regex_on_fixtures(self):
+        from pokerhero.parser.hand_parser import _ACTION_VERBS, _RE_BODY
+
+        for path in FIXTURES_DIR.glob("*.txt"):
+            for line in path.read_text(encoding="utf-8-sig").splitlines():
+                line = line.strip()
+                colon = line.find(": ")
+                screened = (
+                    colon > 0 and line[colon + 2 :].split(" ", 1)[0] in _ACTION_VERBS
+                )
+                m = _RE_BODY.match(line)
+                assert screened == (m is not None and m.lastgroup == "action"), line
+
+
+class TestPositionsForSeats:
+    def test_rotates_from_button(self):
+        from pokerhero.parser.hand_parser import _positions_for_seats
+
+        assert _positions_for_seats((1, 3, 5), 3) == {3: "BTN", 5: "SB", 1: "BB"}
+
+    def test_missing_button_and_unusual_counts(self):
+        from pokerhero.parser.hand_parser import _positions_for_seats
+
+        assert _positions_for_seats((2, 4), 9) == {2: "BTN", 4: "BB"}
+        assert _positions_for_seats((7,), 7) == {7: "P0"}
+        assert _positions_for_seats((), 1) == {}
+
+    def test_repeated_seating_is_cached(self):
+        from pokerhero.parser.hand_parser import _positions_for_seats
+
+        first = _positions_for_seats((1, 2, 4, 6), 4)
+        assert _positions_for_seats((1, 2, 4, 6), 4) is first
+
+    def test_cached_mapping_is_read_only(self):
+        from pokerhero.parser.hand_parser import _positions_for_seats
+
+        positions = _positions_for_seats((1, 2, 4, 6), 4)
+        with pytest.raises(TypeError):
+            positions[1] = "BTN"  # type: ignore[index]
+        assert _positions_for_seats((1, 2, 4, 6), 4)[1] != "BTN"
+
+
+class TestSectionBoundaries:
+    def test_hand_without_summary_has_empty_summary_fields(self):
+        text = (FIXTURES_DIR / "cash_hero_wins_showdown.txt").read_text()
+        body = text.split("*** SUMMARY ***")[0]
+        hand = HandParser(hero_username=HERO).parse(body)
+        assert hand.hand.total_pot == Decimal("0")
+        assert hand.hand.board_flop is None
+
+    def test_summary_section_is_parsed_from_its_marker(self, cash_wins_showdown):
+        assert cash_wins_showdown.hand.total_pot > Decimal("0")
+        assert cash_wins_showdown.hand.board_river is not None
+
+    def test_body_starts_after_the_seat_lines(self):
+        text = (FIXTURES_DIR / "cash_hero_wins_showdown.txt").read_text()
+        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+        seats, body_start = HandParser(hero_username=HERO)._parse_seats(lines)
+        assert len(seats) == 9
+        assert lines[body_start - 1].startswith("Seat 7:")
+        assert lines[body_start] == "milchka259: posts small blind 100"
+
+    def test_no_seat_lines_starts_body_after_headers(self):
+        lines = ["PokerStars Hand #1: ...", "Table 'T' ...", "*** HOLE CARDS ***"]
+        assert HandParser(hero_username=HERO)._parse_seats(lines) == ({}, 2)
+
+
+class TestPrefixLineSplitting:
+    """_split_dealt / _split_uncalled pull the fields out of prefix lines."""
+
+    def test_split_dealt(self):
+        from pokerhero.parser.hand_parser import _split_dealt
+
+        for line, expected in (
+            ("Dealt to Hero [Ah Kd]", ("Hero", "Ah Kd")),
+            ("Dealt to Mr [Big] Shot [Ts 9s]", ("Mr", "Big")),
+            ("Dealt to Villain", None),
+            ("Dealt to Hero []", None),
+        ):
+            assert _split_dealt(line) == expected, line
+
+    def test_split_uncalled(self):
+        from pokerhero.parser.hand_parser import _split_uncalled
+
+        for line, expected in (
+            ("Uncalled bet (2.50) returned to Villain", ("2.50", "Villain")),
+            ("Uncalled bet (€0.10) returned to Some One", ("0.10", "Some One")),
+            ("Uncalled bet (1500) returned to Hero", ("1500", "Hero")),
+            ("Uncalled bet (1.) returned to Hero", None),
+            ("Uncalled bet (abc) returned to Hero", None),
+            ("Uncalled bet (5) returned to ", None),
+        ):
+            assert _split_uncalled(line) == expected, line
+
+
+class TestParseLines:
+    def test_iterable_of_lines_matches_text_parse(self):
+        import io
+
+        text = (FIXTURES_DIR / "cash_hero_wins_showdown.txt").read_text()
+        parser = HandParser(hero_username=HERO)
+        from_file = parser.parse_lines(io.StringIO(text))
+        from_gen = parser.parse_lines(ln for ln in text.splitlines())
+        assert from_file == parser.parse(text)
+        assert from_gen == from_file
+
+
+class TestColonDelimitedNames:
+    def test_names_with_spaces_and_symbols_are_captured(self):
+        from pokerhero.parser.hand_parser import _RE_ACTION, _RE_POST_BLIND
+
+        m = _RE_ACTION.match("Big Fish 99 (x): calls 0.50")
+        assert m is not None and m.group(1) == "Big Fish 99 (x)"
+        m = _RE_POST_BLIND.match("a.b-c: posts small & big blinds 0.15")
+        assert m is not None and m.groups() == ("a.b-c", "0.15")
+
+
+class TestParseMany:
+    def _texts(self):
+        return [
+            (FIXTURES_DIR / name).read_text()
+            for name in (
+                "cash_hero_wins_showdown.txt",
+                "cash_standard_hero_folds_preflop.txt",
+            )
+        ]
+
+    def test_worker_pool_matches_sequential_parse(self):
+        parser = HandParser(hero_username=HERO)
+        texts = self._texts() * 3
+        assert parser.parse_many(texts, workers=2) == [parser.parse(t) for t in texts]
+
+    def test_single_worker_parses_in_process(self):
+        parser = HandParser(hero_username=HERO)
+        texts = self._texts()
+        assert parser.parse_many(texts, workers=1) == [parser.parse(t) for t in texts]
+        assert parser.parse_many([]) == []
+
+
+class TestParseStream:
+    def test_streams_hands_from_a_file_object(self):
+        import io
+
+        parser = HandParser(hero_username=HERO)
+        texts = [
+            (FIXTURES_DIR / name).read_text(encoding="utf-8-sig").strip()
+            for name in (
+                "cash_hero_wins_showdown.txt",
+                "cash_standard_hero_folds_preflop.txt",
+            )
+        ]
+        stream = io.StringIO("preamble\n\n" + "\n\n\n".join(texts) + "\n")
+        assert list(parser.parse_stream(stream)) == [parser.parse(t) for t in texts]
+
+    def test_no_hands_yields_nothing(self):
+        parser = HandParser(hero_username=HERO)
+        assert list(parser.parse_stream(["", "not a hand"])) == []
+
+
+class TestSplitActionAmounts:
+    def test_matches_action_regex_captures(self):
+        from pokerhero.parser.hand_parser import _RE_ACTION, _split_action_amounts
+
+        for line in (
+            "Hero: folds",
+            "Hero: checks",
+            "Hero: calls 0.50",
+            "Hero: bets €1.25",
+            "Hero: raises $2 to $6",
+            "Hero: raises 40 to 1500 and is all-in",
+            "Hero: calls 3.10 and is all-in",
+            "Hero: folds [4c 5d]",
+        ):
+            m = _RE_ACTION.match(line)
+            assert m is not None
+            verb = m.group(2)
+            tail = line[len("Hero: ") + len(verb) + 1 :]
+            assert _split_action_amounts(tail) == m.group(3, 4), line
+
+
+class TestActionDataFieldOrder:
+    def test_field_order_matches_positional_construction(self):
+        """_build_actions builds ActionData positionally; reordering breaks it."""
+        import dataclasses
+
+        assert [f.name for f in dataclasses.fields(ActionData)] == [
+            "sequence",
+            "player",
+            "is_hero",
+            "street",
+            "action_type",
+            "amount",
+            "amount_to_call",
+            "pot_before",
+            "is_all_in",
+            "spr",
+            "mdf",
+        ]
+
+
+class TestInternedUsernames:
+    def test_records_share_one_string_per_player(self):
+        parser = HandParser(hero_username=HERO)
+        text = (FIXTURES_DIR / "cash_hero_wins_showdown.txt").read_text()
+        first, second = parser.parse(text), parser.parse(text)
+        names = {p.username: p.username for p in first.players}
+        for p in second.players:
+            assert p.username is names[p.username]
+        for a in first.actions + second.actions:
+            assert a.player is names[a.player]
+
+
+class TestSplitPost:
+    def test_matches_post_regex_captures(self):
+        from pokerhero.parser.hand_parser import (
+            _RE_POST_ANTE,
+            _RE_POST_BLIND,
+            _split_post,
+        )
+
+        for rest in (
+            "small blind 0.02",
+            "big blind €0.05",
+            "small & big blinds $0.07",
+            "the ante 10",
+            "big blind 100 and is all-in",
+        ):
+            line = "Hero: posts " + rest
+            blind = _RE_POST_BLIND.match(line)
+            ante = _RE_POST_ANTE.match(line)
+            expected = (
+                ("blind", blind.group(2))
+                if blind
+                else ("ante", ante.group(2))
+                if ante
+                else None
+            )
+            assert _split_post(rest) == expected, line
+
+    def test_unrecognised_layout_returns_none(self):
+        from pokerhero.parser.hand_parser import _split_post
+
+        assert _split_post("straddle 0.10") is None
+        assert _split_post("big blind abc") is None
+
+    def test_bracketed_cards(self):
+        from pokerhero.parser.hand_parser import _split_bracketed
+
+        assert _split_bracketed("[Ah Kd] (a pair of Aces)") == "Ah Kd"
+        assert _split_bracketed("Ah Kd") is None
+        assert _split_bracketed("[Ah Kd") is None
+
+
+class TestModelSlots:
+    def test_parsed_records_have_no_instance_dict(self, cash_wins_showdown):
+        for obj in (
+            cash_wins_showdown,
+            cash_wins_showdown.session,
+            cash_wins_showdown.hand,
+            cash_wins_showdown.players[0],
+            cash_wins_showdown.actions[0],
+        ):
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    def test_session_and_hand_are_frozen_and_hashable(self, cash_wins_showdown):
+        import dataclasses
+
+        for obj in (cash_wins_showdown.session, cash_wins_showdown.hand):
+            # Python 3.11's frozen+slots __setattr__ raises TypeError from its
+            # zero-argument super() call instead (fixed in 3.12).
+            with pytest.raises((dataclasses.FrozenInstanceError, TypeError)):
+                obj.rake = Decimal("1")
+            assert hash(obj) == hash(dataclasses.replace(obj))
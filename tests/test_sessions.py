@@ -1,5 +1,7 @@
 """Tests for the sessions page components."""
 
+import shutil
+
 import pytest
 
 
@@ -356,6 +358,27 @@ class TestUpdateStateBreadcrumb:
         result = str(_breadcrumb("hands", session_label="100/200", session_id=5))
         assert '"report"' in result or "'report'" in result
 
+    def test_parse_report_breadcrumb_prop_id(self):
+        """A report-level breadcrumb prop_id yields the report state."""
+        from pokerhero.frontend.pages.sessions import _parse_breadcrumb_prop_id
+
+        prop_id = '{"level":"report","session_id":5,"type":"breadcrumb-btn"}.n_clicks'
+        assert _parse_breadcrumb_prop_id(prop_id) == {
+            "level": "report",
+            "session_id": 5,
+        }
+
+    def test_parse_sessions_breadcrumb_prop_id(self):
+        from pokerhero.frontend.pages.sessions import _parse_breadcrumb_prop_id
+
+        prop_id = '{"level":"sessions","session_id":0,"type":"breadcrumb-btn"}.n_clicks'
+        assert _parse_breadcrumb_prop_id(prop_id) == {"level": "sessions"}
+
+    def test_parse_non_breadcrumb_prop_id_returns_none(self):
+        from pokerhero.frontend.pages.sessions import _parse_breadcrumb_prop_id
+
+        assert _parse_breadcrumb_prop_id("drill-down-state.data") is None
+
 
 class TestSessionFilters:
     """Tests for the _filter_sessions_data pure helper."""
@@ -468,6 +491,18 @@ class TestSessionFilters:
         )
         assert len(result) == 3
 
+    def test_apply_session_filters_reads_store_records(self):
+        """The filter callback works on store records and ignores extra keys."""
+        from pokerhero.frontend.pages.sessions import _apply_session_filters
+
+        records = self._make_df().to_dict("records")
+        for r in records:
+            r["game_type"] = "NLHE"
+        rows = _apply_session_filters(
+            None, None, None, None, None, 10, None, "all", records
+        )
+        assert [r["id"] for r in rows] == [1, 3]
+
 
 class TestHandFilters:
     """Tests for the _filter_hands_data pure helper."""
@@ -651,6 +686,121 @@ class TestRenderHandsFilterState:
         assert isinstance(result, tuple)
 
 
+class TestQueryCache:
+    """Tests for the db-version-keyed query caches in the sessions page."""
+
+    def setup_method(self):
+        from pokerhero.frontend.app import create_app
+
+        create_app(db_path=":memory:")
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from pokerhero.database.db import init_db, upsert_player
+
+        path = str(tmp_path / "test.db")
+        conn = init_db(path)
+        upsert_player(conn, "hero")
+        conn.execute(
+            "INSERT INTO sessions"
+            " (game_type, limit_type, max_seats,"
+            "  small_blind, big_blind, ante, start_time)"
+            " VALUES ('NLHE', 'No Limit', 6, 50, 100, 0, '2024-01-01')"
+        )
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_db_version_changes_with_file_size(self, tmp_path):
+        """The version token reflects the file's size, not just its path."""
+        from pokerhero.frontend.pages.sessions import _db_version
+
+        path = tmp_path / "x.db"
+        path.write_bytes(b"a")
+        before = _db_version(str(path))
+        path.write_bytes(b"ab")
+        assert _db_version(str(path)) != before
+
+    def test_db_version_of_missing_file_is_zeros(self, tmp_path):
+        from pokerhero.frontend.pages.sessions import _db_version
+
+        path = tmp_path / "missing.db"
+        assert _db_version(str(path)) == (0, 0, 0, 0, 0)
+        assert not path.exists()
+
+    def test_db_version_changes_on_commit_with_identical_stats(self, db_path):
+        """A commit is seen even when mtime and size do not move."""
+        import os
+        import sqlite3
+        import unittest.mock as mock
+
+        from pokerhero.frontend.pages import sessions
+
+        frozen = os.stat(db_path)
+        with mock.patch.object(sessions.os, "stat", return_value=frozen):
+            before = sessions._db_version(db_path)
+            conn = sqlite3.connect(db_path)
+            conn.execute("INSERT INTO settings (key, value) VALUES ('k', 'v')")
+            conn.commit()
+            conn.close()
+            assert sessions._db_version(db_path) != before
+
+    def test_same_version_returns_cached_frame(self, db_path):
+        from pokerhero.frontend.pages.sessions import _get_sessions_cached
+
+        first = _get_sessions_cached(db_path, (1,), 1)
+        second = _get_sessions_cached(db_path, (1,), 1)
+        assert first is second
+        assert len(first) == 1
+
+    def test_new_version_requeries(self, db_path):
+        import sqlite3
+
+        from pokerhero.frontend.pages.sessions import _get_sessions_cached
+
+        assert len(_get_sessions_cached(db_path, (1,), 1)) == 1
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO sessions"
+            " (game_type, limit_type, max_seats,"
+            "  small_blind, big_blind, ante, start_time)"
+            " VALUES ('NLHE', 'No Limit', 6, 50, 100, 0, '2024-01-02')"
+        )
+        conn.commit()
+        conn.close()
+        assert len(_get_sessions_cached(db_path, (1,), 1)) == 1
+        assert len(_get_sessions_cached(db_path, (2,), 1)) == 2
+
+    def test_hero_player_id_follows_setting_per_version(self, db_path):
+        """The hero id is cached per version and re-resolved on a new one."""
+        from pokerhero.database.db import get_connection, set_setting
+        from pokerhero.frontend.pages.sessions import _get_hero_player_id_cached
+
+        assert _get_hero_player_id_cached(db_path, (1,)) is None
+        conn = get_connection(db_path)
+        set_setting(conn, "hero_username", "hero")
+        conn.commit()
+        conn.close()
+        assert _get_hero_player_id_cached(db_path, (1,)) is None
+        assert _get_hero_player_id_cached(db_path, (2,)) == 1
+
+    def test_cached_hero_lookup_does_not_write(self, db_path):
+        """A hero without a player row gives None and no row is inserted."""
+        from pokerhero.database.db import get_connection, set_setting
+        from pokerhero.frontend.pages.sessions import _get_hero_player_id_cached
+
+        conn = get_connection(db_path)
+        set_setting(conn, "hero_username", "newcomer")
+        conn.commit()
+        conn.close()
+        assert _get_hero_player_id_cached(db_path, (1,)) is None
+        conn = get_connection(db_path)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+
 class TestFavoriteButton:
     """Tests for the favourite button helper and filter extensions."""
 
@@ -818,6 +968,15 @@ class TestSessionDataTable:
             }
         )
 
+    def test_date_column_is_truncated_start_time(self):
+        """Date shows the first 10 chars of start_time; missing shows '—'."""
+        from pokerhero.frontend.pages.sessions import _build_session_table
+
+        df = self._make_df()
+        df["start_time"] = ["2026-01-10T21:15:00", None]
+        dates = [r["date"] for r in _build_session_table(df).data]
+        assert dates == ["2026-01-10", "—"]
+
     def test_returns_datatable(self):
         """_build_session_table returns a DataTable component."""
         from dash import dash_table
@@ -970,6 +1129,246 @@ class TestHandDataTable:
             assert isinstance(row[pnl_col_id], (int, float))
 
 
+class TestPooledConnection:
+    """Tests for the sessions page's per-callback pooled connections."""
+
+    def setup_method(self):
+        from pokerhero.frontend.app import create_app
+
+        create_app(db_path=":memory:")
+
+    def test_released_connection_is_reused(self, tmp_path):
+        from pokerhero.frontend.pages.sessions import _open_conn
+
+        path = str(tmp_path / "a.db")
+        with _open_conn(path) as first:
+            pass
+        with _open_conn(path) as second:
+            assert second is first
+
+    def test_overlapping_callbacks_get_separate_connections(self, tmp_path):
+        from pokerhero.frontend.pages.sessions import _open_conn
+
+        path = str(tmp_path / "a.db")
+        with _open_conn(path) as first, _open_conn(path) as second:
+            assert second is not first
+
+    def test_file_database_uses_wal(self, tmp_path):
+        from pokerhero.frontend.pages.sessions import _open_conn
+
+        with _open_conn(str(tmp_path / "a.db")) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_memory_database_has_schema(self):
+        from pokerhero.frontend.pages.sessions import _open_conn
+
+        with _open_conn(":memory:") as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 0
+
+    def test_hero_lookup_commits_new_player(self, tmp_path):
+        from pokerhero.database.db import get_connection, init_db, set_setting
+        from pokerhero.frontend.pages.sessions import _get_hero_player_id
+
+        path = str(tmp_path / "a.db")
+        conn = init_db(path)
+        set_setting(conn, "hero_username", "hero")
+        conn.commit()
+        conn.close()
+
+        player_id = _get_hero_player_id(path)
+        other = get_connection(path)
+        try:
+            row = other.execute(
+                "SELECT id FROM players WHERE username = 'hero'"
+            ).fetchone()
+        finally:
+            other.close()
+        assert row is not None and row[0] == player_id
+
+    def test_hero_lookup_works_while_write_lock_is_held(self, tmp_path):
+        """An ingest holding BEGIN IMMEDIATE must not block the hero lookup."""
+        import sqlite3
+
+        from pokerhero.database.db import init_db, set_setting, upsert_player
+        from pokerhero.frontend.pages.sessions import _get_hero_player_id
+
+        path = str(tmp_path / "a.db")
+        conn = init_db(path)
+        set_setting(conn, "hero_username", "hero")
+        player_id = upsert_player(conn, "hero")
+        conn.commit()
+        conn.close()
+
+        writer = sqlite3.connect(path, timeout=0)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            assert _get_hero_player_id(path) == player_id
+        finally:
+            writer.rollback()
+            writer.close()
+
+
+class TestHandFilterStore:
+    """Tests for the hand-data-store payload used by client-side filtering."""
+
+    def setup_method(self):
+        from pokerhero.frontend.app import create_app
+
+        create_app(db_path=":memory:")
+
+    def _make_df(self):
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "id": [1, 2],
+                "source_hand_id": ["H1", "H2"],
+                "hole_cards": ["As Kh", None],
+                "total_pot": [300.0, 150.0],
+                "net_result": [200.0, float("nan")],
+                "position": ["BTN", "SB"],
+                "went_to_showdown": [1, 0],
+                "saw_flop": [1, 0],
+                "is_favorite": [0, 1],
+            }
+        )
+
+    def test_entries_pair_filter_fields_with_rendered_row(self):
+        from pokerhero.frontend.pages.sessions import (
+            _build_hand_filter_store,
+            _build_hand_table,
+        )
+
+        df = self._make_df()
+        rows = _build_hand_table(df).data
+        store = _build_hand_filter_store(df, rows)
+        assert [e["row"] for e in store] == rows
+        assert store[0]["position"] == "BTN"
+        assert store[1]["is_favorite"] == 1
+
+    def test_nan_becomes_none(self):
+        """NaN is not valid JSON, so missing values must be stored as None."""
+        from pokerhero.frontend.pages.sessions import (
+            _build_hand_filter_store,
+            _build_hand_table,
+        )
+
+        df = self._make_df()
+        store = _build_hand_filter_store(df, _build_hand_table(df).data)
+        assert store[1]["net_result"] is None
+
+    def test_absent_columns_are_skipped(self):
+        """EV flag columns missing from df are simply not included."""
+        from pokerhero.frontend.pages.sessions import (
+            _build_hand_filter_store,
+            _build_hand_table,
+        )
+
+        df = self._make_df()
+        store = _build_hand_filter_store(df, _build_hand_table(df).data)
+        assert "has_bad_call" not in store[0]
+
+    def test_hand_table_data_is_filtered_client_side(self):
+        """hand-table.data is produced by the filters.applyHandFilters JS."""
+        from pathlib import Path
+
+        from dash._callback import GLOBAL_CALLBACK_LIST
+
+        import pokerhero.frontend.pages.sessions as sessions_module
+
+        functions = [
+            cb.get("clientside_function")
+            for cb in GLOBAL_CALLBACK_LIST
+            if cb["output"] == "hand-table.data"
+        ]
+        assert {"namespace": "filters", "function_name": "applyHandFilters"} in (
+            functions
+        )
+        js = (
+            Path(sessions_module.__file__).parent.parent / "assets" / "filters.js"
+        ).read_text(encoding="utf-8")
+        assert "applyHandFilters" in js
+
+    # (pnl_min, pnl_max, positions, flags, fav_filter, ev_filter)
+    _PARITY_CASES = [
+        (None, None, None, [], [], []),
+        (0, None, None, [], [], []),
+        (None, -1, None, [], [], []),
+        (-50, 50, None, [], [], []),
+        (None, None, ["BTN", "BB"], [], [], []),
+        (None, None, [], ["saw_flop"], [], []),
+        (None, None, None, ["showdown"], [], []),
+        (None, None, None, ["saw_flop", "showdown"], ["favorites"], []),
+        (None, None, None, [], [], ["bad_call"]),
+        (None, None, None, [], [], ["bad_call", "good_call"]),
+        (None, None, None, [], [], ["bad_fold"]),  # column absent → no-op
+        (0, None, ["CO", "BTN"], ["saw_flop"], [], ["good_call"]),
+    ]
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_js_filter_matches_python_filter(self):
+        """applyHandFilters and _filter_hands_data agree on the same inputs."""
+        import json
+        import subprocess
+        from pathlib import Path
+
+        import pandas as pd
+
+        import pokerhero.frontend.pages.sessions as sessions_module
+        from pokerhero.frontend.pages.sessions import (
+            _build_hand_filter_store,
+            _filter_hands_data,
+        )
+
+        df = pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4, 5, 6],
+                "net_result": [200.0, float("nan"), -50.0, 0.0, -300.0, 50.0],
+                "position": ["BTN", "SB", "BB", "CO", "BTN", "UTG"],
+                "saw_flop": [1, 0, 1, 1, 0, 1],
+                "went_to_showdown": [1, 0, 0, 1, 0, 1],
+                "is_favorite": [0, 1, 1, 0, 0, 1],
+                "has_bad_call": [0, 0, 1, 0, 0, 1],
+                "has_good_call": [1, 0, 0, 0, 0, 1],
+            }
+        )
+        store = _build_hand_filter_store(df, [{"id": i} for i in df["id"]])
+        js = (
+            Path(sessions_module.__file__).parent.parent / "assets" / "filters.js"
+        ).read_text(encoding="utf-8")
+        script = (
+            "globalThis.window = {};\n"
+            + js
+            + "\nconst {store, cases} = JSON.parse(require('fs').readFileSync(0));"
+            "\nconst f = window.dash_clientside.filters.applyHandFilters;"
+            "\nconsole.log(JSON.stringify(cases.map("
+            "(c) => f(...c, store).map((r) => r.id))));"
+        )
+        proc = subprocess.run(
+            ["node", "-e", script],
+            input=json.dumps({"store": store, "cases": self._PARITY_CASES}),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        js_ids = json.loads(proc.stdout)
+
+        for case, got in zip(self._PARITY_CASES, js_ids, strict=True):
+            pnl_min, pnl_max, positions, flags, fav, ev = case
+            expected = _filter_hands_data(
+                df,
+                pnl_min,
+                pnl_max,
+                positions,
+                "saw_flop" in flags,
+                "showdown" in flags,
+                "favorites" in fav,
+                ev,
+            )["id"].tolist()
+            assert got == expected, case
+
+
 class TestDescribeHand:
     """Tests for the _describe_hand pure helper."""
 
@@ -3523,6 +3922,90 @@ class TestCalculateSessionEvs:
             f" (understated would be {expected_ev_understated:.1f})"
         )
 
+    def test_villain_who_folded_before_allin_is_not_a_known_villain(self, db_file):
+        """Cards of a villain who folded before hero's all-in must be ignored.
+
+        Villain hole cards are loaded once per hand, so the per-action filter
+        must still drop players whose FOLD precedes the hero's action — here
+        that leaves one known villain, giving ``allin_exact`` (not multiway).
+        """
+        conn, db_path = db_file
+        from pokerhero.analysis.stats import calculate_session_evs
+
+        hero_id = conn.execute(
+            "INSERT INTO players (username, preferred_name)"
+            " VALUES ('hero_fold', 'HeroFold')"
+        ).lastrowid
+        v1_id = conn.execute(
+            "INSERT INTO players (username, preferred_name)"
+            " VALUES ('v1_fold', 'V1Fold')"
+        ).lastrowid
+        v2_id = conn.execute(
+            "INSERT INTO players (username, preferred_name)"
+            " VALUES ('v2_fold', 'V2Fold')"
+        ).lastrowid
+        sid = conn.execute(
+            "INSERT INTO sessions"
+            " (game_type, limit_type, max_seats,"
+            "  small_blind, big_blind, ante, start_time)"
+            " VALUES ('NLHE', 'No Limit', 6, 50, 100, 0, '2025-01-01')"
+        ).lastrowid
+        hid = conn.execute(
+            "INSERT INTO hands"
+            " (source_hand_id, session_id, total_pot, uncalled_bet_returned,"
+            "  rake, timestamp, board_flop, board_turn, board_river)"
+            " VALUES ('FLD1', ?, 2600, 0, 0, '2025-01-01T00:00:00',"
+            " 'As 2d 3h', NULL, NULL)",
+            (sid,),
+        ).lastrowid
+        for pid, pos, cards in (
+            (hero_id, "BTN", "Ac Kd"),
+            (v1_id, "CO", "2c 3d"),
+            (v2_id, "BB", "5h 6s"),
+        ):
+            conn.execute(
+                "INSERT INTO hand_players"
+                " (hand_id, player_id, position, starting_stack, hole_cards,"
+                "  vpip, pfr, three_bet, went_to_showdown, net_result)"
+                " VALUES (?, ?, ?, 5000, ?, 1, 0, 0, 0, 0)",
+                (hid, pid, pos, cards),
+            )
+        conn.execute(
+            "INSERT INTO actions"
+            " (hand_id, player_id, is_hero, street, action_type,"
+            "  amount, amount_to_call, pot_before, is_all_in, sequence)"
+            " VALUES (?, ?, 0, 'FLOP', 'BET', 300, 0, 300, 0, 1)",
+            (hid, v1_id),
+        )
+        # v2 folds before the hero acts, despite showing cards later
+        conn.execute(
+            "INSERT INTO actions"
+            " (hand_id, player_id, is_hero, street, action_type,"
+            "  amount, amount_to_call, pot_before, is_all_in, sequence)"
+            " VALUES (?, ?, 0, 'FLOP', 'FOLD', 0, 300, 600, 0, 2)",
+            (hid, v2_id),
+        )
+        allin_action_id = conn.execute(
+            "INSERT INTO actions"
+            " (hand_id, player_id, is_hero, street, action_type,"
+            "  amount, amount_to_call, pot_before, is_all_in, sequence)"
+            " VALUES (?, ?, 1, 'FLOP', 'RAISE', 1000, 300, 600, 1, 3)",
+            (hid, hero_id),
+        ).lastrowid
+        conn.commit()
+
+        calculate_session_evs(db_path, sid, hero_id, self._FAST_SETTINGS)
+        ev_types = {
+            r[0]
+            for r in conn.execute(
+                "SELECT ev_type FROM action_ev_cache"
+                " WHERE action_id = ? AND hero_id = ?",
+                (allin_action_id, hero_id),
+            ).fetchall()
+        }
+        assert "allin_exact" in ev_types
+        assert "allin_exact_multiway" not in ev_types
+
 
 class TestGetSessionEvStatus:
     """Tests for get_session_ev_status query function."""
@@ -1,5 +1,7 @@
 """Tests for the settings page layout."""
 
+import base64
+
 import pytest
 
 
@@ -70,6 +72,46 @@ class TestSettingsPageLayout:
         comp = layout() if callable(layout) else layout
         assert "settings-min-hands" in str(comp)
 
+    def test_numeric_setting_inputs_are_debounced(self):
+        """Numeric setting inputs only fire once the value settles."""
+        from dash import dcc
+
+        from pokerhero.frontend.pages.settings import layout
+
+        comp = layout() if callable(layout) else layout
+        numeric = [
+            c
+            for c in comp._traverse()
+            if isinstance(c, dcc.Input) and getattr(c, "type", None) == "number"
+        ]
+        assert len(numeric) == 4
+        assert all(c.debounce is True for c in numeric)
+
+
+class TestSettingsLayoutFactory:
+    def test_layout_is_callable_and_memoised(self):
+        """The page tree is built lazily once and reused across visits."""
+        from pokerhero.frontend.pages.settings import layout
+
+        assert callable(layout)
+        assert layout() is layout(tab="x")
+
+    def test_sections_use_css_class_not_inline_style(self):
+        """Repeated section/button styles come from assets/settings.css."""
+        from pathlib import Path
+
+        from pokerhero.frontend.pages.settings import layout
+
+        comp = layout()
+        classes = [getattr(c, "className", None) for c in comp._traverse()]
+        assert classes.count("settings-section") == 5
+        assert classes.count("settings-button") == 3
+        css = (
+            Path(__file__).parent.parent / "src/pokerhero/frontend/assets/settings.css"
+        ).read_text()
+        for name in ("settings-section", "settings-button", "settings-saved"):
+            assert f".{name}" in css
+
 
 class TestSettingsTargetsPage:
     """Tests for the /settings/targets sub-page."""
@@ -95,46 +137,54 @@ class TestSettingsTargetsPage:
 
     def test_layout_has_vpip_inputs_for_all_positions(self):
         """Settings targets layout has green_min inputs for all 6 VPIP positions."""
-        from pokerhero.frontend.pages.settings_targets import layout
+        from pokerhero.frontend.pages.settings_targets import _field_id, layout
 
         comp = layout() if callable(layout) else layout
         comp_str = str(comp)
         for pos in ("utg", "mp", "co", "btn", "sb", "bb"):
-            assert f"target-vpip-{pos}-green-min" in comp_str, (
+            assert str(_field_id("vpip", pos, "green-min")) in comp_str, (
                 f"Missing vpip {pos} green_min input"
             )
-            assert f"target-vpip-{pos}-green-max" in comp_str, (
+            assert str(_field_id("vpip", pos, "green-max")) in comp_str, (
                 f"Missing vpip {pos} green_max input"
             )
-            assert f"target-vpip-{pos}-yellow-min" in comp_str, (
+            assert str(_field_id("vpip", pos, "yellow-min")) in comp_str, (
                 f"Missing vpip {pos} yellow_min input"
             )
-            assert f"target-vpip-{pos}-yellow-max" in comp_str, (
+            assert str(_field_id("vpip", pos, "yellow-max")) in comp_str, (
                 f"Missing vpip {pos} yellow_max input"
             )
 
     def test_layout_has_pfr_inputs_for_all_positions(self):
         """Settings targets layout must have bound inputs for all 6 PFR positions."""
-        from pokerhero.frontend.pages.settings_targets import layout
+        from pokerhero.frontend.pages.settings_targets import _field_id, layout
 
         comp = layout() if callable(layout) else layout
         comp_str = str(comp)
         for pos in ("utg", "mp", "co", "btn", "sb", "bb"):
-            assert f"target-pfr-{pos}-green-min" in comp_str, (
+            assert str(_field_id("pfr", pos, "green-min")) in comp_str, (
                 f"Missing pfr {pos} green_min input"
             )
 
     def test_layout_has_3bet_inputs_for_all_positions(self):
         """Settings targets layout must have bound inputs for all 6 3-Bet positions."""
-        from pokerhero.frontend.pages.settings_targets import layout
+        from pokerhero.frontend.pages.settings_targets import _field_id, layout
 
         comp = layout() if callable(layout) else layout
         comp_str = str(comp)
         for pos in ("utg", "mp", "co", "btn", "sb", "bb"):
-            assert f"target-3bet-{pos}-green-min" in comp_str, (
+            assert str(_field_id("3bet", pos, "green-min")) in comp_str, (
                 f"Missing 3bet {pos} green_min input"
             )
 
+    def test_header_row_matches_body_row_width(self):
+        """The header has one cell per body cell, including the saved marker."""
+        from pokerhero.frontend.pages.settings_targets import _stat_section
+
+        table = _stat_section("vpip").children[-1]
+        widths = {len(row.children) for row in table.children}
+        assert widths == {6}
+
     def test_load_callback_returns_defaults_for_memory_db(self):
         """Load callback returns TARGET_DEFAULTS values for an in-memory DB."""
         from pokerhero.analysis.targets import TARGET_DEFAULTS
@@ -147,6 +197,104 @@ class TestSettingsTargetsPage:
         assert isinstance(result, list)
         assert any(v == defaults["green_min"] for v in result)
 
+    def test_load_callback_values_follow_output_order(self):
+        """Each loaded value lines up with its output id."""
+        from pokerhero.analysis.targets import TARGET_DEFAULTS
+        from pokerhero.frontend.pages.settings_targets import (
+            _ALL_OUTPUT_IDS,
+            _load_targets,
+        )
+
+        result = _load_targets("/settings/targets")
+        assert len(result) == len(_ALL_OUTPUT_IDS) == 72
+        for fid, value in zip(_ALL_OUTPUT_IDS, result):
+            key = fid["bound"].replace("-", "_")
+            assert value == TARGET_DEFAULTS[(fid["stat"], fid["pos"])][key]
+
+
+class TestTargetSaveCallback:
+    """A single pattern-matching callback persists changed target rows."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from pokerhero.database.db import init_db
+        from pokerhero.frontend.app import create_app
+
+        path = str(tmp_path / "targets.db")
+        init_db(path).close()
+        create_app(db_path=path)
+        return path
+
+    def _save(self, touched, overrides):
+        import unittest.mock as mock
+
+        import dash
+
+        from pokerhero.analysis.targets import POSITIONS, TARGET_DEFAULTS
+        from pokerhero.frontend.pages.settings_targets import (
+            _BOUND_KEYS,
+            _field_id,
+            _save_targets,
+            _saved_id,
+        )
+
+        ids, values = [], []
+        for stat in ("vpip", "pfr", "3bet"):
+            for pos in POSITIONS:
+                for bound in _BOUND_KEYS:
+                    ids.append({"id": _field_id(stat, pos, bound)})
+                    key = bound.replace("-", "_")
+                    values.append(
+                        overrides.get(
+                            (stat, pos, bound), TARGET_DEFAULTS[(stat, pos)][key]
+                        )
+                    )
+        fake_ctx = mock.MagicMock()
+        fake_ctx.inputs_list = [ids]
+        fake_ctx.outputs_list = [
+            {"id": _saved_id(stat, pos)}
+            for stat in ("vpip", "pfr", "3bet")
+            for pos in POSITIONS
+        ]
+        fake_ctx.triggered_prop_ids = {
+            f"{stat}-{pos}-{bound}.value": _field_id(stat, pos, bound)
+            for stat, pos, bound in touched
+        }
+        with mock.patch.object(dash, "ctx", fake_ctx):
+            return _save_targets(values)
+
+    def test_changed_rows_are_written(self, db_path):
+        import dash
+
+        from pokerhero.analysis.targets import read_target_settings
+        from pokerhero.database.db import get_connection
+
+        result = self._save(
+            [("vpip", "btn", "green-min"), ("pfr", "sb", "yellow-max")],
+            {("vpip", "btn", "green-min"): 31, ("pfr", "sb", "yellow-max"): 44},
+        )
+        assert result.count("✓") == 2
+        assert result.count(dash.no_update) == 16
+        conn = get_connection(db_path)
+        targets = read_target_settings(conn)
+        conn.close()
+        assert targets[("vpip", "btn")]["green_min"] == 31.0
+        assert targets[("pfr", "sb")]["yellow_max"] == 44.0
+
+    def test_incomplete_row_is_not_written(self, db_path):
+        from pokerhero.database.db import get_connection
+
+        result = self._save(
+            [("vpip", "btn", "green-min")], {("vpip", "btn", "green-min"): None}
+        )
+        assert "" in result and "✓" not in result
+        conn = get_connection(db_path)
+        row = conn.execute(
+            "SELECT green_min FROM target_settings WHERE stat='vpip' AND position='btn'"
+        ).fetchone()
+        conn.close()
+        assert row[0] is not None
+
 
 # ---------------------------------------------------------------------------
 # TestGetRangeSettings — get_range_settings reads 8 range priors from DB
@@ -345,61 +493,367 @@ class TestSettingsServerSideValidation:
         create_app(db_path=":memory:")
 
     def test_sample_count_below_min_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_sample_count
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_sample_count(100)  # min is 500
+        result = _save_analysis_values({"settings-sample-count": 100})[
+            "settings-sample-count"
+        ]  # min is 500
         assert "⚠" in result
 
     def test_sample_count_above_max_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_sample_count
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_sample_count(99999)  # max is 10000
+        result = _save_analysis_values({"settings-sample-count": 99999})[
+            "settings-sample-count"
+        ]  # max is 10000
         assert "⚠" in result
 
     def test_lucky_threshold_below_min_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_lucky_threshold
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_lucky_threshold(5)  # min is 10
+        result = _save_analysis_values({"settings-lucky-threshold": 5})[
+            "settings-lucky-threshold"
+        ]  # min is 10
         assert "⚠" in result
 
     def test_lucky_threshold_above_max_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_lucky_threshold
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_lucky_threshold(50)  # max is 49
+        result = _save_analysis_values({"settings-lucky-threshold": 50})[
+            "settings-lucky-threshold"
+        ]  # max is 49
         assert "⚠" in result
 
     def test_unlucky_threshold_below_min_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_unlucky_threshold
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_unlucky_threshold(50)  # min is 51
+        result = _save_analysis_values({"settings-unlucky-threshold": 50})[
+            "settings-unlucky-threshold"
+        ]  # min is 51
         assert "⚠" in result
 
     def test_unlucky_threshold_above_max_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_unlucky_threshold
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_unlucky_threshold(95)  # max is 90
+        result = _save_analysis_values({"settings-unlucky-threshold": 95})[
+            "settings-unlucky-threshold"
+        ]  # max is 90
         assert "⚠" in result
 
     def test_min_hands_below_min_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_min_hands
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_min_hands(2)  # min is 5
+        result = _save_analysis_values({"settings-min-hands": 2})[
+            "settings-min-hands"
+        ]  # min is 5
         assert "⚠" in result
 
     def test_min_hands_above_max_rejected(self):
-        from pokerhero.frontend.pages.settings import _save_min_hands
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_min_hands(500)  # max is 200
+        result = _save_analysis_values({"settings-min-hands": 500})[
+            "settings-min-hands"
+        ]  # max is 200
         assert "⚠" in result
 
     def test_valid_sample_count_accepted(self):
-        from pokerhero.frontend.pages.settings import _save_sample_count
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_sample_count(2000)
+        result = _save_analysis_values({"settings-sample-count": 2000})[
+            "settings-sample-count"
+        ]
         assert "⚠" not in result
 
     def test_valid_lucky_threshold_accepted(self):
-        from pokerhero.frontend.pages.settings import _save_lucky_threshold
+        from pokerhero.frontend.pages.settings import _save_analysis_values
 
-        result = _save_lucky_threshold(40)
+        result = _save_analysis_values({"settings-lucky-threshold": 40})[
+            "settings-lucky-threshold"
+        ]
         assert "⚠" not in result
+
+
+# ---------------------------------------------------------------------------
+# Pooled connection
+# ---------------------------------------------------------------------------
+
+
+class TestSettingsPooledConnection:
+    """Settings callbacks borrow a connection from the per-path pool."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from pokerhero.database.db import init_db
+        from pokerhero.frontend.app import create_app
+
+        path = str(tmp_path / "settings.db")
+        init_db(path).close()
+        create_app(db_path=path)
+        return path
+
+    def test_callbacks_use_the_connection_pool(self, db_path):
+        from pokerhero.database import pool
+        from pokerhero.frontend.pages.settings import _load_username
+
+        with pool.acquire(db_path) as first:
+            pass
+        _load_username("/settings")
+        with pool.acquire(db_path) as second:
+            assert second is first
+
+    def test_saved_value_is_loaded_back(self, db_path):
+        from pokerhero.frontend.pages.settings import (
+            _load_analysis_settings,
+            _save_analysis_values,
+        )
+
+        assert _save_analysis_values({"settings-min-hands": 30}) == {
+            "settings-min-hands": "✓ saved"
+        }
+        assert _load_analysis_settings("/settings")[3] == 30
+
+    def test_pooled_connection_uses_wal(self, db_path):
+        from pokerhero.database import pool
+
+        with pool.acquire(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_several_settings_saved_together(self, db_path):
+        from pokerhero.frontend.pages.settings import (
+            _load_analysis_settings,
+            _save_analysis_values,
+        )
+
+        result = _save_analysis_values(
+            {"settings-sample-count": 3000, "settings-lucky-threshold": 5}
+        )
+        assert result["settings-sample-count"] == "✓ saved"
+        assert "⚠" in result["settings-lucky-threshold"]
+        assert _load_analysis_settings("/settings")[:2] == (3000, 40)
+
+    def test_callback_only_updates_triggered_markers(self, db_path):
+        """Untouched inputs keep their saved marker (dash.no_update)."""
+        import unittest.mock as mock
+
+        import dash
+
+        from pokerhero.frontend.pages.settings import _save_analysis_settings
+
+        names = [
+            "settings-sample-count",
+            "settings-lucky-threshold",
+            "settings-unlucky-threshold",
+            "settings-min-hands",
+        ]
+        fake_ctx = mock.MagicMock()
+        fake_ctx.inputs_list = [
+            [{"id": {"type": "analysis-setting", "name": n}} for n in names]
+        ]
+        fake_ctx.triggered_prop_ids = {
+            '{"name":"settings-min-hands","type":"analysis-setting"}.value': {
+                "type": "analysis-setting",
+                "name": "settings-min-hands",
+            }
+        }
+        with mock.patch.object(dash, "ctx", fake_ctx):
+            result = _save_analysis_settings([2000, 40, 60, 25])
+        assert result[:3] == [dash.no_update] * 3
+        assert result[3] == "✓ saved"
+
+
+# ---------------------------------------------------------------------------
+# CSV export
+# ---------------------------------------------------------------------------
+
+
+class TestCsvExport:
+    """The Export CSV button returns the hero's hands as a CSV download."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from pathlib import Path
+
+        from pokerhero.database.db import init_db
+        from pokerhero.frontend.app import create_app
+        from pokerhero.ingestion.pipeline import ingest_file
+
+        path = str(tmp_path / "export.db")
+        conn = init_db(path)
+        fixture = Path(__file__).parent / "fixtures" / "play_money_two_hand_session.txt"
+        ingest_file(fixture, "jsalinas96", conn)
+        conn.close()
+        create_app(db_path=path)
+        return path
+
+    def _export(self, username):
+        """Click Export, wait for the background job, then run the poller."""
+        import unittest.mock as mock
+
+        import dash
+
+        from pokerhero.frontend.pages.settings import (
+            _EXPORT_JOBS,
+            _handle_actions,
+            _poll_export,
+        )
+
+        fake_ctx = mock.MagicMock()
+        fake_ctx.triggered_id = "export-csv-btn"
+        with mock.patch.object(dash, "ctx", fake_ctx):
+            msg, token, poll_disabled = _handle_actions(1, None, username)
+        if token is dash.no_update:
+            return None, msg
+        assert poll_disabled is False
+        _EXPORT_JOBS[token][0].result(timeout=10)
+        download, msg, poll_disabled = _poll_export(1, token)
+        assert poll_disabled is True
+        return download, msg
+
+    def test_export_returns_csv_with_one_row_per_hand(self, db_path):
+        download, _ = self._export("jsalinas96")
+        assert download["filename"] == "pokerhero_export.csv"
+        content = base64.b64decode(download["content"]).decode("utf-8")
+        lines = content.strip().splitlines()
+        assert lines[0] == (
+            "session_id,date,stakes,hand_id,position,hole_cards,net_result"
+        )
+        assert len(lines) == 3  # header + two hands
+
+    def test_export_unknown_hero_reports_no_data(self, db_path):
+        download, msg = self._export("nobody")
+        assert download is None
+        assert "No data found" in str(msg)
+
+    def test_export_tempfile_removed_after_download(self, db_path):
+        import os
+
+        from pokerhero.frontend.pages.settings import (
+            _EXPORT_JOBS,
+            _poll_export,
+            _start_export,
+        )
+
+        token = _start_export(db_path, "jsalinas96")
+        _, out_path, _ = _EXPORT_JOBS[token]
+        _EXPORT_JOBS[token][0].result(timeout=10)
+        assert os.path.exists(out_path)
+        _poll_export(1, token)
+        assert not os.path.exists(out_path)
+        assert token not in _EXPORT_JOBS
+
+    def test_poll_while_running_prevents_update(self, db_path):
+        import threading
+        import time
+
+        import dash
+
+        from pokerhero.frontend.pages import settings
+
+        release = threading.Event()
+        future = settings._EXPORT_EXECUTOR.submit(release.wait)
+        settings._EXPORT_JOBS["pending"] = (future, "unused.csv", time.monotonic())
+        try:
+            with pytest.raises(dash.exceptions.PreventUpdate):
+                settings._poll_export(1, "pending")
+        finally:
+            release.set()
+            settings._EXPORT_JOBS.pop("pending", None)
+
+    def test_poll_unknown_token_reports_error(self, db_path):
+        from pokerhero.frontend.pages.settings import _poll_export
+
+        download, msg, poll_disabled = _poll_export(1, "no-such-token")
+        assert download is None
+        assert "Export not found" in str(msg)
+        assert poll_disabled is True
+
+    def test_second_poll_after_delivery_prevents_update(self, db_path):
+        import dash
+
+        from pokerhero.frontend.pages.settings import (
+            _EXPORT_JOBS,
+            _poll_export,
+            _start_export,
+        )
+
+        token = _start_export(db_path, "jsalinas96")
+        _EXPORT_JOBS[token][0].result(timeout=10)
+        download, _, _ = _poll_export(1, token)
+        assert download is not None
+        with pytest.raises(dash.exceptions.PreventUpdate):
+            _poll_export(2, token)
+
+    def test_unpolled_job_expires_and_removes_its_file(self, db_path):
+        import os
+
+        from pokerhero.frontend.pages import settings
+
+        token = settings._start_export(db_path, "jsalinas96")
+        future, out_path, _ = settings._EXPORT_JOBS[token]
+        future.result(timeout=10)
+        settings._EXPORT_JOBS[token] = (
+            future,
+            out_path,
+            -settings._EXPORT_JOB_TTL_S - 1.0,
+        )
+        settings._start_export(db_path, "nobody")  # sweeps expired jobs
+        assert token not in settings._EXPORT_JOBS
+        assert not os.path.exists(out_path)
+        _, msg, _ = settings._poll_export(1, token)
+        assert "Export not found" in str(msg)
+
+    def test_hero_lookup_reflects_clear(self, db_path):
+        import unittest.mock as mock
+
+        import dash
+
+        from pokerhero.frontend.pages.settings import _handle_actions, _hero_exists
+
+        assert _hero_exists(db_path, "jsalinas96") is True
+        assert _hero_exists(db_path, "nobody") is False
+
+        fake_ctx = mock.MagicMock()
+        fake_ctx.triggered_id = "clear-db-btn"
+        with mock.patch.object(dash, "ctx", fake_ctx):
+            _handle_actions(None, 1, "jsalinas96")
+        assert _hero_exists(db_path, "jsalinas96") is False
+
+
+class TestSettingsSkipUnchangedWrites:
+    """Saving a value equal to the stored one must not write to the DB."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from pokerhero.database.db import init_db
+        from pokerhero.frontend.app import create_app
+
+        path = str(tmp_path / "settings.db")
+        init_db(path).close()
+        create_app(db_path=path)
+        return path
+
+    def _changes(self, db_path):
+        from pokerhero.database import pool
+
+        with pool.acquire(db_path) as conn:
+            return conn.total_changes
+
+    def test_equal_analysis_value_not_rewritten(self, db_path):
+        from pokerhero.frontend.pages.settings import _save_analysis_values
+
+        _save_analysis_values({"settings-min-hands": 30})
+        before = self._changes(db_path)
+        result = _save_analysis_values({"settings-min-hands": 30})
+        assert result == {"settings-min-hands": "✓ saved"}
+        assert self._changes(db_path) == before
+
+    def test_equal_username_not_rewritten(self, db_path):
+        from pokerhero.frontend.pages.settings import _save_username
+
+        _save_username("jsalinas96")
+        before = self._changes(db_path)
+        assert _save_username(" jsalinas96 ") == "✓ saved"
+        assert self._changes(db_path) == before
+        _save_username("other")
+        assert self._changes(db_path) == before + 1
@@ -100,3 +100,79 @@ class TestUploadHandlerMalformedInput:
 
         with pytest.raises(ValueError, match="[Ii]nvalid.*data.*URI"):
             handle_upload("", "empty.txt", "hero", db)
+
+
+class TestMultiFileUpload:
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from pokerhero.database.db import init_db
+        from pokerhero.frontend.app import create_app
+
+        path = str(tmp_path / "upload.db")
+        init_db(path).close()
+        create_app(db_path=path)
+        return path
+
+    def test_files_ingested_concurrently_into_one_status_div(self, db_path):
+        from dash import html
+
+        from pokerhero.database.db import get_connection
+        from pokerhero.frontend.pages.upload import _process_upload
+
+        rebuy = Path(__file__).parent / "fixtures" / "cash_hero_rebuy.txt"
+        result = _process_upload(
+            [_encode_file(FRATERNITAS), _encode_file(rebuy)],
+            [FRATERNITAS.name, rebuy.name],
+            "jsalinas96",
+        )
+        assert isinstance(result, html.Div)
+        assert [child.children.split(" — ")[0] for child in result.children] == [
+            f"✅ {FRATERNITAS.name}",
+            f"✅ {rebuy.name}",
+        ]
+        conn = get_connection(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 2
+        conn.close()
+
+    def test_busy_timeout_is_restored_on_the_pooled_connection(self, db_path):
+        from pokerhero.database import pool
+        from pokerhero.frontend.pages.upload import _upload_with_own_conn
+
+        with pool.acquire(db_path) as conn:
+            before = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        _upload_with_own_conn(
+            db_path, "jsalinas96", _encode_file(FRATERNITAS), FRATERNITAS.name
+        )
+        with pool.acquire(db_path) as conn:
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == before
+
+    def test_locked_database_is_reported_per_file(self, db_path, monkeypatch):
+        import sqlite3
+
+        from pokerhero.frontend.pages import upload
+
+        def _locked(*args):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(upload, "handle_upload", _locked)
+        result = upload._process_upload(
+            [_encode_file(FRATERNITAS)] * 2,
+            [FRATERNITAS.name, "second.txt"],
+            "jsalinas96",
+        )
+        assert [child.children for child in result.children] == [
+            f"❌ {FRATERNITAS.name} — unexpected error: database is locked",
+            "❌ second.txt — unexpected error: database is locked",
+        ]
+
+
+class TestDbPathMemo:
+    def test_path_is_reread_for_a_new_app(self, tmp_path):
+        from pokerhero.frontend.app import create_app
+        from pokerhero.frontend.pages.upload import _get_db_path
+
+        create_app(db_path=tmp_path / "a.db")
+        assert _get_db_path() == str(tmp_path / "a.db")
+        assert _get_db_path() == str(tmp_path / "a.db")
+        create_app(db_path=tmp_path / "b.db")
+        assert _get_db_path() == str(tmp_path / "b.db")